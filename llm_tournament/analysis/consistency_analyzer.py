@@ -8,627 +8,1933 @@ how consistent the tournament results are across runs.
 import os
 import json
 import glob
-from typing import Dict, List, Any, Optional, Tuple
-import statistics
-import math
+import hashlib
+from fnmatch import fnmatch
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import csv
 from collections import defaultdict
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 import datetime
 
+import numpy as np
+
 # For statistical analysis
 try:
-    import numpy as np
     import scipy.stats as stats
 
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# For compiling the ragged rank correlation kernel
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# For faster JSON parsing and serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# For compressing exported results
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# For streaming very large result files
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# Shared decoder for the standard library fallback, so json.loads does not
+# have to resolve its decoder arguments on every file
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON data, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON bytes
+
+    Returns:
+        Parsed JSON data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return _JSON_DECODER.decode(data.decode(json.detect_encoding(data)))
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Serialize data as indented JSON, using orjson when it is installed.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        # Matchup outcome counts are keyed by int, which orjson rejects by default
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _write_json_file(file_path: str, data: Any, compress: bool = False) -> None:
+    """
+    Write data to a JSON file, optionally zstd-compressed.
+
+    Args:
+        file_path: Path to the output file
+        data: Data to serialize
+        compress: Whether to compress the JSON with zstd
+    """
+    payload = _json_dumps(data)
+    if compress:
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+    _write_file_bytes(file_path, payload)
+
+
+# Characters that are invalid in filenames on some platforms, mapped to "_"
+# so group names can be embedded in export filenames
+_FS_SAFE = str.maketrans({c: "_" for c in ':/\\*?"<>|'})
+
+
+# Sentinel for fields missing from a tournament result
+_MISSING = object()
+
+
+def _compile_field_getter(field_path: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Compile a dotted field path into a getter for tournament data.
+
+    Args:
+        field_path: Dotted path to the field (e.g., "config.llm.default_model")
+
+    Returns:
+        Function returning the field value as a string, or "unknown" if the
+        field is missing
+    """
+    parts = tuple(field_path.split("."))
+
+    def get_field(data: Dict[str, Any]) -> str:
+        value = data
+        try:
+            for part in parts:
+                value = value[part]
+        except (KeyError, TypeError):
+            # Field is missing or the path runs through a non-dict value
+            return "unknown"
+        return str(value)
+
+    return get_field
+
+
+def _compile_metric_getter(metric_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile a dotted path into a getter for a group's analysis results.
+
+    Args:
+        metric_path: Dotted path to the value (e.g., "ranking_consistency.overall.avg_stdev")
+
+    Returns:
+        Function returning the value, or 0 if any part of the path is missing
+    """
+    parts = tuple(metric_path.split("."))
+
+    def get_metric(metrics: Dict[str, Any]) -> Any:
+        value = metrics
+        try:
+            for part in parts:
+                value = value[part]
+        except (KeyError, TypeError):
+            return 0
+        return value
+
+    return get_metric
+
+
+# Overall values reported in the summary exports
+_RANK_STABILITY = _compile_metric_getter("ranking_consistency.overall.rank_stability")
+_AVG_RANK_STDEV = _compile_metric_getter("ranking_consistency.overall.avg_stdev")
+_WIN_RATE_CV = _compile_metric_getter(
+    "win_rate_consistency.overall.avg_coefficient_of_variation"
+)
+_MATCHUP_CONSISTENCY = _compile_metric_getter(
+    "matchup_consistency.overall.avg_consistency"
+)
+_SCORE_CV = _compile_metric_getter(
+    "score_consistency.overall.avg_coefficient_of_variation"
+)
+
+
+# Result files larger than this are streamed instead of parsed whole
+_STREAM_THRESHOLD = 100 * 1024 * 1024
+
+# Fields read by the consistency metrics, keyed by their ijson prefix
+_STREAMED_RANKING_FIELDS = {
+    "rankings.item.contender_id": "contender_id",
+    "rankings.item.rank": "rank",
+}
+_STATS_FIELDS = ("wins", "matches_played", "average_score", "total_score")
+_STREAMED_STATS_FIELDS = {
+    f"rankings.item.stats.{field}": field for field in _STATS_FIELDS
+}
+_STREAMED_MATCH_FIELDS = {
+    "matches.item.contender1_id": "contender1_id",
+    "matches.item.contender2_id": "contender2_id",
+}
+_SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+
+
+def _stream_tournament_file(
+    file_path: str, group_by: Optional[str]
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Stream only the fields used for consistency analysis out of a result file.
+
+    Large results are dominated by match transcripts and assessments, none of
+    which the metrics read, so they are skipped without being materialized.
+
+    Args:
+        file_path: Path to the tournament result JSON file
+        group_by: Dotted path of the grouping field, if any
+
+    Returns:
+        Tuple of (group field value, or _MISSING if absent or not a scalar,
+        tournament data holding just the rankings and matches fields needed)
+    """
+    rankings = []
+    matches = []
+    group_value = _MISSING
+
+    with open(file_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event in _SCALAR_EVENTS:
+                if prefix in _STREAMED_RANKING_FIELDS:
+                    rankings[-1][_STREAMED_RANKING_FIELDS[prefix]] = value
+                elif prefix in _STREAMED_STATS_FIELDS:
+                    rankings[-1]["stats"][_STREAMED_STATS_FIELDS[prefix]] = value
+                elif prefix in _STREAMED_MATCH_FIELDS:
+                    matches[-1][_STREAMED_MATCH_FIELDS[prefix]] = value
+                elif prefix == "matches.item.result.winner":
+                    matches[-1]["result"]["winner"] = value
+                elif prefix == group_by:
+                    group_value = value
+            elif event == "start_map":
+                if prefix == "rankings.item":
+                    rankings.append({})
+                elif prefix == "rankings.item.stats":
+                    rankings[-1]["stats"] = {}
+                elif prefix == "matches.item":
+                    matches.append({})
+                elif prefix == "matches.item.result":
+                    matches[-1]["result"] = {}
+
+    return group_value, {"rankings": rankings, "matches": matches}
+
+
+# Windows needs O_BINARY to avoid newline translation; it is 0 elsewhere
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    """
+    Read a whole file with unbuffered OS calls.
+
+    The size is known up front, so the contents arrive in a single read
+    without going through Python's buffered IO layers. The GIL is released
+    for the duration of the read.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        File contents
+    """
+    fd = os.open(file_path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # A single read can come up short, e.g. beyond 2GB on Linux
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _write_file_bytes(file_path: str, data: bytes) -> None:
+    """
+    Write a whole file with unbuffered OS calls, replacing any existing file.
+
+    Args:
+        file_path: Path to the file
+        data: File contents
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        # A single write can come up short, so keep going until it is all out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_tournament_file(
+    file_path: str,
+    group_by: Optional[str],
+    get_group_key: Optional[Callable[[Dict[str, Any]], str]],
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Read and parse a single tournament result file.
+
+    Args:
+        file_path: Path to the tournament result JSON file
+        group_by: Dotted path of the grouping field, if any
+        get_group_key: Compiled getter for the grouping field, if any
+
+    Returns:
+        Tuple of (group key, tournament data reduced by _project_tournament)
+    """
+    if IJSON_AVAILABLE and os.path.getsize(file_path) > _STREAM_THRESHOLD:
+        group_value, tournament_data = _stream_tournament_file(file_path, group_by)
+        if not group_by:
+            return "all", tournament_data
+        if group_value is _MISSING:
+            return "unknown", tournament_data
+        return str(group_value), tournament_data
+
+    # Feed the raw bytes straight to the parser to skip the text decode layer
+    tournament_data = _json_loads(_read_file_bytes(file_path))
+
+    # Extract the group key if specified
+    group_key = get_group_key(tournament_data) if get_group_key else "all"
+
+    # Keep only what the metrics read, as streaming and the cache do
+    return group_key, _project_tournament(tournament_data)
+
+
+def _project_tournament(tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce tournament data to the rankings and matches fields the consistency
+    metrics read, in the same shape as streamed results.
+
+    Args:
+        tournament_data: Tournament data from a result file
+
+    Returns:
+        Tournament data holding just the fields needed for analysis
+    """
+    rankings = []
+    for ranking in tournament_data.get("rankings", []):
+        slim = {
+            field: ranking[field]
+            for field in ("contender_id", "rank")
+            if field in ranking
+        }
+        if "stats" in ranking:
+            stats = ranking["stats"]
+            if isinstance(stats, dict):
+                stats = {
+                    field: stats[field] for field in _STATS_FIELDS if field in stats
+                }
+            slim["stats"] = stats
+        rankings.append(slim)
+
+    matches = []
+    for match in tournament_data.get("matches", []):
+        slim = {
+            field: match[field]
+            for field in ("contender1_id", "contender2_id")
+            if field in match
+        }
+        if "result" in match:
+            result = match["result"]
+            if isinstance(result, dict):
+                result = {"winner": result["winner"]} if "winner" in result else {}
+            slim["result"] = result
+        matches.append(slim)
+
+    return {"rankings": rankings, "matches": matches}
+
+
+# Name of the directory inside the results directory holding parse caches
+_CACHE_DIRNAME = ".analysis_cache"
+
+# Bump whenever the cached projection changes shape
+_CACHE_VERSION = 2
+
+# Size of the blocks result files are hashed in
+_DIGEST_BLOCK_SIZE = 1 << 20
+
+
+def _cache_file_path(cache_dir: str, file_path: str) -> str:
+    """
+    Get the cache file for a tournament result file.
+
+    Args:
+        cache_dir: Directory holding the cache files
+        file_path: Path to the tournament result JSON file
+
+    Returns:
+        Path to the cache file
+    """
+    digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _file_digest(file_path: str) -> str:
+    """
+    Hash the contents of a file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest of the file's contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(_DIGEST_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_cache_entry(cache_file: str, file_digest: str) -> Optional[Dict]:
+    """
+    Load a cache entry if it is still valid for its result file.
+
+    Args:
+        cache_file: Path to the cache file
+        file_digest: Digest of the tournament result file's current contents
+
+    Returns:
+        Cache entry, or None if it is missing, unreadable or stale
+    """
+    try:
+        entry = _json_loads(_read_file_bytes(cache_file))
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get("version") != _CACHE_VERSION
+        or entry.get("digest") != file_digest
+    ):
+        return None
+    return entry
+
+
+def _store_cache_entry(cache_file: str, entry: Dict[str, Any]) -> None:
+    """
+    Write a cache entry, replacing any previous one atomically.
+
+    Args:
+        cache_file: Path to the cache file
+        entry: Cache entry to write
+    """
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        _write_json_file(temp_file, entry)
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write analysis cache {cache_file}: {e}")
+
+
+def _parse_file(
+    file_path: str,
+    group_by: Optional[str],
+    get_group_key: Optional[Callable[[Dict[str, Any]], str]],
+    cache_dir: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any], List[Any]]:
+    """
+    Load a tournament result file for grouping, off the calling thread.
+
+    With a cache directory, a result file whose contents are unchanged since
+    the last run is loaded from its cached projection instead of being
+    parsed again; hashing the file is much cheaper than parsing it. The cache records the group key of every grouping field
+    seen so far, so only a new grouping field forces a full parse.
+
+    Args:
+        file_path: Path to the tournament result JSON file
+        group_by: Dotted path of the grouping field, if any
+        get_group_key: Compiled getter for the grouping field, if any
+        cache_dir: Directory holding parse caches, or None to always parse
+
+    Returns:
+        Tuple of (group key, tournament data, contender IDs of its rankings)
+    """
+    entry = None
+    if cache_dir:
+        file_digest = _file_digest(file_path)
+        cache_file = _cache_file_path(cache_dir, file_path)
+        entry = _load_cache_entry(cache_file, file_digest)
+
+    if entry is not None and (not group_by or group_by in entry["groups"]):
+        group_key = entry["groups"][group_by] if group_by else "all"
+        tournament_data = entry["tournament"]
+    else:
+        group_key, tournament_data = _read_tournament_file(
+            file_path, group_by, get_group_key
+        )
+        if cache_dir:
+            groups = entry["groups"] if entry is not None else {}
+            if group_by:
+                groups[group_by] = group_key
+            _store_cache_entry(
+                cache_file,
+                {
+                    "version": _CACHE_VERSION,
+                    "digest": file_digest,
+                    "groups": groups,
+                    "tournament": tournament_data,
+                },
+            )
+
+    ranking_ids = [
+        ranking.get("contender_id") for ranking in tournament_data.get("rankings", [])
+    ]
+    return group_key, tournament_data, ranking_ids
+
+
+def _find_result_files(results_dir: str, pattern: str) -> List[str]:
+    """
+    Find the result files in a directory whose names match a glob pattern.
+
+    Matching names from a single directory scan avoids glob's per-entry
+    stat calls. Patterns that reach into subdirectories are passed to glob.
+
+    Args:
+        results_dir: Directory containing tournament result files
+        pattern: Glob pattern for tournament result files
+
+    Returns:
+        Paths of the matching files
+    """
+    if os.path.dirname(pattern):
+        return glob.glob(os.path.join(results_dir, pattern))
+
+    # Like glob, only match hidden files if the pattern asks for them
+    include_hidden = pattern.startswith(".")
+    try:
+        with os.scandir(results_dir) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if (include_hidden or not entry.name.startswith("."))
+                and fnmatch(entry.name, pattern)
+                and entry.is_file()
+            ]
+    except OSError:
+        # A missing or unreadable directory has no result files
+        return []
+
+
+# Worker threads spend most of their time blocked on reads or in the parser,
+# so run several per core
+_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Labels used when reporting on each per-ranking metric
+_METRIC_LABELS = {"rank": "rankings", "win_rate": "win rates", "score": "scores"}
+
+
+def _ranking_rank(ranking: Dict[str, Any]) -> float:
+    """
+    Get the rank from a ranking entry.
+
+    Args:
+        ranking: Ranking entry from a tournament result
+
+    Returns:
+        Rank, or NaN if missing
+    """
+    rank = ranking.get("rank")
+    return rank if rank else np.nan
+
+
+def _ranking_win_rate(ranking: Dict[str, Any]) -> float:
+    """
+    Get the win rate from a ranking entry's stats.
+
+    Args:
+        ranking: Ranking entry from a tournament result
+
+    Returns:
+        Win rate, or NaN if it cannot be extracted
+    """
+    stats = ranking.get("stats", {})
+
+    # Handle different possible structures for stats
+    if isinstance(stats, dict):
+        matches_played = stats.get("matches_played", 0)
+        wins = stats.get("wins", 0)
+        return wins / matches_played if matches_played > 0 else 0
+
+    # Try to access attributes if stats is not a dict
+    try:
+        matches_played = getattr(stats, "matches_played", 0)
+        wins = getattr(stats, "wins", 0)
+        return wins / matches_played if matches_played > 0 else 0
+    except Exception:
+        # Skip if we can't extract the stats
+        return np.nan
+
+
+def _ranking_average_score(ranking: Dict[str, Any]) -> float:
+    """
+    Get the average score from a ranking entry's stats.
+
+    Args:
+        ranking: Ranking entry from a tournament result
+
+    Returns:
+        Average score, or NaN if it cannot be extracted
+    """
+    stats = ranking.get("stats", {})
+
+    # Handle different possible structures for stats
+    score = None
+    if isinstance(stats, dict):
+        if "average_score" in stats:
+            score = stats["average_score"]
+        elif "total_score" in stats and stats.get("matches_played", 0) > 0:
+            score = stats["total_score"] / stats["matches_played"]
+    else:
+        # Try to access attributes if stats is not a dict
+        try:
+            if hasattr(stats, "average_score"):
+                score = stats.average_score
+            elif (
+                hasattr(stats, "total_score")
+                and getattr(stats, "matches_played", 0) > 0
+            ):
+                score = stats.total_score / stats.matches_played
+        except Exception:
+            pass
+
+    return np.nan if score is None else score
+
+
+_METRIC_EXTRACTORS = (
+    ("rank", _ranking_rank),
+    ("win_rate", _ranking_win_rate),
+    ("score", _ranking_average_score),
+)
+_GENERAL_EXTRACTORS = dict(_METRIC_EXTRACTORS)
+
+
+def _dict_stats_win_rate(ranking: Dict[str, Any]) -> float:
+    """
+    Get the win rate from a ranking entry whose stats are a dict.
+
+    Args:
+        ranking: Ranking entry from a tournament result
+
+    Returns:
+        Win rate
+    """
+    stats = ranking.get("stats", {})
+    matches_played = stats.get("matches_played", 0)
+    return stats.get("wins", 0) / matches_played if matches_played > 0 else 0
+
+
+def _dict_stats_average_score(ranking: Dict[str, Any]) -> float:
+    """
+    Get the average score from a ranking entry whose stats are a dict.
+
+    Args:
+        ranking: Ranking entry from a tournament result
+
+    Returns:
+        Average score, or NaN if it is not recorded
+    """
+    stats = ranking.get("stats", {})
+    if "average_score" in stats:
+        score = stats["average_score"]
+    elif "total_score" in stats and stats.get("matches_played", 0) > 0:
+        score = stats["total_score"] / stats["matches_played"]
+    else:
+        return np.nan
+    return np.nan if score is None else score
+
+
+# Extractors specialized for the usual JSON layout, where stats are dicts
+_DICT_STATS_EXTRACTORS = (
+    ("rank", _ranking_rank),
+    ("win_rate", _dict_stats_win_rate),
+    ("score", _dict_stats_average_score),
+)
+
+
+def _select_extractors(rankings: List[Any]) -> Tuple[Tuple[str, Callable], ...]:
+    """
+    Choose the metric extractors for a tournament from its first ranking entry.
+
+    Args:
+        rankings: Ranking entries of a tournament result
+
+    Returns:
+        Tuple of (metric name, extractor) pairs
+    """
+    try:
+        first_stats = rankings[0].get("stats", {})
+    except Exception:
+        return _METRIC_EXTRACTORS
+    if isinstance(first_stats, dict):
+        return _DICT_STATS_EXTRACTORS
+    return _METRIC_EXTRACTORS
+
+
+def _ranks_from_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Rank contenders by score, highest first, with tied scores sharing the
+    average of their ranks.
+
+    Contender counts are small, so all pairs are compared at once instead
+    of sorting. Matches scipy.stats.rankdata(-scores, method="average").
+
+    Args:
+        scores: 1-D array of scores
+
+    Returns:
+        Array of ranks aligned with the scores
+    """
+    higher = (scores[None, :] > scores[:, None]).sum(axis=1)
+    tied = (scores[None, :] == scores[:, None]).sum(axis=1)
+    return 1.0 + higher + (tied - 1) / 2
+
+
+def _row_moments_kernel(matrix: "np.ndarray") -> "np.ndarray":
+    """
+    Calculate the mean, sample standard deviation, min and max of each row in
+    one pass over its values, ignoring NaN.
+
+    Args:
+        matrix: Array of shape (rows, columns) with at least 2 values per row
+
+    Returns:
+        Array of shape (rows, 4) holding mean, std_dev, min and max
+    """
+    num_rows, num_columns = matrix.shape
+    moments = np.empty((num_rows, 4))
+    for r in prange(num_rows):
+        total = 0.0
+        count = 0
+        low = np.inf
+        high = -np.inf
+        for c in range(num_columns):
+            x = matrix[r, c]
+            if not np.isnan(x):
+                total += x
+                count += 1
+                low = min(low, x)
+                high = max(high, x)
+        mean = total / count
+
+        # Second pass over the (cache-resident) row keeps the variance exact
+        squares = 0.0
+        for c in range(num_columns):
+            x = matrix[r, c]
+            if not np.isnan(x):
+                squares += (x - mean) * (x - mean)
+
+        moments[r, 0] = mean
+        moments[r, 1] = np.sqrt(squares / (count - 1))
+        moments[r, 2] = low
+        moments[r, 3] = high
+    return moments
+
+
+if NUMBA_AVAILABLE:
+    _row_moments_kernel = njit(parallel=True, cache=True)(_row_moments_kernel)
+
+
+def _row_statistics(matrix: np.ndarray, present: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate summary statistics for the rows of a values matrix that hold at
+    least 2 values, ignoring NaN.
+
+    Args:
+        matrix: Array of shape (contenders, tournaments)
+        present: Boolean mask of the non-NaN entries of the matrix
+
+    Returns:
+        Dictionary with the "rows" indices of the rows with at least 2 values
+        and their count, mean, median, std_dev, min, max and range arrays
+    """
+    count = np.count_nonzero(present, axis=1)
+    # Need at least 2 tournaments for statistics
+    rows = np.flatnonzero(count >= 2)
+    kept = matrix[rows]
+
+    if NUMBA_AVAILABLE:
+        # Fused compiled pass instead of one NumPy reduction per statistic
+        moments = _row_moments_kernel(kept)
+        row_mean, row_std, row_min, row_max = moments.T
+    else:
+        row_mean = np.nanmean(kept, axis=1)
+        row_std = np.nanstd(kept, axis=1, ddof=1)
+        row_min = np.nanmin(kept, axis=1)
+        row_max = np.nanmax(kept, axis=1)
+
+    return {
+        "rows": rows,
+        "count": count[rows],
+        "mean": row_mean,
+        "median": np.nanmedian(kept, axis=1),
+        "std_dev": row_std,
+        "min": row_min,
+        "max": row_max,
+        "range": row_max - row_min,
+    }
+
+
+def _spearman(values1: "np.ndarray", values2: "np.ndarray") -> float:
+    """
+    Calculate Spearman's rank correlation without the p-value overhead of
+    scipy.stats.spearmanr.
+
+    Args:
+        values1: First sample
+        values2: Second sample, aligned with the first
+
+    Returns:
+        Correlation coefficient (NaN if either sample is constant)
+    """
+    ranks1 = stats.rankdata(values1, method="average")
+    ranks2 = stats.rankdata(values2, method="average")
+    return np.corrcoef(ranks1, ranks2)[0, 1]
+
+
+def _standardize_columns(matrix: "np.ndarray") -> "np.ndarray":
+    """
+    Center each column and scale it to unit (population) variance.
+
+    Args:
+        matrix: Array of shape (observations, variables) without missing values
+
+    Returns:
+        Standardized array (NaN for constant columns)
+    """
+    centered = matrix - matrix.mean(axis=0)
+    return centered / np.sqrt((centered * centered).mean(axis=0))
+
+
+def _column_correlations(
+    matrix: "np.ndarray", other: Optional["np.ndarray"] = None
+) -> "np.ndarray":
+    """
+    Calculate the Pearson correlation between pairs of columns.
+
+    The columns are standardized once so that all correlations come out of a
+    single matrix product.
+
+    Args:
+        matrix: Array of shape (observations, variables) without missing values
+        other: Optional second array with the same observations; if given,
+            its columns are correlated against those of matrix
+
+    Returns:
+        Array of shape (variables, other variables) of correlations (NaN for
+        constant columns)
+    """
+    standardized = _standardize_columns(matrix)
+    other_standardized = standardized if other is None else _standardize_columns(other)
+    corr = (standardized.T @ other_standardized) / matrix.shape[0]
+    # Rounding can push perfectly correlated columns just past +/-1
+    return np.clip(corr, -1, 1, out=corr)
+
+
+def _average_ranks(values: "np.ndarray") -> "np.ndarray":
+    """
+    Rank values from 1, giving tied values the average of their ranks.
+
+    Matches scipy.stats.rankdata(method="average").
+
+    Args:
+        values: 1-D array of values
+
+    Returns:
+        Array of ranks aligned with the values
+    """
+    n = values.shape[0]
+    order = np.argsort(values, kind="mergesort")
+    ranks = np.empty(n)
+    start = 0
+    while start < n:
+        end = start
+        while end + 1 < n and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        average = (start + end) / 2 + 1
+        for k in range(start, end + 1):
+            ranks[order[k]] = average
+        start = end + 1
+    return ranks
+
+
+def _ragged_spearman_kernel(
+    rank_matrix: "np.ndarray", present: "np.ndarray", pairs: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Calculate Spearman correlations over the shared contenders of column pairs.
+
+    Args:
+        rank_matrix: Array of shape (contenders, tournaments) holding ranks
+        present: Boolean mask of the ranked entries of the matrix
+        pairs: Array of shape (pairs, 2) of tournament column indices
+
+    Returns:
+        Correlation for each pair (NaN if either side is constant)
+    """
+    correlations = np.empty(pairs.shape[0])
+    for p in prange(pairs.shape[0]):
+        i = pairs[p, 0]
+        j = pairs[p, 1]
+        common = present[:, i] & present[:, j]
+        x = _average_ranks(rank_matrix[:, i][common])
+        y = _average_ranks(rank_matrix[:, j][common])
+        dx = x - x.mean()
+        dy = y - y.mean()
+        denominator = np.sqrt((dx * dx).sum() * (dy * dy).sum())
+        if denominator > 0:
+            correlations[p] = min(1.0, max(-1.0, (dx * dy).sum() / denominator))
+        else:
+            correlations[p] = np.nan
+    return correlations
+
+
+if NUMBA_AVAILABLE:
+    _average_ranks = njit(cache=True)(_average_ranks)
+    _ragged_spearman_kernel = njit(parallel=True, cache=True)(_ragged_spearman_kernel)
+
+
+def _pair_correlations(
+    rank_matrix: "np.ndarray", present: "np.ndarray", pairs: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Calculate Spearman correlations for the given tournament pairs, re-ranking
+    each pair on its shared contenders.
+
+    Args:
+        rank_matrix: Array of shape (contenders, tournaments) holding ranks
+        present: Boolean mask of the ranked entries of the matrix
+        pairs: Array of shape (pairs, 2) of tournament column indices
+
+    Returns:
+        Correlation for each pair (NaN if either side is constant)
+    """
+    if NUMBA_AVAILABLE:
+        # Compiled kernel re-ranks the pairs in parallel
+        return _ragged_spearman_kernel(rank_matrix, present, pairs)
+
+    # Tournament-major copies make each pair's mask intersection and rank
+    # gathers run over contiguous rows instead of strided columns
+    tournament_ranks = np.ascontiguousarray(rank_matrix.T)
+    tournament_present = np.ascontiguousarray(present.T)
+
+    correlations = np.empty(len(pairs))
+    for p, (i, j) in enumerate(pairs):
+        common = tournament_present[i] & tournament_present[j]
+        correlations[p] = _spearman(
+            tournament_ranks[i, common], tournament_ranks[j, common]
+        )
+    return correlations
+
+
+def _pairwise_rank_correlations(
+    rank_matrix: "np.ndarray", present: "np.ndarray", approx_pairs: int = 0
+) -> Tuple["np.ndarray", int]:
+    """
+    Calculate Spearman correlations between every pair of tournaments.
+
+    Args:
+        rank_matrix: Array of shape (contenders, tournaments) holding ranks,
+            with NaN where a contender did not take part in a tournament
+        present: Boolean mask of the ranked entries of the matrix
+        approx_pairs: If positive and smaller than the number of eligible
+            pairs, only a fixed-seed random sample of this many pairs is used
+
+    Returns:
+        Tuple of (array of the valid correlations for tournament pairs that
+        share at least 3 contenders, number of pairs sampled or 0 if every
+        pair was used)
+    """
+    # Contenders that never appear in the group play no part in any pair
+    active = present.any(axis=1)
+    rank_matrix = rank_matrix[active]
+    present = present[active]
+
+    # Need at least 3 shared contenders in some pair for a correlation
+    if rank_matrix.shape[0] <= 2 or rank_matrix.shape[1] < 2:
+        return np.empty(0), 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if approx_pairs > 0:
+            counts = present.astype(np.int32)
+            pairs = np.argwhere(np.triu(counts.T @ counts, k=1) > 2)
+            if approx_pairs < len(pairs):
+                # Mean correlation over a uniform sample of pairs converges
+                # at O(1/sqrt(k)), so large groups need not compute every pair
+                rng = np.random.default_rng(0)
+                sample = np.sort(rng.choice(len(pairs), approx_pairs, replace=False))
+                correlations = _pair_correlations(rank_matrix, present, pairs[sample])
+                return correlations[~np.isnan(correlations)], approx_pairs
+
+        if present.all():
+            # Common case: every contender ranked in every tournament, so the
+            # columns can be ranked once and one matrix product covers all pairs
+            ranked = stats.rankdata(rank_matrix, method="average", axis=0)
+            corr = _column_correlations(ranked)
+            correlations = corr[np.triu_indices_from(corr, k=1)]
+        else:
+            # Different contender sets: count the shared contenders of every
+            # pair in one matrix product and only report the pairs that share
+            # at least 3 contenders
+            counts = present.astype(np.int32)
+            overlap = np.triu(counts.T @ counts, k=1)
+            pairs = np.argwhere(overlap > 2)
+
+            num_tournaments = rank_matrix.shape[1]
+            corr = np.full((num_tournaments, num_tournaments), np.nan)
+
+            # Tournaments entered by the same contender set form a block. Any
+            # two blocks share one contender set, so each block pair is
+            # re-ranked once and all of its tournament pairs come out of one
+            # matrix product.
+            patterns, block_of = np.unique(present, axis=1, return_inverse=True)
+            block_of = block_of.ravel()
+            blocks = [np.flatnonzero(block_of == b) for b in range(patterns.shape[1])]
+            block_counts = patterns.astype(np.int32)
+            block_overlap = np.triu(block_counts.T @ block_counts)
+
+            # Pairs of single tournaments gain nothing from a matrix product
+            pending = []
+            for a, b in np.argwhere(block_overlap > 2):
+                columns_a = blocks[a]
+                columns_b = blocks[b]
+                if a == b and columns_a.size < 2:
+                    continue
+                if columns_a.size == 1 and columns_b.size == 1:
+                    pending.append((columns_a[0], columns_b[0]))
+                    continue
+
+                common = patterns[:, a] & patterns[:, b]
+                ranked_a = stats.rankdata(
+                    rank_matrix[np.ix_(common, columns_a)], method="average", axis=0
+                )
+                if a == b:
+                    corr[np.ix_(columns_a, columns_a)] = _column_correlations(ranked_a)
+                    continue
+                ranked_b = stats.rankdata(
+                    rank_matrix[np.ix_(common, columns_b)], method="average", axis=0
+                )
+                block_corr = _column_correlations(ranked_a, ranked_b)
+                corr[np.ix_(columns_a, columns_b)] = block_corr
+                corr[np.ix_(columns_b, columns_a)] = block_corr.T
+
+            # Remaining pairs are re-ranked on their shared contenders
+            pending = np.array(pending, dtype=np.intp).reshape(-1, 2)
+            pending_correlations = _pair_correlations(rank_matrix, present, pending)
+            corr[pending[:, 0], pending[:, 1]] = pending_correlations
+            corr[pending[:, 1], pending[:, 0]] = pending_correlations
+
+            correlations = corr[pairs[:, 0], pairs[:, 1]]
+
+    return correlations[~np.isnan(correlations)], 0
+
+
+class ConsistencyAnalyzer:
+    """
+    Analyzes tournament results across multiple runs to determine consistency.
+    """
+
+    def __init__(self, results_dir: str = "./results"):
+        """
+        Initialize the consistency analyzer.
+
+        Args:
+            results_dir: Directory containing tournament result JSON files
+        """
+        self.results_dir = results_dir
+        self.tournaments = []
+        self.contenders = set()
+        self.metrics = {}
+
+        # Columnar per-tournament data, aligned to a shared contender index
+        self._contender_index = {}
+        self._column_cache = {}
+
+        # Contender x tournament tables of every loaded tournament, and the
+        # table column of each loaded tournament
+        self._tables = {}
+        self._table_columns = {}
+
+    def load_tournaments(
+        self,
+        pattern: str = "tournament_*.json",
+        group_by: Optional[str] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Load all tournament result files matching the pattern.
+
+        Tournaments hold only the rankings and matches fields used by the
+        consistency metrics, whether they are parsed, streamed or served from
+        the parse cache.
+
+        Args:
+            pattern: Glob pattern for tournament result files
+            group_by: Optional field to group tournaments by (e.g., "config.llm.default_model")
+            use_cache: Whether to reuse parses of unchanged files from earlier
+                runs, kept in a .analysis_cache directory inside results_dir
+
+        Returns:
+            Dictionary of tournament results grouped by the specified field, or a single group if not specified
+        """
+        file_paths = _find_result_files(self.results_dir, pattern)
+
+        if not file_paths:
+            print(
+                f"No tournament result files found matching pattern '{pattern}' in {self.results_dir}"
+            )
+            return {}
+
+        print(f"Found {len(file_paths)} tournament result files")
+
+        grouped_tournaments = defaultdict(list)
+        get_group_key = _compile_field_getter(group_by) if group_by else None
+
+        cache_dir = None
+        if use_cache:
+            cache_dir = os.path.join(self.results_dir, _CACHE_DIRNAME)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Warning: Could not create analysis cache {cache_dir}: {e}")
+                cache_dir = None
+
+        # Reading and parsing is I/O bound, so overlap it across threads. The
+        # results are merged here on the calling thread, which keeps
+        # grouped_tournaments and self.contenders free of concurrent updates.
+        with ThreadPoolExecutor(
+            max_workers=min(_LOAD_WORKERS, len(file_paths))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _parse_file, file_path, group_by, get_group_key, cache_dir
+                )
+                for file_path in file_paths
+            ]
+
+        add_contenders = self.contenders.update
+        for file_path, future in zip(file_paths, futures):
+            try:
+                group_key, tournament_data, ranking_ids = future.result()
+
+                # Add to the appropriate group
+                grouped_tournaments[group_key].append(tournament_data)
+
+                # Track all contenders across tournaments
+                add_contenders(ranking_ids)
+
+            except Exception as e:
+                print(f"Error loading tournament result from {file_path}: {e}")
+
+        self.tournaments = list(grouped_tournaments.values())
+
+        # Convert the tournaments to contender x tournament tables up front so
+        # the metric calculations never re-scan the ranking and match
+        # dictionaries
+        self._build_tables()
+
+        print(
+            f"Loaded {sum(len(group) for group in grouped_tournaments.values())} tournaments in {len(grouped_tournaments)} groups"
+        )
+
+        return dict(grouped_tournaments)
+
+    def _build_tables(self) -> None:
+        """
+        Build contender x tournament tables of every metric for all loaded
+        tournaments, so each group's matrices are column slices of them.
+        """
+        loaded = [tournament for group in self.tournaments for tournament in group]
+        extracted = [self._extract_tournament(tournament) for tournament in loaded]
+
+        self._tables = {}
+        for metric, _ in _METRIC_EXTRACTORS:
+            table = np.full((len(self._contender_index), len(loaded)), np.nan)
+            for column, tournament_columns in enumerate(extracted):
+                table[tournament_columns["rows"], column] = tournament_columns[metric]
+            self._tables[metric] = table
+
+        self._table_columns = {
+            id(tournament): (tournament, column)
+            for column, tournament in enumerate(loaded)
+        }
+
+    def _extract_tournament(self, tournament: Dict) -> Dict[str, Any]:
+        """
+        Extract everything the consistency metrics need from a tournament.
+
+        The rankings and matches are each scanned exactly once; every metric
+        is then computed from the extracted columns.
+
+        Args:
+            tournament: Tournament result
+
+        Returns:
+            Dictionary with a "rows" array of contender indices, aligned
+            "rank", "win_rate" and "score" arrays (NaN where unavailable), and
+            the packed "matchup_keys" with their "matchup_outcomes"
+        """
+        cached = self._column_cache.get(id(tournament))
+        if cached is not None and cached[0] is tournament:
+            return cached[1]
+
+        rows = []
+        values = {metric: [] for metric, _ in _METRIC_EXTRACTORS}
+        errors = {}
+        try:
+            rankings = tournament.get("rankings", [])
+
+            # Decide once per tournament how its stats are stored, and bind
+            # everything the loop calls per ranking up front
+            extractors = [
+                (metric, extract, _GENERAL_EXTRACTORS[metric], values[metric].append)
+                for metric, extract in _select_extractors(rankings)
+            ]
+            contender_index = self._contender_index
+            intern = contender_index.setdefault
+            add_row = rows.append
+
+            for ranking in rankings:
+                contender_id = ranking.get("contender_id")
+                if not contender_id:
+                    continue
+
+                add_row(intern(contender_id, len(contender_index)))
+                for metric, extract, extract_general, add_value in extractors:
+                    try:
+                        add_value(float(extract(ranking)))
+                    except Exception:
+                        # Entries that do not fit the specialized extractor,
+                        # or are invalid, go through the general one
+                        try:
+                            add_value(float(extract_general(ranking)))
+                        except Exception as e:
+                            errors.setdefault(metric, e)
+                            add_value(np.nan)
+        except Exception as e:
+            print(f"Error extracting rankings from tournament: {e}")
+            rows = []
+            values = {metric: [] for metric in values}
+
+        columns = {"rows": np.array(rows, dtype=np.intp)}
+        for metric, metric_values in values.items():
+            columns[metric] = np.array(metric_values, dtype=float)
+
+        # A metric that failed for any entry is unusable for the whole tournament
+        for metric, e in errors.items():
+            print(f"Error extracting {_METRIC_LABELS[metric]} from tournament: {e}")
+            columns[metric][:] = np.nan
+
+        # Tournaments that report scores but no ranks are ranked by score
+        ranks, scores = columns["rank"], columns["score"]
+        if np.isnan(ranks).all():
+            scored = ~np.isnan(scores)
+            if scored.any():
+                ranks[scored] = _ranks_from_scores(scores[scored])
+
+        try:
+            keys, outcomes = self._extract_matchups(tournament)
+        except Exception as e:
+            print(f"Error extracting matches from tournament: {e}")
+            keys, outcomes = [], bytearray()
+        columns["matchup_keys"] = keys
+        columns["matchup_outcomes"] = outcomes
+
+        self._column_cache[id(tournament)] = (tournament, columns)
+        return columns
+
+    def _extract_matchups(self, tournament: Dict) -> Tuple[List[int], bytearray]:
+        """
+        Extract the outcome of every decided match in a tournament.
+
+        Contender IDs are interned to small ints so each matchup is keyed by a
+        single packed int rather than a tuple of strings. Outcomes are packed
+        one byte each, offset by one (0 = second contender won, 1 = tie,
+        2 = first contender won).
+
+        Args:
+            tournament: Tournament result
+
+        Returns:
+            Tuple of (packed matchup keys, aligned outcome bytes)
+        """
+        contender_index = self._contender_index
+        intern = contender_index.setdefault
+        keys = []
+        outcomes = bytearray()
+        add_key = keys.append
+        add_outcome = outcomes.append
+
+        for match in tournament.get("matches", []):
+            contender1_id = match.get("contender1_id")
+            contender2_id = match.get("contender2_id")
+
+            # Skip if we don't have both contenders
+            if not contender1_id or not contender2_id:
+                continue
+
+            # Get the result - handle None case
+            result = match.get("result")
+            if result is None:
+                # Skip matches with no results
+                continue
+
+            # Check if winner exists and handle both dictionary and direct access
+            if isinstance(result, dict):
+                winner = result.get("winner")
+            else:
+                # Try attribute access for non-dict objects (like Pydantic models)
+                try:
+                    winner = getattr(result, "winner", None)
+                except Exception:
+                    # Skip if we can't get the winner
+                    continue
+
+            # Orient the matchup alphabetically so both directions share a key
+            if contender2_id < contender1_id:
+                contender1_id, contender2_id = contender2_id, contender1_id
+
+            # Record the outcome offset by one (2 if the first contender won,
+            # 0 if the second contender won, 1 for a tie)
+            if winner == contender1_id:
+                outcome = 2
+            elif winner == contender2_id:
+                outcome = 0
+            else:
+                outcome = 1
+
+            first = intern(contender1_id, len(contender_index))
+            second = intern(contender2_id, len(contender_index))
+            add_key((first << 32) | second)
+            add_outcome(outcome)
+
+        return keys, outcomes
+
+    def _ingest(self, tournament_group: List[Dict]) -> Dict[str, Any]:
+        """
+        Gather the inputs of every consistency metric for a tournament group.
+
+        Each tournament is traversed once; the resulting matrices and matchup
+        outcomes are shared by all four metric reductions.
+
+        Args:
+            tournament_group: List of tournament results
+
+        Returns:
+            Dictionary with a (matrix, present mask) pair for each of "rank",
+            "win_rate" and "score" and the "matchups" outcome table
+        """
+        ingested = {
+            metric: self._metric_matrix(tournament_group, metric)
+            for metric, _ in _METRIC_EXTRACTORS
+        }
+
+        extracted = [self._extract_tournament(t) for t in tournament_group]
+        ingested["matchups"] = self._group_matchups(extracted)
+
+        return ingested
 
+    def _group_matchups(self, extracted: List[Dict[str, Any]]) -> Dict[int, bytearray]:
+        """
+        Collect the outcomes of each matchup across a group's tournaments.
 
-class ConsistencyAnalyzer:
-    """
-    Analyzes tournament results across multiple runs to determine consistency.
-    """
+        Args:
+            extracted: Extracted columns of each tournament in the group
 
-    def __init__(self, results_dir: str = "./results"):
+        Returns:
+            Packed outcome bytes keyed by packed matchup key
         """
-        Initialize the consistency analyzer.
+        matchups = defaultdict(bytearray)
+        for columns in extracted:
+            for key, outcome in zip(
+                columns["matchup_keys"], columns["matchup_outcomes"]
+            ):
+                matchups[key].append(outcome)
+        return matchups
+
+    def _metric_matrix(
+        self, tournament_group: List[Dict], metric: str
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build a contender x tournament matrix for one ranking metric.
+
+        Only the contenders ranked in the group get a row, so groups that
+        involve a fraction of all loaded contenders stay small.
 
         Args:
-            results_dir: Directory containing tournament result JSON files
+            tournament_group: List of tournament results
+            metric: Metric name ("rank", "win_rate" or "score")
+
+        Returns:
+            Tuple of an array of shape (group contenders, tournaments), with
+            NaN where a contender has no value, the boolean mask of the entries
+            that hold a value, and the contender index of each row. Tournaments
+            without any valid value are left out.
         """
-        self.results_dir = results_dir
-        self.tournaments = []
-        self.contenders = set()
-        self.metrics = {}
+        extracted = [self._extract_tournament(t) for t in tournament_group]
+        contender_rows = np.unique(
+            np.concatenate([columns["rows"] for columns in extracted])
+        )
 
-    def load_tournaments(
-        self, pattern: str = "tournament_*.json", group_by: Optional[str] = None
-    ) -> Dict[str, List[Dict]]:
+        columns = []
+        for tournament in tournament_group:
+            entry = self._table_columns.get(id(tournament))
+            if entry is None or entry[0] is not tournament:
+                break
+            columns.append(entry[1])
+        else:
+            # Every tournament was loaded, so slice its cells from the table
+            matrix = self._tables[metric][np.ix_(contender_rows, columns)]
+            present = ~np.isnan(matrix)
+            valid = present.any(axis=0)
+            for _ in range(np.count_nonzero(~valid)):
+                print(f"Warning: Tournament has no valid {_METRIC_LABELS[metric]}")
+            if valid.all():
+                return matrix, present, contender_rows
+            return matrix[:, valid], present[:, valid], contender_rows
+
+        # Tournaments that were not loaded are assembled from their columns
+        columns = []
+        for tournament_columns in extracted:
+            if np.isnan(tournament_columns[metric]).all():
+                print(f"Warning: Tournament has no valid {_METRIC_LABELS[metric]}")
+                continue
+            columns.append((tournament_columns["rows"], tournament_columns[metric]))
+
+        matrix = np.full((len(contender_rows), len(columns)), np.nan)
+        for column, (rows, metric_values) in enumerate(columns):
+            matrix[np.searchsorted(contender_rows, rows), column] = metric_values
+        return matrix, ~np.isnan(matrix), contender_rows
+
+    def calculate_ranking_consistency(
+        self, tournament_group: List[Dict], approx_pairs: int = 0
+    ) -> Dict[str, Any]:
         """
-        Load all tournament result files matching the pattern.
+        Calculate ranking consistency across tournaments.
 
         Args:
-            pattern: Glob pattern for tournament result files
-            group_by: Optional field to group tournaments by (e.g., "config.llm.default_model")
+            tournament_group: List of tournament results
+            approx_pairs: If positive, estimate rank stability from a random
+                sample of this many tournament pairs
 
         Returns:
-            Dictionary of tournament results grouped by the specified field, or a single group if not specified
+            Dictionary of ranking consistency metrics
         """
-        file_paths = glob.glob(os.path.join(self.results_dir, pattern))
+        if not tournament_group:
+            return {"error": "No tournaments provided"}
 
-        if not file_paths:
-            print(
-                f"No tournament result files found matching pattern '{pattern}' in {self.results_dir}"
-            )
-            return {}
+        return self._ranking_consistency(
+            *self._metric_matrix(tournament_group, "rank"),
+            len(tournament_group),
+            approx_pairs,
+        )
 
-        print(f"Found {len(file_paths)} tournament result files")
+    def calculate_win_rate_consistency(
+        self, tournament_group: List[Dict]
+    ) -> Dict[str, Any]:
+        """
+        Calculate win rate consistency across tournaments.
 
-        grouped_tournaments = defaultdict(list)
+        Args:
+            tournament_group: List of tournament results
 
-        for file_path in file_paths:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    tournament_data = json.load(f)
-
-                # Extract the group key if specified
-                group_key = "all"
-                if group_by:
-                    parts = group_by.split(".")
-                    value = tournament_data
-                    for part in parts:
-                        if isinstance(value, dict) and part in value:
-                            value = value[part]
-                        else:
-                            value = "unknown"
-                            break
-                    group_key = str(value)
+        Returns:
+            Dictionary of win rate consistency metrics
+        """
+        if not tournament_group:
+            return {"error": "No tournaments provided"}
 
-                # Add to the appropriate group
-                grouped_tournaments[group_key].append(tournament_data)
+        return self._variation_consistency(
+            *self._metric_matrix(tournament_group, "win_rate"),
+            len(tournament_group),
+            "win_rate",
+        )
 
-                # Track all contenders across tournaments
-                for ranking in tournament_data.get("rankings", []):
-                    self.contenders.add(ranking.get("contender_id"))
+    def calculate_matchup_consistency(
+        self, tournament_group: List[Dict]
+    ) -> Dict[str, Any]:
+        """
+        Calculate consistency of match outcomes between pairs of contenders.
 
-            except Exception as e:
-                print(f"Error loading tournament result from {file_path}: {e}")
+        Args:
+            tournament_group: List of tournament results
 
-        self.tournaments = list(grouped_tournaments.values())
-        print(
-            f"Loaded {sum(len(group) for group in grouped_tournaments.values())} tournaments in {len(grouped_tournaments)} groups"
-        )
+        Returns:
+            Dictionary of matchup consistency metrics
+        """
+        if not tournament_group:
+            return {"error": "No tournaments provided"}
 
-        return dict(grouped_tournaments)
+        extracted = [self._extract_tournament(t) for t in tournament_group]
+        return self._matchup_consistency(
+            self._group_matchups(extracted), len(tournament_group)
+        )
 
-    def calculate_ranking_consistency(
+    def calculate_score_consistency(
         self, tournament_group: List[Dict]
     ) -> Dict[str, Any]:
         """
-        Calculate ranking consistency across tournaments.
+        Calculate score consistency across tournaments.
 
         Args:
             tournament_group: List of tournament results
 
         Returns:
-            Dictionary of ranking consistency metrics
+            Dictionary of score consistency metrics
         """
         if not tournament_group:
             return {"error": "No tournaments provided"}
 
-        # Extract rankings from each tournament
-        rankings_by_tournament = []
-        for tournament in tournament_group:
-            rankings = {}
-            try:
-                for ranking in tournament.get("rankings", []):
-                    contender_id = ranking.get("contender_id")
-                    rank = ranking.get("rank")
-                    if contender_id and rank:
-                        rankings[contender_id] = rank
-
-                # Only add if we have at least one valid ranking
-                if rankings:
-                    rankings_by_tournament.append(rankings)
-                else:
-                    print(f"Warning: Tournament has no valid rankings")
-            except Exception as e:
-                print(f"Error extracting rankings from tournament: {e}")
+        return self._variation_consistency(
+            *self._metric_matrix(tournament_group, "score"),
+            len(tournament_group),
+            "score",
+        )
+
+    def _ranking_consistency(
+        self,
+        rank_matrix: np.ndarray,
+        present: np.ndarray,
+        contender_rows: np.ndarray,
+        tournament_count: int,
+        approx_pairs: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Reduce a rank matrix to ranking consistency metrics.
+
+        Args:
+            rank_matrix: Contender x tournament rank matrix
+            present: Boolean mask of the ranked entries of the matrix
+            contender_rows: Contender index of each row of the matrix
+            tournament_count: Number of tournaments in the group
+            approx_pairs: If positive, estimate rank stability from a random
+                sample of this many tournament pairs
 
+        Returns:
+            Dictionary of ranking consistency metrics
+        """
         # Skip further processing if we don't have enough data
-        if len(rankings_by_tournament) < 2:
+        if rank_matrix.shape[1] < 2:
             return {
                 "overall": {
-                    "error": f"Need at least 2 tournaments with rankings, found {len(rankings_by_tournament)}",
+                    "error": f"Need at least 2 tournaments with rankings, found {rank_matrix.shape[1]}",
                     "avg_stdev": 0,
                     "rank_stability": 0,
                     "contender_count": 0,
-                    "tournament_count": len(rankings_by_tournament),
+                    "tournament_count": rank_matrix.shape[1],
                 },
                 "contenders": {},
             }
 
         # Calculate consistency metrics for each contender
+        contender_ids = list(self._contender_index)
+        rank_stats = _row_statistics(rank_matrix, present)
+
         contender_metrics = {}
-        for contender_id in self.contenders:
-            ranks = [
-                rankings.get(contender_id)
-                for rankings in rankings_by_tournament
-                if contender_id in rankings
-            ]
-            if len(ranks) >= 2:  # Need at least 2 tournaments for statistics
-                contender_metrics[contender_id] = {
-                    "ranks": ranks,
-                    "mean_rank": statistics.mean(ranks),
-                    "median_rank": statistics.median(ranks),
-                    "std_dev": statistics.stdev(ranks) if len(ranks) > 1 else 0,
-                    "min_rank": min(ranks),
-                    "max_rank": max(ranks),
-                    "range": max(ranks) - min(ranks),
-                    "tournaments": len(ranks),
-                }
+        for k, i in enumerate(rank_stats["rows"]):
+            contender_metrics[contender_ids[contender_rows[i]]] = {
+                # Ranks are kept as reported, which may be fractional
+                "ranks": rank_matrix[i][present[i]].tolist(),
+                "mean_rank": float(rank_stats["mean"][k]),
+                "median_rank": float(rank_stats["median"][k]),
+                "std_dev": float(rank_stats["std_dev"][k]),
+                "min_rank": float(rank_stats["min"][k]),
+                "max_rank": float(rank_stats["max"][k]),
+                "range": float(rank_stats["range"][k]),
+                "tournaments": int(rank_stats["count"][k]),
+            }
 
         # Calculate overall ranking consistency
         overall = {
             "avg_stdev": (
-                statistics.mean([m["std_dev"] for m in contender_metrics.values()])
-                if contender_metrics
-                else 0
+                float(rank_stats["std_dev"].mean()) if contender_metrics else 0
             ),
             "rank_stability": 0,  # Will calculate below if scipy is available
             "contender_count": len(contender_metrics),
-            "tournament_count": len(tournament_group),
+            "tournament_count": tournament_count,
         }
 
         # Calculate rank correlation coefficients if scipy is available
-        if SCIPY_AVAILABLE and len(tournament_group) > 1:
-            correlations = []
-
-            # Get all pairs of tournaments
-            for i in range(len(rankings_by_tournament)):
-                for j in range(i + 1, len(rankings_by_tournament)):
-                    t1 = rankings_by_tournament[i]
-                    t2 = rankings_by_tournament[j]
-
-                    # Get common contenders
-                    common = set(t1.keys()) & set(t2.keys())
-
-                    if len(common) > 2:  # Need at least 3 points for correlation
-                        ranks1 = [t1[c] for c in common]
-                        ranks2 = [t2[c] for c in common]
+        if SCIPY_AVAILABLE and tournament_count > 1:
+            correlations, pairs_sampled = _pairwise_rank_correlations(
+                rank_matrix, present, approx_pairs
+            )
 
-                        # Calculate Spearman's rank correlation
-                        corr, _ = stats.spearmanr(ranks1, ranks2)
-                        if not math.isnan(corr):
-                            correlations.append(corr)
+            if correlations.size:
+                overall["rank_stability"] = float(correlations.mean())
+                overall["min_correlation"] = float(correlations.min())
+                overall["max_correlation"] = float(correlations.max())
 
-            if correlations:
-                overall["rank_stability"] = statistics.mean(correlations)
-                overall["min_correlation"] = min(correlations)
-                overall["max_correlation"] = max(correlations)
+            # Let consumers know the correlations are estimates
+            if pairs_sampled:
+                overall["approximate"] = True
+                overall["pairs_sampled"] = pairs_sampled
 
         return {"overall": overall, "contenders": contender_metrics}
 
-    def calculate_win_rate_consistency(
-        self, tournament_group: List[Dict]
+    def _variation_consistency(
+        self,
+        matrix: np.ndarray,
+        present: np.ndarray,
+        contender_rows: np.ndarray,
+        tournament_count: int,
+        metric: str,
     ) -> Dict[str, Any]:
         """
-        Calculate win rate consistency across tournaments.
+        Reduce a win rate or score matrix to consistency metrics.
 
         Args:
-            tournament_group: List of tournament results
+            matrix: Contender x tournament matrix of the metric
+            present: Boolean mask of the entries that hold a value
+            contender_rows: Contender index of each row of the matrix
+            tournament_count: Number of tournaments in the group
+            metric: Metric name ("win_rate" or "score")
 
         Returns:
-            Dictionary of win rate consistency metrics
+            Dictionary of win rate or score consistency metrics
         """
-        if not tournament_group:
-            return {"error": "No tournaments provided"}
-
-        # Extract win rates from each tournament
-        win_rates_by_tournament = []
-        for tournament in tournament_group:
-            win_rates = {}
-            try:
-                for ranking in tournament.get("rankings", []):
-                    contender_id = ranking.get("contender_id")
-                    if not contender_id:
-                        continue
-
-                    stats = ranking.get("stats", {})
-
-                    # Handle different possible structures for stats
-                    if isinstance(stats, dict):
-                        matches_played = stats.get("matches_played", 0)
-                        wins = stats.get("wins", 0)
-
-                        if matches_played > 0:
-                            win_rate = wins / matches_played
-                        else:
-                            win_rate = 0
-                    else:
-                        # Try to access attributes if stats is not a dict
-                        try:
-                            matches_played = getattr(stats, "matches_played", 0)
-                            wins = getattr(stats, "wins", 0)
-
-                            if matches_played > 0:
-                                win_rate = wins / matches_played
-                            else:
-                                win_rate = 0
-                        except Exception:
-                            # Skip if we can't extract the stats
-                            continue
-
-                    win_rates[contender_id] = win_rate
-
-                # Only add if we have at least one valid win rate
-                if win_rates:
-                    win_rates_by_tournament.append(win_rates)
-                else:
-                    print(f"Warning: Tournament has no valid win rates")
-            except Exception as e:
-                print(f"Error extracting win rates from tournament: {e}")
+        label = _METRIC_LABELS[metric]
 
         # Skip further processing if we don't have enough data
-        if len(win_rates_by_tournament) < 2:
+        if matrix.shape[1] < 2:
             return {
                 "overall": {
-                    "error": f"Need at least 2 tournaments with win rates, found {len(win_rates_by_tournament)}",
+                    "error": f"Need at least 2 tournaments with {label}, found {matrix.shape[1]}",
                     "avg_stdev": 0,
                     "avg_coefficient_of_variation": 0,
                     "contender_count": 0,
-                    "tournament_count": len(win_rates_by_tournament),
+                    "tournament_count": matrix.shape[1],
                 },
                 "contenders": {},
             }
 
         # Calculate consistency metrics for each contender
+        contender_ids = list(self._contender_index)
+        row_stats = _row_statistics(matrix, present)
+
+        # Coefficient of variation for every contender at once (0 when the
+        # mean is not positive)
+        positive = row_stats["mean"] > 0
+        cv = np.zeros_like(row_stats["mean"])
+        np.divide(row_stats["std_dev"], row_stats["mean"], out=cv, where=positive)
+
         contender_metrics = {}
-        for contender_id in self.contenders:
-            rates = [
-                rates.get(contender_id, 0)
-                for rates in win_rates_by_tournament
-                if contender_id in rates
-            ]
-            if len(rates) >= 2:  # Need at least 2 tournaments for statistics
-                mean_rate = statistics.mean(rates)
-                contender_metrics[contender_id] = {
-                    "win_rates": rates,
-                    "mean_win_rate": mean_rate,
-                    "median_win_rate": statistics.median(rates),
-                    "std_dev": statistics.stdev(rates) if len(rates) > 1 else 0,
-                    "min_win_rate": min(rates),
-                    "max_win_rate": max(rates),
-                    "range": max(rates) - min(rates),
-                    "coefficient_of_variation": (
-                        statistics.stdev(rates) / mean_rate
-                        if mean_rate > 0 and len(rates) > 1
-                        else 0
-                    ),
-                    "tournaments": len(rates),
-                }
+        for k, i in enumerate(row_stats["rows"]):
+            contender_metrics[contender_ids[contender_rows[i]]] = {
+                f"{metric}s": matrix[i][present[i]].tolist(),
+                f"mean_{metric}": float(row_stats["mean"][k]),
+                f"median_{metric}": float(row_stats["median"][k]),
+                "std_dev": float(row_stats["std_dev"][k]),
+                f"min_{metric}": float(row_stats["min"][k]),
+                f"max_{metric}": float(row_stats["max"][k]),
+                "range": float(row_stats["range"][k]),
+                "coefficient_of_variation": float(cv[k]) if positive[k] else 0,
+                "tournaments": int(row_stats["count"][k]),
+            }
 
-        # Calculate overall win rate consistency
-        cv_values = [
-            m["coefficient_of_variation"]
-            for m in contender_metrics.values()
-            if not math.isnan(m["coefficient_of_variation"])
-            and m["coefficient_of_variation"] != 0
-        ]
+        # Calculate overall consistency, leaving out undefined and zero CVs
+        # (CVs are never negative, since they are only set for positive means)
+        cv_values = cv[np.isfinite(cv) & (cv > 0)]
 
         overall = {
             "avg_stdev": (
-                statistics.mean([m["std_dev"] for m in contender_metrics.values()])
-                if contender_metrics
-                else 0
+                float(row_stats["std_dev"].mean()) if contender_metrics else 0
             ),
             "avg_coefficient_of_variation": (
-                statistics.mean(cv_values) if cv_values else 0
+                float(cv_values.mean()) if cv_values.size else 0
             ),
             "contender_count": len(contender_metrics),
-            "tournament_count": len(tournament_group),
+            "tournament_count": tournament_count,
         }
 
         return {"overall": overall, "contenders": contender_metrics}
 
-    def calculate_matchup_consistency(
-        self, tournament_group: List[Dict]
+    def _matchup_consistency(
+        self, matchups: Dict[int, bytearray], tournament_count: int
     ) -> Dict[str, Any]:
         """
-        Calculate consistency of match outcomes between pairs of contenders.
+        Reduce the matchup outcome table to matchup consistency metrics.
 
         Args:
-            tournament_group: List of tournament results
+            matchups: Packed outcome bytes keyed by packed matchup key
+            tournament_count: Number of tournaments in the group
 
         Returns:
             Dictionary of matchup consistency metrics
         """
-        if not tournament_group:
-            return {"error": "No tournaments provided"}
-
-        # Track matchup outcomes across tournaments
-        matchups = defaultdict(list)
-
-        for tournament in tournament_group:
-            for match in tournament.get("matches", []):
-                contender1_id = match.get("contender1_id")
-                contender2_id = match.get("contender2_id")
+        contender_ids = list(self._contender_index)
 
-                # Skip if we don't have both contenders
-                if not contender1_id or not contender2_id:
-                    continue
-
-                # Create a unique key for this matchup (alphabetically sorted)
-                matchup_key = tuple(sorted([contender1_id, contender2_id]))
-
-                # Get the result - handle None case
-                result = match.get("result")
-                if result is None:
-                    # Skip matches with no results
-                    continue
+        # Need at least 2 matches
+        repeated = [
+            (packed_key, outcomes)
+            for packed_key, outcomes in matchups.items()
+            if len(outcomes) >= 2
+        ]
 
-                # Check if winner exists and handle both dictionary and direct access
-                if isinstance(result, dict):
-                    winner = result.get("winner")
-                else:
-                    # Try attribute access for non-dict objects (like Pydantic models)
-                    try:
-                        winner = getattr(result, "winner", None)
-                    except Exception:
-                        # Skip if we can't get the winner
-                        continue
-
-                # Record the outcome (1 if first contender won, -1 if second contender won, 0 for tie)
-                if winner == contender1_id:
-                    if matchup_key[0] == contender1_id:
-                        outcome = 1
-                    else:
-                        outcome = -1
-                elif winner == contender2_id:
-                    if matchup_key[0] == contender2_id:
-                        outcome = 1
-                    else:
-                        outcome = -1
-                else:
-                    outcome = 0
+        # Tally the outcomes of every matchup in one bincount: each outcome
+        # byte (0-2) is offset into its matchup's slot of three counters
+        lengths = np.array([len(outcomes) for _, outcomes in repeated], dtype=np.intp)
+        codes = np.frombuffer(
+            b"".join(outcomes for _, outcomes in repeated), dtype=np.uint8
+        )
+        slots = np.repeat(np.arange(len(repeated)) * 3, lengths) + codes
+        tallies = np.bincount(slots, minlength=3 * len(repeated)).reshape(-1, 3)
 
-                matchups[matchup_key].append(outcome)
+        # Columns in tie-break priority order: first win, second win, tie
+        tallies = tallies[:, [2, 0, 1]].tolist()
+        outcome_lists = (codes.astype(np.int8) - 1).tolist()
+        offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
 
         # Calculate consistency for each matchup
         matchup_metrics = {}
-        for matchup_key, outcomes in matchups.items():
-            if len(outcomes) >= 2:  # Need at least 2 matches
-                # Calculate frequency of each outcome
-                counts = {
-                    1: outcomes.count(1),  # First contender wins
-                    -1: outcomes.count(-1),  # Second contender wins
-                    0: outcomes.count(0),  # Tie
-                }
-
-                # Calculate the dominant outcome and its frequency
-                dominant_outcome = max(counts, key=counts.get)
-                dominant_freq = counts[dominant_outcome] / len(outcomes)
-
-                # Calculate consistency metrics
-                matchup_metrics[f"{matchup_key[0]} vs {matchup_key[1]}"] = {
-                    "outcomes": outcomes,
-                    "matches": len(outcomes),
-                    "dominant_outcome": (
-                        "first_win"
-                        if dominant_outcome == 1
-                        else "second_win" if dominant_outcome == -1 else "tie"
-                    ),
-                    "dominant_frequency": dominant_freq,
-                    "consistency_score": dominant_freq,
-                    "outcome_counts": counts,
-                }
+        for m, (packed_key, _) in enumerate(repeated):
+            matchup_key = (
+                contender_ids[packed_key >> 32],
+                contender_ids[packed_key & 0xFFFFFFFF],
+            )
+            first_wins, second_wins, ties = tallies[m]
+            matches = offsets[m + 1] - offsets[m]
+
+            # Calculate frequency of each outcome
+            counts = {1: first_wins, -1: second_wins, 0: ties}
+
+            # Calculate the dominant outcome and its frequency
+            dominant_outcome = max(counts, key=counts.get)
+            dominant_freq = counts[dominant_outcome] / matches
+
+            # Calculate consistency metrics
+            matchup_metrics[f"{matchup_key[0]} vs {matchup_key[1]}"] = {
+                "outcomes": outcome_lists[offsets[m] : offsets[m + 1]],
+                "matches": matches,
+                "dominant_outcome": (
+                    "first_win"
+                    if dominant_outcome == 1
+                    else "second_win" if dominant_outcome == -1 else "tie"
+                ),
+                "dominant_frequency": dominant_freq,
+                "consistency_score": dominant_freq,
+                "outcome_counts": counts,
+            }
 
         # Calculate overall matchup consistency
         overall = {
             "avg_consistency": (
-                statistics.mean(
-                    [m["consistency_score"] for m in matchup_metrics.values()]
+                float(
+                    np.mean([m["consistency_score"] for m in matchup_metrics.values()])
                 )
                 if matchup_metrics
                 else 0
             ),
             "matchup_count": len(matchup_metrics),
-            "tournament_count": len(tournament_group),
+            "tournament_count": tournament_count,
         }
 
         return {"overall": overall, "matchups": matchup_metrics}
 
-    def calculate_score_consistency(
-        self, tournament_group: List[Dict]
+    def analyze_all_metrics(
+        self,
+        grouped_tournaments: Dict[str, List[Dict]],
+        approx_pairs: int = 0,
+        workers: int = 1,
     ) -> Dict[str, Any]:
         """
-        Calculate score consistency across tournaments.
+        Calculate all consistency metrics for each tournament group.
 
         Args:
-            tournament_group: List of tournament results
+            grouped_tournaments: Dictionary of tournament groups
+            approx_pairs: If positive, estimate each group's rank stability
+                from a random sample of this many tournament pairs
+            workers: Number of processes to analyze groups in; groups are
+                analyzed in this process if 1
 
         Returns:
-            Dictionary of score consistency metrics
+            Dictionary of all consistency metrics by group
         """
-        if not tournament_group:
-            return {"error": "No tournaments provided"}
-
-        # Extract average scores from each tournament
-        scores_by_tournament = []
-        for tournament in tournament_group:
-            scores = {}
-            try:
-                for ranking in tournament.get("rankings", []):
-                    contender_id = ranking.get("contender_id")
-                    if not contender_id:
-                        continue
-
-                    stats = ranking.get("stats", {})
-
-                    # Handle different possible structures for stats
-                    score = None
-                    if isinstance(stats, dict):
-                        if "average_score" in stats:
-                            score = stats["average_score"]
-                        elif (
-                            "total_score" in stats
-                            and stats.get("matches_played", 0) > 0
-                        ):
-                            score = stats["total_score"] / stats["matches_played"]
-                    else:
-                        # Try to access attributes if stats is not a dict
-                        try:
-                            if hasattr(stats, "average_score"):
-                                score = stats.average_score
-                            elif (
-                                hasattr(stats, "total_score")
-                                and getattr(stats, "matches_played", 0) > 0
-                            ):
-                                score = stats.total_score / stats.matches_played
-                        except Exception:
-                            pass
-
-                    if score is not None:
-                        scores[contender_id] = score
-
-                # Only add if we have at least one valid score
-                if scores:
-                    scores_by_tournament.append(scores)
-                else:
-                    print(f"Warning: Tournament has no valid scores")
-            except Exception as e:
-                print(f"Error extracting scores from tournament: {e}")
-
-        # Skip further processing if we don't have enough data
-        if len(scores_by_tournament) < 2:
-            return {
-                "overall": {
-                    "error": f"Need at least 2 tournaments with scores, found {len(scores_by_tournament)}",
-                    "avg_stdev": 0,
-                    "avg_coefficient_of_variation": 0,
-                    "contender_count": 0,
-                    "tournament_count": len(scores_by_tournament),
-                },
-                "contenders": {},
-            }
-
-        # Calculate consistency metrics for each contender
-        contender_metrics = {}
-        for contender_id in self.contenders:
-            scores = [
-                scores.get(contender_id, 0)
-                for scores in scores_by_tournament
-                if contender_id in scores
-            ]
-            if len(scores) >= 2:  # Need at least 2 tournaments for statistics
-                mean_score = statistics.mean(scores)
-                contender_metrics[contender_id] = {
-                    "scores": scores,
-                    "mean_score": mean_score,
-                    "median_score": statistics.median(scores),
-                    "std_dev": statistics.stdev(scores) if len(scores) > 1 else 0,
-                    "min_score": min(scores),
-                    "max_score": max(scores),
-                    "range": max(scores) - min(scores),
-                    "coefficient_of_variation": (
-                        statistics.stdev(scores) / mean_score
-                        if mean_score > 0 and len(scores) > 1
-                        else 0
-                    ),
-                    "tournaments": len(scores),
-                }
-
-        # Calculate overall score consistency
-        cv_values = [
-            m["coefficient_of_variation"]
-            for m in contender_metrics.values()
-            if not math.isnan(m["coefficient_of_variation"])
-            and m["coefficient_of_variation"] != 0
-        ]
-
-        overall = {
-            "avg_stdev": (
-                statistics.mean([m["std_dev"] for m in contender_metrics.values()])
-                if contender_metrics
-                else 0
-            ),
-            "avg_coefficient_of_variation": (
-                statistics.mean(cv_values) if cv_values else 0
-            ),
-            "contender_count": len(contender_metrics),
-            "tournament_count": len(tournament_group),
-        }
+        if workers > 1 and len(grouped_tournaments) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(grouped_tournaments))
+            ) as executor:
+                results = self._analyze_groups(
+                    grouped_tournaments, approx_pairs, executor
+                )
+        else:
+            results = self._analyze_groups(grouped_tournaments, approx_pairs)
 
-        return {"overall": overall, "contenders": contender_metrics}
+        self.metrics = results
+        return results
 
-    def analyze_all_metrics(
-        self, grouped_tournaments: Dict[str, List[Dict]]
+    def _analyze_groups(
+        self,
+        grouped_tournaments: Dict[str, List[Dict]],
+        approx_pairs: int,
+        executor: Optional[Executor] = None,
     ) -> Dict[str, Any]:
         """
         Calculate all consistency metrics for each tournament group.
 
+        Groups are always ingested in this process. With an executor, only
+        the ingested matrices and matchup outcomes are sent to it to be
+        reduced, so the tournament data never crosses a process boundary.
+
         Args:
             grouped_tournaments: Dictionary of tournament groups
+            approx_pairs: If positive, estimate each group's rank stability
+                from a random sample of this many tournament pairs
+            executor: Executor to reduce the groups in, if any
 
         Returns:
             Dictionary of all consistency metrics by group
         """
-        results = {}
-
+        pending = []
         for group_name, tournaments in grouped_tournaments.items():
             print(
                 f"Analyzing {len(tournaments)} tournaments in group '{group_name}'..."
             )
 
             try:
-                # Calculate each metric with error handling
-                try:
-                    ranking_consistency = self.calculate_ranking_consistency(
-                        tournaments
-                    )
-                except Exception as e:
-                    print(f"Error calculating ranking consistency: {e}")
-                    ranking_consistency = {"error": str(e)}
+                if not tournaments:
+                    raise ValueError("No tournaments provided")
 
-                try:
-                    win_rate_consistency = self.calculate_win_rate_consistency(
-                        tournaments
-                    )
-                except Exception as e:
-                    print(f"Error calculating win rate consistency: {e}")
-                    win_rate_consistency = {"error": str(e)}
+                # Traverse the group once and share the result across metrics
+                ingested = self._ingest(tournaments)
 
-                try:
-                    matchup_consistency = self.calculate_matchup_consistency(
-                        tournaments
+                if executor is None:
+                    group_metrics = self._analyze_ingested(
+                        ingested, len(tournaments), approx_pairs
                     )
-                except Exception as e:
-                    print(f"Error calculating matchup consistency: {e}")
-                    matchup_consistency = {"error": str(e)}
+                else:
+                    group_metrics = executor.submit(
+                        _analyze_ingested_in_worker,
+                        list(self._contender_index),
+                        ingested,
+                        len(tournaments),
+                        approx_pairs,
+                    )
+                pending.append((group_name, tournaments, group_metrics))
+            except Exception as e:
+                print(f"Error analyzing group '{group_name}': {e}")
+                pending.append(
+                    (
+                        group_name,
+                        tournaments,
+                        {"tournaments": len(tournaments), "error": str(e)},
+                    )
+                )
 
+        results = {}
+        for group_name, tournaments, group_metrics in pending:
+            if isinstance(group_metrics, Future):
                 try:
-                    score_consistency = self.calculate_score_consistency(tournaments)
+                    group_metrics = group_metrics.result()
                 except Exception as e:
-                    print(f"Error calculating score consistency: {e}")
-                    score_consistency = {"error": str(e)}
-
-                group_metrics = {
-                    "tournaments": len(tournaments),
-                    "ranking_consistency": ranking_consistency,
-                    "win_rate_consistency": win_rate_consistency,
-                    "matchup_consistency": matchup_consistency,
-                    "score_consistency": score_consistency,
-                }
-
-                results[group_name] = group_metrics
-            except Exception as e:
-                print(f"Error analyzing group '{group_name}': {e}")
-                results[group_name] = {"tournaments": len(tournaments), "error": str(e)}
+                    print(f"Error analyzing group '{group_name}': {e}")
+                    group_metrics = {"tournaments": len(tournaments), "error": str(e)}
+            results[group_name] = group_metrics
 
-        self.metrics = results
         return results
 
+    def _analyze_ingested(
+        self, ingested: Dict[str, Any], tournament_count: int, approx_pairs: int
+    ) -> Dict[str, Any]:
+        """
+        Reduce a group's ingested data to all consistency metrics.
+
+        Args:
+            ingested: Ingested group data from _ingest
+            tournament_count: Number of tournaments in the group
+            approx_pairs: If positive, estimate rank stability from a random
+                sample of this many tournament pairs
+
+        Returns:
+            Dictionary of the group's consistency metrics
+        """
+        # Calculate each metric with error handling
+        try:
+            ranking_consistency = self._ranking_consistency(
+                *ingested["rank"], tournament_count, approx_pairs
+            )
+        except Exception as e:
+            print(f"Error calculating ranking consistency: {e}")
+            ranking_consistency = {"error": str(e)}
+
+        try:
+            win_rate_consistency = self._variation_consistency(
+                *ingested["win_rate"], tournament_count, "win_rate"
+            )
+        except Exception as e:
+            print(f"Error calculating win rate consistency: {e}")
+            win_rate_consistency = {"error": str(e)}
+
+        try:
+            matchup_consistency = self._matchup_consistency(
+                ingested["matchups"], tournament_count
+            )
+        except Exception as e:
+            print(f"Error calculating matchup consistency: {e}")
+            matchup_consistency = {"error": str(e)}
+
+        try:
+            score_consistency = self._variation_consistency(
+                *ingested["score"], tournament_count, "score"
+            )
+        except Exception as e:
+            print(f"Error calculating score consistency: {e}")
+            score_consistency = {"error": str(e)}
+
+        return {
+            "tournaments": tournament_count,
+            "ranking_consistency": ranking_consistency,
+            "win_rate_consistency": win_rate_consistency,
+            "matchup_consistency": matchup_consistency,
+            "score_consistency": score_consistency,
+        }
+
     def export_summary_to_csv(
         self, output_file: str = "consistency_summary.csv"
     ) -> str:
@@ -667,46 +1973,38 @@ class ConsistencyAnalyzer:
             )
 
             # Write data for each group
+            rows = []
             for group_name, metrics in self.metrics.items():
-                writer.writerow(
+                win_rate_cv = _WIN_RATE_CV(metrics)
+                score_cv = _SCORE_CV(metrics)
+                rows.append(
                     [
                         group_name,
                         metrics.get("tournaments", 0),
-                        metrics.get("ranking_consistency", {})
-                        .get("overall", {})
-                        .get("rank_stability", 0),
-                        metrics.get("ranking_consistency", {})
-                        .get("overall", {})
-                        .get("avg_stdev", 0),
-                        1
-                        - metrics.get("win_rate_consistency", {})
-                        .get("overall", {})
-                        .get("avg_coefficient_of_variation", 0),
-                        metrics.get("win_rate_consistency", {})
-                        .get("overall", {})
-                        .get("avg_coefficient_of_variation", 0),
-                        metrics.get("matchup_consistency", {})
-                        .get("overall", {})
-                        .get("avg_consistency", 0),
-                        1
-                        - metrics.get("score_consistency", {})
-                        .get("overall", {})
-                        .get("avg_coefficient_of_variation", 0),
-                        metrics.get("score_consistency", {})
-                        .get("overall", {})
-                        .get("avg_coefficient_of_variation", 0),
+                        _RANK_STABILITY(metrics),
+                        _AVG_RANK_STDEV(metrics),
+                        1 - win_rate_cv,
+                        win_rate_cv,
+                        _MATCHUP_CONSISTENCY(metrics),
+                        1 - score_cv,
+                        score_cv,
                     ]
                 )
 
+            writer.writerows(rows)
+
         print(f"Exported summary to {output_file}")
         return output_file
 
-    def export_detailed_results(self, output_dir: str = "./analysis_results") -> str:
+    def export_detailed_results(
+        self, output_dir: str = "./analysis_results", compress: bool = False
+    ) -> str:
         """
         Export detailed consistency metrics to JSON files.
 
         Args:
             output_dir: Directory for output files
+            compress: Whether to write zstd-compressed .json.zst files
 
         Returns:
             Path to the output directory
@@ -715,21 +2013,32 @@ class ConsistencyAnalyzer:
             print("No metrics to export. Run analyze_all_metrics first.")
             return ""
 
+        if compress and not ZSTD_AVAILABLE:
+            print("zstandard is not installed. Writing uncompressed JSON files.")
+            compress = False
+        extension = ".json.zst" if compress else ".json"
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
         # Add timestamp to filename for uniqueness
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Export each group's metrics to a separate file
-        for group_name, metrics in self.metrics.items():
-            filename = f"consistency_{group_name.repace(":", "_")}_{timestamp}.json"
-            file_path = os.path.join(output_dir, filename)
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(metrics, f, indent=2)
-
-            print(f"Exported detailed metrics for group '{group_name}' to {file_path}")
+        # Export each group's metrics to a separate file. Serialization,
+        # compression and writes overlap across groups.
+        with ThreadPoolExecutor(max_workers=min(32, len(self.metrics))) as executor:
+            exports = []
+            for group_name, metrics in self.metrics.items():
+                filename = f"consistency_{group_name.translate(_FS_SAFE)}_{timestamp}{extension}"
+                file_path = os.path.join(output_dir, filename)
+                future = executor.submit(_write_json_file, file_path, metrics, compress)
+                exports.append((group_name, file_path, future))
+
+            for group_name, file_path, future in exports:
+                future.result()
+                print(
+                    f"Exported detailed metrics for group '{group_name}' to {file_path}"
+                )
 
         # Export a combined summary file
         summary = {"timestamp": timestamp, "groups": {}, "overall_comparison": {}}
@@ -737,20 +2046,10 @@ class ConsistencyAnalyzer:
         for group_name, metrics in self.metrics.items():
             summary["groups"][group_name] = {
                 "tournaments": metrics.get("tournaments", 0),
-                "ranking_stability": metrics.get("ranking_consistency", {})
-                .get("overall", {})
-                .get("rank_stability", 0),
-                "win_rate_consistency": 1
-                - metrics.get("win_rate_consistency", {})
-                .get("overall", {})
-                .get("avg_coefficient_of_variation", 0),
-                "matchup_consistency": metrics.get("matchup_consistency", {})
-                .get("overall", {})
-                .get("avg_consistency", 0),
-                "score_consistency": 1
-                - metrics.get("score_consistency", {})
-                .get("overall", {})
-                .get("avg_coefficient_of_variation", 0),
+                "ranking_stability": _RANK_STABILITY(metrics),
+                "win_rate_consistency": 1 - _WIN_RATE_CV(metrics),
+                "matchup_consistency": _MATCHUP_CONSISTENCY(metrics),
+                "score_consistency": 1 - _SCORE_CV(metrics),
             }
 
         # Calculate which group has the best consistency for each metric
@@ -787,10 +2086,38 @@ class ConsistencyAnalyzer:
                 },
             }
 
-        summary_file = os.path.join(output_dir, f"consistency_summary_{timestamp}.json")
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        summary_file = os.path.join(
+            output_dir, f"consistency_summary_{timestamp}{extension}"
+        )
+        _write_json_file(summary_file, summary, compress)
 
         print(f"Exported overall summary to {summary_file}")
 
         return output_dir
+
+
+def _analyze_ingested_in_worker(
+    contender_ids: List[Any],
+    ingested: Dict[str, Any],
+    tournament_count: int,
+    approx_pairs: int,
+) -> Dict[str, Any]:
+    """
+    Reduce a group's ingested data to all consistency metrics in a worker
+    process.
+
+    Args:
+        contender_ids: Contender IDs in contender index order
+        ingested: Ingested group data from ConsistencyAnalyzer._ingest
+        tournament_count: Number of tournaments in the group
+        approx_pairs: If positive, estimate rank stability from a random
+            sample of this many tournament pairs
+
+    Returns:
+        Dictionary of the group's consistency metrics
+    """
+    analyzer = ConsistencyAnalyzer()
+    analyzer._contender_index = {
+        contender_id: index for index, contender_id in enumerate(contender_ids)
+    }
+    return analyzer._analyze_ingested(ingested, tournament_count, approx_pairs)
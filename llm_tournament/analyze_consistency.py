@@ -10,11 +10,36 @@ import os
 import sys
 import argparse
 import glob
+import heapq
+
+import numpy as np
+
 from analysis.consistency_analyzer import ConsistencyAnalyzer
 
+# Paths of the values reported from each group's results
+_RANK_STABILITY = ("ranking_consistency", "overall", "rank_stability")
+_AVG_RANK_STDEV = ("ranking_consistency", "overall", "avg_stdev")
+_RANK_CONTENDERS = ("ranking_consistency", "contenders")
+_WIN_RATE_CV = ("win_rate_consistency", "overall", "avg_coefficient_of_variation")
+_MATCHUP_CONSISTENCY = ("matchup_consistency", "overall", "avg_consistency")
+_SCORE_CV = ("score_consistency", "overall", "avg_coefficient_of_variation")
 
-def parse_arguments():
-    """Parse command line arguments."""
+
+def _deep_get(data, path, default):
+    """Get a nested value from analysis results, or default if it is missing."""
+    for key in path:
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+# Argument parser, built on first use and reused by later calls
+_PARSER = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(description="LLM Tournament Consistency Analyzer")
 
     parser.add_argument(
@@ -51,13 +76,56 @@ def parse_arguments():
         help="Filename for summary CSV",
     )
 
+    parser.add_argument(
+        "--approx-pairs",
+        type=int,
+        default=0,
+        help="Estimate rank stability from this many sampled tournament pairs (0 = all pairs)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to analyze tournament groups in",
+    )
+
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress detailed results with zstd (requires zstandard)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse parses of result files whose contents are unchanged since "
+            "an earlier run with --cache, kept in a .analysis_cache directory "
+            "inside the results directory"
+        ),
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Print detailed information during analysis",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER.parse_args()
+
+
+def _write_lines(lines):
+    """Write lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -67,31 +135,31 @@ def main():
     # Create the output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
 
-    # Print diagnostic information
-    print("\nAnalyzer Diagnostics:")
-    print(f"Results directory: {os.path.abspath(args.results_dir)}")
-    print(f"Output directory: {os.path.abspath(args.output_dir)}")
-    print(
-        f"Summary file path: {os.path.abspath(os.path.join(args.output_dir, args.summary_file))}"
-    )
+    summary_path = os.path.join(args.output_dir, args.summary_file)
 
     # Count files matching pattern
     files = glob.glob(os.path.join(args.results_dir, args.pattern))
-    print(f"Files matching pattern '{args.pattern}': {len(files)}")
+
+    # Print diagnostic information and the header in a single write
+    lines = [
+        "",
+        "Analyzer Diagnostics:",
+        f"Results directory: {os.path.abspath(args.results_dir)}",
+        f"Output directory: {os.path.abspath(args.output_dir)}",
+        f"Summary file path: {os.path.abspath(summary_path)}",
+        f"Files matching pattern '{args.pattern}': {len(files)}",
+    ]
     if files:
-        print(f"Sample file: {os.path.basename(files[0])}")
+        lines.append(f"Sample file: {os.path.basename(files[0])}")
+    lines += ["", "=" * 70, "LLM TOURNAMENT CONSISTENCY ANALYZER", "=" * 70]
+    _write_lines(lines)
 
     # Create the analyzer
     analyzer = ConsistencyAnalyzer(results_dir=args.results_dir)
 
-    # Print header
-    print("\n" + "=" * 70)
-    print("LLM TOURNAMENT CONSISTENCY ANALYZER")
-    print("=" * 70)
-
     # Load tournaments
     grouped_tournaments = analyzer.load_tournaments(
-        pattern=args.pattern, group_by=args.group_by
+        pattern=args.pattern, group_by=args.group_by, use_cache=args.cache
     )
 
     if not grouped_tournaments:
@@ -99,7 +167,9 @@ def main():
         return 1
 
     # Run analysis
-    results = analyzer.analyze_all_metrics(grouped_tournaments)
+    results = analyzer.analyze_all_metrics(
+        grouped_tournaments, approx_pairs=args.approx_pairs, workers=args.workers
+    )
 
     # Print summary for each group
     for group_name, metrics in results.items():
@@ -108,36 +178,32 @@ def main():
         print("-" * 70)
 
         # Ranking consistency
-        rank_metrics = metrics.get("ranking_consistency", {}).get("overall", {})
-        print(f"Ranking Stability: {rank_metrics.get('rank_stability', 0):.3f}")
-        print(f"Average Rank StdDev: {rank_metrics.get('avg_stdev', 0):.3f}")
+        print(f"Ranking Stability: {_deep_get(metrics, _RANK_STABILITY, 0):.3f}")
+        print(f"Average Rank StdDev: {_deep_get(metrics, _AVG_RANK_STDEV, 0):.3f}")
 
         # Win rate consistency
-        win_metrics = metrics.get("win_rate_consistency", {}).get("overall", {})
-        win_cv = win_metrics.get("avg_coefficient_of_variation", 0)
+        win_cv = _deep_get(metrics, _WIN_RATE_CV, 0)
         win_consistency = 1 - win_cv
         print(f"Win Rate Consistency: {win_consistency:.3f}")
 
         # Matchup consistency
-        matchup_metrics = metrics.get("matchup_consistency", {}).get("overall", {})
-        print(f"Matchup Consistency: {matchup_metrics.get('avg_consistency', 0):.3f}")
+        matchup_consistency = _deep_get(metrics, _MATCHUP_CONSISTENCY, 0)
+        print(f"Matchup Consistency: {matchup_consistency:.3f}")
 
         # Score consistency
-        score_metrics = metrics.get("score_consistency", {}).get("overall", {})
-        score_cv = score_metrics.get("avg_coefficient_of_variation", 0)
+        score_cv = _deep_get(metrics, _SCORE_CV, 0)
         score_consistency = 1 - score_cv
         print(f"Score Consistency: {score_consistency:.3f}")
 
         if args.verbose:
             # Print details for top contenders by inconsistency
             print("\nMost variable contenders by rank:")
-            contender_ranks = metrics.get("ranking_consistency", {}).get(
-                "contenders", {}
-            )
-            sorted_contenders = sorted(
-                contender_ranks.items(), key=lambda x: x[1]["std_dev"], reverse=True
+            contender_ranks = _deep_get(metrics, _RANK_CONTENDERS, {})
+            # Only the top three are shown, so avoid sorting every contender
+            most_variable = heapq.nlargest(
+                3, contender_ranks.items(), key=lambda x: x[1]["std_dev"]
             )
-            for contender_id, data in sorted_contenders[:3]:
+            for contender_id, data in most_variable:
                 print(
                     f"  {contender_id}: StdDev = {data['std_dev']:.2f}, Range = {data['range']} (Ranks: {data['ranks']})"
                 )
@@ -148,68 +214,54 @@ def main():
         print("GROUP COMPARISON")
         print("=" * 70)
 
-        # Determine which group has the best consistency for each metric
-        ranking_stability = [
-            (
-                group,
-                metrics.get("ranking_consistency", {})
-                .get("overall", {})
-                .get("rank_stability", 0),
-            )
-            for group, metrics in results.items()
-        ]
-        best_ranking = max(ranking_stability, key=lambda x: x[1])
-
-        win_rate_consistency = [
-            (
-                group,
-                1
-                - metrics.get("win_rate_consistency", {})
-                .get("overall", {})
-                .get("avg_coefficient_of_variation", 0),
-            )
-            for group, metrics in results.items()
-        ]
-        best_win_rate = max(win_rate_consistency, key=lambda x: x[1])
-
-        matchup_consistency = [
-            (
-                group,
-                metrics.get("matchup_consistency", {})
-                .get("overall", {})
-                .get("avg_consistency", 0),
-            )
-            for group, metrics in results.items()
-        ]
-        best_matchup = max(matchup_consistency, key=lambda x: x[1])
-
-        score_consistency = [
-            (
-                group,
-                1
-                - metrics.get("score_consistency", {})
-                .get("overall", {})
-                .get("avg_coefficient_of_variation", 0),
-            )
-            for group, metrics in results.items()
-        ]
-        best_score = max(score_consistency, key=lambda x: x[1])
-
-        print(f"Best Ranking Stability: {best_ranking[0]} ({best_ranking[1]:.3f})")
-        print(f"Best Win Rate Consistency: {best_win_rate[0]} ({best_win_rate[1]:.3f})")
-        print(f"Best Matchup Consistency: {best_matchup[0]} ({best_matchup[1]:.3f})")
-        print(f"Best Score Consistency: {best_score[0]} ({best_score[1]:.3f})")
+        # Stack each group's metrics into a (groups, metrics) array so the
+        # best group for every metric comes from a single argmax
+        groups = list(results)
+        consistency = np.array(
+            [
+                [
+                    _deep_get(metrics, path, 0)
+                    for path in (
+                        _RANK_STABILITY,
+                        _WIN_RATE_CV,
+                        _MATCHUP_CONSISTENCY,
+                        _SCORE_CV,
+                    )
+                ]
+                for metrics in results.values()
+            ],
+            dtype=np.float64,
+        )
+
+        # Win rate and score consistency are 1 - their coefficient of variation
+        consistency[:, [1, 3]] = 1.0 - consistency[:, [1, 3]]
+        best = consistency.argmax(axis=0)
+
+        for column, label in enumerate(
+            [
+                "Ranking Stability",
+                "Win Rate Consistency",
+                "Matchup Consistency",
+                "Score Consistency",
+            ]
+        ):
+            row = best[column]
+            print(f"Best {label}: {groups[row]} ({consistency[row, column]:.3f})")
 
     # Export results
-    summary_path = os.path.join(args.output_dir, args.summary_file)
     analyzer.export_summary_to_csv(summary_path)
-    analyzer.export_detailed_results(args.output_dir)
-
-    print("\n" + "=" * 70)
-    print("ANALYSIS COMPLETE")
-    print("=" * 70)
-    print(f"Summary CSV: {summary_path}")
-    print(f"Detailed results: {args.output_dir}")
+    analyzer.export_detailed_results(args.output_dir, compress=args.compress)
+
+    _write_lines(
+        [
+            "",
+            "=" * 70,
+            "ANALYSIS COMPLETE",
+            "=" * 70,
+            f"Summary CSV: {summary_path}",
+            f"Detailed results: {args.output_dir}",
+        ]
+    )
 
     return 0
 
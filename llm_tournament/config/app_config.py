@@ -6,6 +6,10 @@ import os
 import yaml
 from typing import Any, Dict, Optional
 
+# Environment variable values read as booleans
+_TRUE_VALUES = frozenset(("true", "yes", "1"))
+_FALSE_VALUES = frozenset(("false", "no", "0"))
+
 
 class AppConfig:
     """
@@ -27,8 +31,13 @@ class AppConfig:
                 "timeout": 60,
                 "max_retries": 3,
                 "retry_delay": 5,
+                "max_concurrency": 1,
+                "cache_dir": None,
+                "stream_stdout": False,
+                "marshal_batch_size": 1,
                 "model_mapping": {
                     "match_evaluation": "phi4",
+                    "match_batch_evaluation": "phi4",
                     "contender_comparison": "phi4",
                     "scoring": "phi4",
                     "validation": "phi4",
@@ -43,6 +52,7 @@ class AppConfig:
             "output": {
                 "results_file": "./results/tournament_results.json",
                 "match_log_dir": "./results/matches",
+                "export_match_logs": False,
             },
             "logging": {
                 "level": "INFO",
@@ -52,6 +62,9 @@ class AppConfig:
             },
         }
 
+        # Setting paths to values, built on the first get_setting call
+        self._settings = None
+
         if config_path:
             self.load_from_file(config_path)
 
@@ -63,6 +76,7 @@ class AppConfig:
             with open(file_path, "r") as f:
                 file_config = yaml.safe_load(f)
                 self._merge_configs(self.config, file_config)
+                self._settings = None
         except Exception as e:
             # Log this error once we have logging set up
             print(f"Error loading config from {file_path}: {e}")
@@ -72,7 +86,7 @@ class AppConfig:
         # Example: LLM_TOURNAMENT_LLM_DEFAULT_MODEL=llamav2 would override config["llm"]["default_model"]
         prefix = "LLM_TOURNAMENT_"
 
-        for key in os.environ:
+        for key, value in os.environ.items():
             if key.startswith(prefix):
                 # Remove prefix and split into config path
                 config_path = key[len(prefix) :].lower().split("_")
@@ -80,12 +94,11 @@ class AppConfig:
                 # Navigate to the correct position in the config
                 current = self.config
                 for part in config_path[:-1]:
-                    if part not in current:
-                        current[part] = {}
-                    current = current[part]
+                    current = current.setdefault(part, {})
 
                 # Set the value
-                current[config_path[-1]] = self._convert_value(os.environ[key])
+                current[config_path[-1]] = self._convert_value(value)
+                self._settings = None
 
     def get_setting(self, *keys: str, default: Any = None) -> Any:
         """
@@ -97,13 +110,51 @@ class AppConfig:
 
         Returns:
             The setting value or default if not found.
+
+        Settings are looked up in an index of self.config. Changes made with
+        set_setting or by loading files and environment variables update it;
+        after changing self.config directly, call rebuild_cache.
+        """
+        if self._settings is None:
+            self.rebuild_cache()
+        return self._settings.get(keys, default)
+
+    def set_setting(self, *keys: str, value: Any) -> None:
+        """
+        Change a setting in the configuration.
+
+        Args:
+            *keys: The path to the setting (e.g., "llm", "default_model").
+                Missing sections on the path are created.
+            value: New value of the setting.
         """
         current = self.config
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                return default
-            current = current[key]
-        return current
+        for key in keys[:-1]:
+            current = current.setdefault(key, {})
+        current[keys[-1]] = value
+
+        # Index everything again on the next get_setting, since the value
+        # may be a section with settings of its own
+        self._settings = None
+
+    def rebuild_cache(self) -> None:
+        """
+        Index every setting path so get_setting is a single lookup.
+
+        set_setting and loading from files and environment variables refresh
+        the index automatically; call this after modifying self.config
+        directly, or get_setting keeps returning the old values.
+        """
+        settings = {(): self.config}
+        stack = [((), self.config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                path = prefix + (key,)
+                settings[path] = value
+                if isinstance(value, dict):
+                    stack.append((path, value))
+        self._settings = settings
 
     def validate_config(self) -> bool:
         """
@@ -131,19 +182,25 @@ class AppConfig:
         return True
 
     def _merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> None:
-        """Recursively merge override config into base config."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_configs(base[key], value)
-            else:
-                base[key] = value
+        """Merge override config into base config, descending into nested sections."""
+        # Walk nested sections with a worklist instead of recursing
+        stack = [(base, override)]
+        while stack:
+            base_section, override_section = stack.pop()
+            for key, value in override_section.items():
+                current = base_section.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base_section[key] = value
 
     def _convert_value(self, value: str) -> Any:
         """Convert string values from environment variables to appropriate types."""
         # Try to convert to bool
-        if value.lower() in ("true", "yes", "1"):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        if value.lower() in ("false", "no", "0"):
+        if lowered in _FALSE_VALUES:
             return False
 
         # Try to convert to int
@@ -72,12 +72,15 @@ def setup_environment(config: AppConfig) -> None:
         ensure_directory_exists(directory)
 
 
-def run_tournament(args: argparse.Namespace) -> int:
+def run_tournament(args: argparse.Namespace, run_id: Optional[str] = None) -> int:
     """
     Run the tournament using the provided arguments.
 
     Args:
         args: Command line arguments
+        run_id: ID of a run sharing this process with others (see
+            run_one_tournament); its records are logged to a logger of its
+            own through the handlers set up by setup_shared_logging
 
     Returns:
         Exit code (0 for success, non-zero for failure)
@@ -89,20 +92,22 @@ def run_tournament(args: argparse.Namespace) -> int:
         # Override config with command line arguments
         # Override config with command line arguments
         if args.rounds:
-            config.config["tournament"]["rounds_per_matchup"] = args.rounds
+            config.set_setting("tournament", "rounds_per_matchup", value=args.rounds)
 
         if args.model:
             # Update both the default model and all model mappings
-            config.config["llm"]["default_model"] = args.model
+            config.set_setting("llm", "default_model", value=args.model)
             # Update all model mappings to use the specified model
-            for prompt_type in config.config["llm"]["model_mapping"]:
-                config.config["llm"]["model_mapping"][prompt_type] = args.model
+            for prompt_type in config.get_setting("llm", "model_mapping"):
+                config.set_setting(
+                    "llm", "model_mapping", prompt_type, value=args.model
+                )
 
         if args.output:
-            config.config["output"]["results_file"] = args.output
+            config.set_setting("output", "results_file", value=args.output)
 
         if args.headless:
-            config.config["ui"]["enabled"] = False
+            config.set_setting("ui", "enabled", value=False)
     except Exception as e:
         print(f"Error loading configuration: {e}")
         return 1
@@ -110,8 +115,35 @@ def run_tournament(args: argparse.Namespace) -> int:
     # Set up the environment
     setup_environment(config)
 
+    if run_id is None:
+        log_manager = LogManager(config.config)
+    else:
+        log_manager = LogManager(
+            config.config, name=f"llm_tournament.runs.{run_id}", inherit_handlers=True
+        )
+    try:
+        return _run_with_logging(args, config, log_manager)
+    finally:
+        # Stop the log listener now rather than at exit, as a program running
+        # many tournaments would otherwise keep one for each of them
+        log_manager.close()
+
+
+def _run_with_logging(
+    args: argparse.Namespace, config: AppConfig, log_manager: LogManager
+) -> int:
+    """
+    Run the tournament once configuration and logging are set up.
+
+    Args:
+        args: Command line arguments
+        config: Application configuration, with the arguments applied
+        log_manager: Log manager for the tournament
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
     # Initialize managers
-    log_manager = LogManager(config.config)
     log_manager.log_info("Starting LLM Tournament")
 
     prompt_manager = PromptManager(
@@ -180,6 +212,15 @@ def run_tournament(args: argparse.Namespace) -> int:
         results_file = output_handler.export_tournament_results(tournament)
         log_manager.log_info(f"Tournament results exported to {results_file}")
 
+        # Save each evaluated match's result to the match log directory,
+        # if requested
+        if config.get_setting("output", "export_match_logs", default=False):
+            evaluated = [match for match in tournament.matches if match.result]
+            output_handler.export_match_results(evaluated)
+            log_manager.log_info(
+                f"{len(evaluated)} match results exported to {output_handler.match_log_dir}"
+            )
+
         # Display completion message
         ui_manager.display_completion(tournament, results_file)
     except Exception as e:
@@ -189,6 +230,66 @@ def run_tournament(args: argparse.Namespace) -> int:
     return 0
 
 
+def run_one_tournament(
+    contenders_file: str,
+    framework_file: str,
+    model: str,
+    output_file: str,
+    run_id: str,
+    config_file: str = "config.yaml",
+) -> bool:
+    """
+    Run a single tournament in this process, as main.py would from the
+    command line in headless mode.
+
+    Other tournaments may be running in the process at the same time, so
+    nothing is written to the console, and the tournament logs to a logger
+    of its own, named after the run ID, which passes its records on to the
+    handlers set up by setup_shared_logging.
+
+    Args:
+        contenders_file: Path to contenders JSON file
+        framework_file: Path to assessment framework JSON file
+        model: LLM model to use
+        output_file: Path to output results file
+        run_id: Unique ID for this run
+        config_file: Path to configuration file
+
+    Returns:
+        True if the tournament ran and its results were exported, False otherwise
+    """
+    args = argparse.Namespace(
+        config=config_file,
+        contenders=contenders_file,
+        framework=framework_file,
+        headless=True,
+        output=output_file,
+        rounds=None,
+        model=model,
+    )
+    return run_tournament(args, run_id=run_id) == 0
+
+
+def setup_shared_logging(config_file: str = "config.yaml") -> LogManager:
+    """
+    Set up logging for tournaments run side by side in this process with
+    run_one_tournament.
+
+    Their loggers, and those of the modules they share, all write to the log
+    file through the handlers set up here, so the file has a single writer
+    and nothing reaches the console of the host program.
+
+    Args:
+        config_file: Path to configuration file
+
+    Returns:
+        Log manager to close once the tournaments have finished
+    """
+    config = AppConfig(config_file)
+    setup_environment(config)
+    return LogManager(config.config, console=False)
+
+
 def main() -> int:
     """Main entry point for the application."""
     args = parse_arguments()
@@ -3,12 +3,72 @@ Input handler for the LLM Tournament application.
 """
 
 import json
+import mmap
 import os
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Callable, Dict, List, Any, Tuple, Optional
 
 from models.contender import Contender
 from models.assessment import AssessmentFramework
 
+# For faster JSON parsing
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_json(file_path: str) -> Any:
+    """
+    Read and parse a JSON file, using orjson when it is installed.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        with open(file_path, "rb") as f:
+            # Empty files cannot be mapped; let orjson report them
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b"")
+
+            # Parse the mapped file directly instead of copying it into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _file_contains(file_path: str, needle: bytes) -> bool:
+    """
+    Check whether a file contains a byte string, without parsing it.
+
+    Args:
+        file_path: Path to the file
+        needle: Bytes to look for
+
+    Returns:
+        True if the bytes occur in the file or it could not be scanned
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped.find(needle) != -1
+    except (OSError, ValueError):
+        # Leave it to the parser to report files that cannot be scanned
+        return True
+
 
 class InputHandler:
     """
@@ -42,35 +102,50 @@ class InputHandler:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Contenders file not found: {file_path}")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            return self._parse_contenders(_read_json(file_path))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in contenders file: {e}")
 
-            # Validate structure
-            if "contenders" not in data or not isinstance(data["contenders"], list):
-                raise ValueError(
-                    "Invalid contenders file format. Expected 'contenders' array."
-                )
+    def _parse_contenders(self, data: Dict[str, Any]) -> List[Contender]:
+        """
+        Create contenders from parsed contenders file data.
+
+        Args:
+            data: Parsed contents of a contenders file
+
+        Returns:
+            List of Contender objects
+
+        Raises:
+            ValueError: If the data is invalid
+        """
+        # Validate structure
+        if "contenders" not in data or not isinstance(data["contenders"], list):
+            raise ValueError(
+                "Invalid contenders file format. Expected 'contenders' array."
+            )
+
+        entries = data["contenders"]
 
-            # Create Contender objects
-            contenders = []
-            for i, contender_data in enumerate(data["contenders"]):
-                # Validate required fields
+        # Validate required fields, locating the first invalid entry only if
+        # there is one
+        if not all("id" in entry and "content" in entry for entry in entries):
+            for i, contender_data in enumerate(entries):
                 if "id" not in contender_data:
                     raise ValueError(f"Contender at index {i} missing 'id'")
                 if "content" not in contender_data:
                     raise ValueError(f"Contender at index {i} missing 'content'")
 
-                # Create Contender object
-                contender = Contender(
-                    id=contender_data["id"],
-                    content=contender_data["content"],
-                    metadata=contender_data.get("metadata", {}),
-                )
-                contenders.append(contender)
-
-            return contenders
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in contenders file: {e}")
+        # Create Contender objects
+        contender = Contender
+        return [
+            contender(
+                id=contender_data["id"],
+                content=contender_data["content"],
+                metadata=contender_data.get("metadata", {}),
+            )
+            for contender_data in entries
+        ]
 
     def load_framework(self, file_path: str) -> AssessmentFramework:
         """
@@ -90,47 +165,112 @@ class InputHandler:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Framework file not found: {file_path}")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            return self._parse_framework(_read_json(file_path))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in framework file: {e}")
+
+    def _parse_framework(self, data: Dict[str, Any]) -> AssessmentFramework:
+        """
+        Create an assessment framework from parsed framework file data.
+
+        Args:
+            data: Parsed contents of a framework file
+
+        Returns:
+            AssessmentFramework object
+
+        Raises:
+            ValueError: If the data is invalid
+        """
+        # Validate structure
+        if "assessment_framework" not in data:
+            raise ValueError(
+                "Invalid framework file format. Expected 'assessment_framework' object."
+            )
 
-            # Validate structure
-            if "assessment_framework" not in data:
+        framework_data = data["assessment_framework"]
+
+        # Validate required fields
+        required_fields = [
+            "id",
+            "description",
+            "evaluation_criteria",
+            "comparison_rules",
+            "scoring_system",
+        ]
+        for field in required_fields:
+            if field not in framework_data:
                 raise ValueError(
-                    "Invalid framework file format. Expected 'assessment_framework' object."
+                    f"Assessment framework missing required field: {field}"
                 )
 
-            framework_data = data["assessment_framework"]
-
-            # Validate required fields
-            required_fields = [
-                "id",
-                "description",
-                "evaluation_criteria",
-                "comparison_rules",
-                "scoring_system",
-            ]
-            for field in required_fields:
-                if field not in framework_data:
-                    raise ValueError(
-                        f"Assessment framework missing required field: {field}"
-                    )
-
-            # Create AssessmentFramework object
-            framework = AssessmentFramework(
-                id=framework_data["id"],
-                description=framework_data["description"],
-                evaluation_criteria=framework_data["evaluation_criteria"],
-                comparison_rules=framework_data["comparison_rules"],
-                scoring_system=framework_data["scoring_system"],
-            )
+        # Create AssessmentFramework object
+        framework = AssessmentFramework(
+            id=framework_data["id"],
+            description=framework_data["description"],
+            evaluation_criteria=framework_data["evaluation_criteria"],
+            comparison_rules=framework_data["comparison_rules"],
+            scoring_system=framework_data["scoring_system"],
+        )
 
-            # Validate framework
-            if not framework.validate():
-                raise ValueError("Invalid assessment framework")
+        # Validate framework
+        if not framework.validate():
+            raise ValueError("Invalid assessment framework")
+
+        return framework
+
+    def _find_input_data(
+        self,
+        directory: str,
+        json_files: List[str],
+        name_hint: str,
+        key_literal: bytes,
+        matches: Callable[[Any], bool],
+        parsed: Dict[str, Any],
+    ) -> Optional[Any]:
+        """
+        Find the parsed data of an input file in a directory.
 
-            return framework
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in framework file: {e}")
+        Files whose names contain the hint are tried first, so usually only
+        the file that is used gets parsed; the others are only parsed if none
+        of those match. Later files take precedence within each set. Files
+        that do not contain the quoted key at all, such as large tournament
+        results sharing the directory, are skipped without being parsed.
+
+        Args:
+            directory: Directory containing input files
+            json_files: Names of the JSON files in the directory
+            name_hint: Lowercase text expected in the file name
+            key_literal: Quoted top-level key the input file must contain
+            matches: Check of whether parsed data is the wanted input
+            parsed: Parsed data by file name, shared between lookups so no
+                file is parsed twice (None for unparseable files)
+
+        Returns:
+            Parsed data of the input file, or None if not found
+        """
+        named = [name for name in json_files if name_hint in name.lower()]
+        others = [name for name in json_files if name_hint not in name.lower()]
+
+        for filename in named[::-1] + others[::-1]:
+            file_path = os.path.join(directory, filename)
+            if filename not in parsed:
+                if not _file_contains(file_path, key_literal):
+                    continue
+                try:
+                    parsed[filename] = _read_json(file_path)
+                except Exception:
+                    parsed[filename] = None
+
+            data = parsed[filename]
+            try:
+                if data is not None and matches(data):
+                    return data
+            except TypeError:
+                # Not a JSON object, so not an input file
+                continue
+
+        return None
 
     def validate_input(
         self, contenders: List[Contender], framework: AssessmentFramework
@@ -150,11 +290,13 @@ class InputHandler:
             print("Tournament requires at least 2 contenders")
             return False
 
-        # Check for duplicate contender IDs
-        contender_ids = [c.id for c in contenders]
-        if len(contender_ids) != len(set(contender_ids)):
-            print("Duplicate contender IDs found")
-            return False
+        # Check for duplicate contender IDs, stopping at the first one
+        seen_ids = set()
+        for contender in contenders:
+            if contender.id in seen_ids:
+                print("Duplicate contender IDs found")
+                return False
+            seen_ids.add(contender.id)
 
         # Validate framework
         if not framework.validate():
@@ -175,34 +317,38 @@ class InputHandler:
         Returns:
             Tuple of (contenders, framework) or (None, None) if not found
         """
-        contenders_file = None
-        framework_file = None
-
         # Check if directory exists
         if not os.path.exists(directory) or not os.path.isdir(directory):
             return None, None
 
-        # Look for input files
-        for filename in os.listdir(directory):
-            if filename.endswith(".json"):
-                with open(
-                    os.path.join(directory, filename), "r", encoding="utf-8"
-                ) as f:
-                    try:
-                        data = json.load(f)
-                        if "contenders" in data:
-                            contenders_file = os.path.join(directory, filename)
-                        elif "assessment_framework" in data:
-                            framework_file = os.path.join(directory, filename)
-                    except:
-                        continue
-
-        if not contenders_file or not framework_file:
+        json_files = [
+            filename for filename in os.listdir(directory) if filename.endswith(".json")
+        ]
+        parsed = {}
+
+        contenders_data = self._find_input_data(
+            directory,
+            json_files,
+            "contender",
+            b'"contenders"',
+            lambda data: "contenders" in data,
+            parsed,
+        )
+        framework_data = self._find_input_data(
+            directory,
+            json_files,
+            "framework",
+            b'"assessment_framework"',
+            lambda data: "contenders" not in data and "assessment_framework" in data,
+            parsed,
+        )
+
+        if contenders_data is None or framework_data is None:
             return None, None
 
         try:
-            contenders = self.load_contenders(contenders_file)
-            framework = self.load_framework(framework_file)
+            contenders = self._parse_contenders(contenders_data)
+            framework = self._parse_framework(framework_data)
             return contenders, framework
         except Exception as e:
             print(f"Error loading input data: {e}")
@@ -2,21 +2,154 @@
 LLM manager for handling LLM API calls in the LLM Tournament application.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
+import logging
+import os
+import random
+import shelve
+import threading
 import time
-import re
-from typing import Dict, Any, Optional, List
-import traceback
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
+from contextlib import contextmanager, nullcontext
 
 from langchain.callbacks.manager import CallbackManager
 from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain.schema.output_parser import StrOutputParser
-from langchain.prompts import PromptTemplate
-from langchain.schema.runnable import RunnablePassthrough
 from langchain_community.llms import Ollama
 
+from managers.prompt_manager import CompiledTemplate, compile_template, render_template
 from models.match import Match
-from models.data_models import MatchResultModel, CriteriaScoreModel
+from models.assessment import AssessmentFramework
+from models.data_models import MatchResultModel
+
+# For faster JSON parsing
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# For keeping other processes out of the response cache while it is in use
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# JSON parser for extracted responses; both raise ValueError subclasses
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _render_prompt(prompt_content: str) -> str:
+    """
+    Unescape the doubled braces prompt templates use around literal JSON.
+
+    Args:
+        prompt_content: Prompt with its $variables already substituted
+
+    Returns:
+        Prompt text to send to the model
+    """
+    return prompt_content.replace("{{", "{").replace("}}", "}")
+
+
+def _backoff_delay(retry_delay: float, attempt: int) -> float:
+    """
+    Get the delay before a retry, doubling with each attempt.
+
+    Jitter keeps matches that failed together from all retrying at once.
+
+    Args:
+        retry_delay: Delay before the first retry in seconds
+        attempt: Number of attempts made so far
+
+    Returns:
+        Delay in seconds
+    """
+    return retry_delay * (2 ** (attempt - 1)) + random.uniform(0, retry_delay)
+
+
+# Response caches this process has open, by path, each with the lock its
+# users hold; None for caches that could not be opened. Managers share an
+# open cache, since shelve does not support concurrent writers
+_RESPONSE_CACHES: Dict[str, Optional[Tuple[shelve.Shelf, threading.Lock]]] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+
+
+def _get_response_cache(
+    cache_dir: str,
+) -> Optional[Tuple[shelve.Shelf, threading.Lock]]:
+    """
+    Get the response cache in a directory, opening it on first use.
+
+    The cache stays open until the process exits. Where the platform has
+    file locks, only one process has it open at a time; other processes
+    run without the cache rather than wait for it.
+
+    Args:
+        cache_dir: Directory of the response cache
+
+    Returns:
+        Tuple of (open cache, lock to hold while using it), or None if the
+        cache cannot be used
+    """
+    path = os.path.abspath(os.path.join(cache_dir, "responses"))
+    with _RESPONSE_CACHES_LOCK:
+        if path in _RESPONSE_CACHES:
+            return _RESPONSE_CACHES[path]
+
+        entry = None
+        lock_file = None
+        try:
+            lock_file = open(path + ".lock", "a")
+            if FCNTL_AVAILABLE:
+                # Released when the lock file is closed
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            cache = shelve.open(path)
+        except BlockingIOError:
+            print(f"WARNING: LLM response cache {path} is in use by another process")
+        except Exception as e:
+            print(f"WARNING: Could not open LLM response cache: {e}")
+        else:
+            entry = (cache, threading.Lock())
+            atexit.register(_close_response_cache, cache, lock_file)
+            lock_file = None
+        finally:
+            if lock_file is not None:
+                lock_file.close()
+
+        _RESPONSE_CACHES[path] = entry
+        return entry
+
+
+def _close_response_cache(cache: shelve.Shelf, lock_file) -> None:
+    """
+    Close a response cache opened by _get_response_cache.
+
+    Args:
+        cache: Open cache
+        lock_file: Lock file held while the cache is open
+    """
+    try:
+        cache.close()
+    finally:
+        lock_file.close()
+
+
+# Fields every match evaluation response must contain
+_REQUIRED_RESULT_FIELDS = frozenset(
+    ("criteria_scores", "contender1_score", "contender2_score", "rationale")
+)
+
+# Logger configured by LogManager
+_logger = logging.getLogger("llm_tournament")
+
+# Decoder for JSON objects embedded in surrounding response text
+_JSON_DECODER = json.JSONDecoder()
 
 
 class LLMManager:
@@ -41,6 +174,22 @@ class LLMManager:
         self.max_retries = config.get("llm", {}).get("max_retries", 3)
         self.retry_delay = config.get("llm", {}).get("retry_delay", 5)
 
+        # Number of matches evaluated at once by run_batch
+        self.max_concurrency = config.get("llm", {}).get("max_concurrency", 1)
+
+        # Number of matches against the same contender to evaluate in one
+        # request (1 sends a request per match)
+        self.marshal_batch_size = config.get("llm", {}).get("marshal_batch_size", 1)
+
+        # Directory of the match evaluation response cache (None disables it)
+        self.cache_dir = config.get("llm", {}).get("cache_dir")
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Match evaluation prompts with framework sections filled in, by
+        # framework identity
+        self._match_prompt_templates = {}
+
         # Initialize LLM clients
         self._initialize_llm_clients()
 
@@ -53,90 +202,462 @@ class LLMManager:
 
         # Setup Ollama client
         if provider == "ollama":
-            self.llm_clients[default_model] = Ollama(
-                model=default_model,
-                callback_manager=CallbackManager([StreamingStdOutCallbackHandler()]),
-                temperature=0.1,
-            )
+            self.llm_clients[default_model] = self._create_ollama_client(default_model)
 
             # Create clients for any different models in model_mapping
             model_mapping = self.config.get("llm", {}).get("model_mapping", {})
             for prompt_name, model_name in model_mapping.items():
                 if model_name != default_model and model_name not in self.llm_clients:
-                    self.llm_clients[model_name] = Ollama(
-                        model=model_name,
-                        callback_manager=CallbackManager(
-                            [StreamingStdOutCallbackHandler()]
-                        ),
-                        temperature=0.1,
+                    self.llm_clients[model_name] = self._create_ollama_client(
+                        model_name
                     )
 
-    def evaluate_match(self, match: Match) -> MatchResultModel:
+    def _create_ollama_client(self, model_name: str) -> Ollama:
         """
-        Evaluate a match using the appropriate LLM.
+        Create an Ollama client for a model.
+
+        Args:
+            model_name: Name of the Ollama model
+
+        Returns:
+            Ollama client instance
+        """
+        # Echoing every token costs a callback per token and interleaves the
+        # output of concurrent evaluations, so it is only done on request
+        callback_manager = None
+        if self.config.get("llm", {}).get("stream_stdout", False):
+            callback_manager = CallbackManager([StreamingStdOutCallbackHandler()])
+
+        return Ollama(
+            model=model_name,
+            callback_manager=callback_manager,
+            temperature=0.1,
+        )
+
+    def _get_match_prompt_template(
+        self, framework: AssessmentFramework
+    ) -> Tuple[CompiledTemplate, str]:
+        """
+        Get the match evaluation prompt with a framework's sections filled in.
+
+        Every match in a tournament shares one framework, so its sections are
+        formatted and substituted once, leaving only the contenders per match.
+
+        Args:
+            framework: Assessment framework of the match
+
+        Returns:
+            Tuple of (template taking the contender variables, its text with
+            whitespace collapsed)
+
+        Raises:
+            ValueError: If the prompt is not configured
+        """
+        # Keyed by identity; the framework is kept with its entry so the id
+        # cannot be reused by another object while cached
+        cached = self._match_prompt_templates.get(id(framework))
+        if cached is not None and cached[0] is framework:
+            return cached[1:]
+
+        partial_prompt = self.prompt_manager.get_partial_prompt(
+            "match_evaluation",
+            framework_description=framework.description,
+            formatted_criteria=framework.get_formatted_criteria(),
+            formatted_rules=framework.get_formatted_rules(),
+            formatted_scoring=framework.get_formatted_scoring(),
+        )
+        if not partial_prompt:
+            raise ValueError("Failed to load match_evaluation prompt")
+
+        template = compile_template(partial_prompt)
+        normalized = " ".join(partial_prompt.split())
+        self._match_prompt_templates[id(framework)] = (framework, template, normalized)
+        return template, normalized
+
+    def _build_match_request(self, match: Match) -> Tuple[Any, str, Tuple[str, str]]:
+        """
+        Build the LLM request that evaluates a match.
 
         Args:
             match: Match to evaluate
 
         Returns:
-            MatchResultModel with the evaluation result
+            Tuple of (LLM client, prompt text, response cache keys)
 
         Raises:
-            Exception: If evaluation fails and exceeds maximum retries
+            ValueError: If the prompt or model is not configured
         """
-        # Prepare the prompt variables
-        prompt_vars = {
-            "framework_description": match.assessment_framework.description,
-            "formatted_criteria": match.assessment_framework.get_formatted_criteria(),
-            "formatted_rules": match.assessment_framework.get_formatted_rules(),
-            "formatted_scoring": match.assessment_framework.get_formatted_scoring(),
+        # Fill the contenders into the prompt for the match's framework
+        template, normalized_template = self._get_match_prompt_template(
+            match.assessment_framework
+        )
+        contender_vars = {
             "contender1_id": match.contender1.id,
             "contender1_content": match.contender1.content,
             "contender2_id": match.contender2.id,
             "contender2_content": match.contender2.content,
         }
+        prompt_content = render_template(template, contender_vars)
 
-        # Get the prompt template
+        # Get the model to use
+        model_name = self.prompt_manager.get_model_for_prompt("match_evaluation")
+        llm = self.llm_clients.get(model_name)
+        if not llm:
+            raise ValueError(f"LLM model not configured: {model_name}")
+
+        # The prompt is complete, so it is sent to the model as is rather than
+        # through another template
+        prompt_text = _render_prompt(prompt_content)
+
+        # Identical prompts sent to the same model share a cached response.
+        # The second key also matches prompts whose template only differs in
+        # whitespace; contender content is compared exactly, since whitespace
+        # can matter there
+        exact_key = hashlib.blake2b(
+            f"{model_name}\0{prompt_text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        loose_key = hashlib.blake2b(
+            "\0".join(
+                (model_name, normalized_template, *contender_vars.values())
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+        return llm, prompt_text, (exact_key, f"loose:{loose_key}")
+
+    def _build_match_batch_request(self, matches: List[Match]) -> Tuple[Any, str]:
+        """
+        Build a single LLM request that evaluates several matches.
+
+        Args:
+            matches: Matches to evaluate, all with the same first contender
+                and assessment framework
+
+        Returns:
+            Tuple of (LLM client, prompt text)
+
+        Raises:
+            ValueError: If the matches cannot share a request, or the prompt
+                or model is not configured
+        """
+        first = matches[0]
+        for match in matches:
+            if (
+                match.contender1 is not first.contender1
+                or match.assessment_framework is not first.assessment_framework
+            ):
+                raise ValueError(
+                    "Matches evaluated together must share their first contender and framework"
+                )
+
+        framework = first.assessment_framework
+        opponents = "\n\n".join(
+            f"### Match {match.id}: {match.contender2.id}\n{match.contender2.content}"
+            for match in matches
+        )
         prompt_content = self.prompt_manager.get_prompt(
-            "match_evaluation", **prompt_vars
+            "match_batch_evaluation",
+            framework_description=framework.description,
+            formatted_criteria=framework.get_formatted_criteria(),
+            formatted_rules=framework.get_formatted_rules(),
+            formatted_scoring=framework.get_formatted_scoring(),
+            contender1_id=first.contender1.id,
+            contender1_content=first.contender1.content,
+            opponents=opponents,
         )
         if not prompt_content:
-            raise ValueError("Failed to load match_evaluation prompt")
+            raise ValueError("Failed to load match_batch_evaluation prompt")
 
-        # Get the model to use
-        model_name = self.prompt_manager.get_model_for_prompt("match_evaluation")
+        model_name = self.prompt_manager.get_model_for_prompt("match_batch_evaluation")
         llm = self.llm_clients.get(model_name)
         if not llm:
             raise ValueError(f"LLM model not configured: {model_name}")
 
-        # Create the prompt chain
-        prompt = PromptTemplate.from_template(prompt_content)
-        chain = prompt | llm | StrOutputParser()
+        return llm, _render_prompt(prompt_content)
+
+    def _parse_match_batch_result(
+        self, response: str, matches: List[Match]
+    ) -> List[Optional[MatchResultModel]]:
+        """
+        Parse the response to a multi-match request.
+
+        Args:
+            response: Response text from the LLM
+            matches: Matches the request evaluated
+
+        Returns:
+            Result for each match in order, None for matches the response has
+            no valid result for
+
+        Raises:
+            ValueError: If the response has no results object
+        """
+        json_data = self._extract_json(response, ("results",))
+        results = json_data.get("results") if isinstance(json_data, dict) else None
+        if not isinstance(results, dict):
+            raise ValueError("LLM response has no results object")
+
+        parsed = []
+        for match in matches:
+            if match.id not in results:
+                print(f"No result for match {match.id} in batch response")
+                parsed.append(None)
+                continue
+            try:
+                parsed.append(self._parse_match_result(results[match.id], match))
+            except ValueError as e:
+                print(f"No valid result for match {match.id} in batch response: {e}")
+                parsed.append(None)
+        return parsed
+
+    def evaluate_match_batch(
+        self, matches: List[Match]
+    ) -> List[Optional[MatchResultModel]]:
+        """
+        Evaluate several matches against the same contender in one request.
+
+        Args:
+            matches: Matches to evaluate, all with the same first contender
+                and assessment framework
+
+        Returns:
+            Result for each match in order, None for matches the response has
+            no valid result for
+
+        Raises:
+            Exception: If the request fails or its response cannot be parsed
+        """
+        llm, prompt_text = self._build_match_batch_request(matches)
+        return self._parse_match_batch_result(llm.invoke(prompt_text), matches)
+
+    async def aevaluate_match_batch(
+        self, matches: List[Match], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[Optional[MatchResultModel]]:
+        """
+        Evaluate several matches against the same contender in one request,
+        without blocking the event loop.
+
+        Args:
+            matches: Matches to evaluate, all with the same first contender
+                and assessment framework
+            semaphore: Optional semaphore limiting how many requests are in
+                flight; it is only held while the request is being made
+
+        Returns:
+            Result for each match in order, None for matches the response has
+            no valid result for
 
-        # Execute the chain
+        Raises:
+            Exception: If the request fails or its response cannot be parsed
+        """
+        llm, prompt_text = self._build_match_batch_request(matches)
+        async with semaphore or nullcontext():
+            response = await llm.ainvoke(prompt_text)
+        return self._parse_match_batch_result(response, matches)
+
+    def _get_cached_response(self, cache_keys: Tuple[str, ...]) -> Optional[str]:
+        """
+        Look up a cached LLM response.
+
+        Args:
+            cache_keys: Keys of the prompt sent to the model, in order of
+                preference
+
+        Returns:
+            Cached response text, or None if caching is disabled or it is missing
+        """
+        if not self.cache_dir:
+            return None
+        entry = _get_response_cache(self.cache_dir)
+        if entry is None:
+            return None
+
+        cache, lock = entry
+        try:
+            with lock:
+                for cache_key in cache_keys:
+                    response = cache.get(cache_key)
+                    if response is not None:
+                        return response
+            return None
+        except Exception as e:
+            print(f"WARNING: Could not read LLM response cache: {e}")
+            return None
+
+    def _cache_response(self, cache_keys: Tuple[str, ...], response: str) -> None:
+        """
+        Store an LLM response in the cache, if caching is enabled.
+
+        Args:
+            cache_keys: Keys of the prompt sent to the model
+            response: Response text to store
+        """
+        if not self.cache_dir:
+            return
+        entry = _get_response_cache(self.cache_dir)
+        if entry is None:
+            return
+
+        cache, lock = entry
         try:
-            # Directly invoke the chain with no additional inputs
-            # since the template already has all the variables
-            response = chain.invoke({})
+            with lock:
+                for cache_key in cache_keys:
+                    cache[cache_key] = response
+        except Exception as e:
+            print(f"WARNING: Could not write LLM response cache: {e}")
 
-            # Extract JSON from response (may be surrounded by markdown code blocks)
-            json_data = self._extract_json(response)
+    def evaluate_match(self, match: Match) -> MatchResultModel:
+        """
+        Evaluate a match using the appropriate LLM.
 
-            # Convert to MatchResultModel
-            result = self._parse_match_result(json_data, match)
+        Args:
+            match: Match to evaluate
+
+        Returns:
+            MatchResultModel with the evaluation result
+
+        Raises:
+            Exception: If evaluation fails and exceeds maximum retries
+        """
+        llm, prompt_text, cache_keys = self._build_match_request(match)
+        return self._invoke_match_request(match, llm, prompt_text, cache_keys)
+
+    def _invoke_match_request(
+        self, match: Match, llm: Any, prompt_text: str, cache_keys: Tuple[str, str]
+    ) -> MatchResultModel:
+        """
+        Send a built match evaluation request and parse its response.
+
+        Args:
+            match: Match being evaluated
+            llm: LLM client built by _build_match_request
+            prompt_text: Prompt text built by _build_match_request
+            cache_keys: Response cache keys built by _build_match_request
+
+        Returns:
+            MatchResultModel with the evaluation result
+
+        Raises:
+            Exception: If the request or parsing the response fails
+        """
+        with self._logging_match_errors(match):
+            cached_response = response = self._get_cached_response(cache_keys)
+            if response is None:
+                response = llm.invoke(prompt_text)
+
+            result = self._parse_match_response(response, match)
+
+            # Only cache responses that parsed, so retries ask the model again
+            if cached_response is None:
+                self._cache_response(cache_keys, response)
+
+            return result
+
+    async def aevaluate_match(self, match: Match) -> MatchResultModel:
+        """
+        Evaluate a match without blocking the event loop.
+
+        Args:
+            match: Match to evaluate
+
+        Returns:
+            MatchResultModel with the evaluation result
+
+        Raises:
+            Exception: If evaluation fails
+        """
+        llm, prompt_text, cache_keys = self._build_match_request(match)
+        return await self._ainvoke_match_request(match, llm, prompt_text, cache_keys)
+
+    async def _ainvoke_match_request(
+        self, match: Match, llm: Any, prompt_text: str, cache_keys: Tuple[str, str]
+    ) -> MatchResultModel:
+        """
+        Send a built match evaluation request and parse its response.
+
+        Args:
+            match: Match being evaluated
+            llm: LLM client built by _build_match_request
+            prompt_text: Prompt text built by _build_match_request
+            cache_keys: Response cache keys built by _build_match_request
+
+        Returns:
+            MatchResultModel with the evaluation result
+
+        Raises:
+            Exception: If the request or parsing the response fails
+        """
+        with self._logging_match_errors(match):
+            # The cache is read and written in a worker thread, so waiting
+            # for its lock or the disk does not block the event loop
+            cached_response = response = None
+            if self.cache_dir:
+                cached_response = response = await asyncio.to_thread(
+                    self._get_cached_response, cache_keys
+                )
+            if response is None:
+                # Only the request is awaited; parsing the response is quick
+                response = await llm.ainvoke(prompt_text)
+
+            result = self._parse_match_response(response, match)
+
+            # Only cache responses that parsed, so retries ask the model again
+            if cached_response is None and self.cache_dir:
+                await asyncio.to_thread(self._cache_response, cache_keys, response)
 
             return result
+
+    @contextmanager
+    def _logging_match_errors(self, match: Match) -> Iterator[None]:
+        """
+        Log an error evaluating a match, then let it propagate.
+
+        The caller reports the failure too, so the traceback is only
+        formatted when debug logging wants it.
+
+        Args:
+            match: Match being evaluated
+        """
+        try:
+            yield
         except Exception as e:
-            print(f"Error evaluating match {match.id}: {e}")
-            print(traceback.format_exc())
+            _logger.error(
+                "Error evaluating match %s: %s",
+                match.id,
+                e,
+                exc_info=_logger.isEnabledFor(logging.DEBUG),
+            )
             raise
 
-    def _extract_json(self, text: str) -> Dict[str, Any]:
+    def _parse_match_response(self, response: str, match: Match) -> MatchResultModel:
+        """
+        Parse and validate the response to a match evaluation request.
+
+        Args:
+            response: Response text from the LLM, which may surround its JSON
+                with markdown code blocks
+            match: Match being evaluated
+
+        Returns:
+            MatchResultModel with the evaluation result
+
+        Raises:
+            ValueError: If the response holds no valid result
+        """
+        json_data = self._extract_json(response, _REQUIRED_RESULT_FIELDS)
+        return self._parse_match_result(json_data, match)
+
+    def _extract_json(
+        self, text: str, required_keys: Iterable[str] = ()
+    ) -> Dict[str, Any]:
         """
         Extract JSON from response text, handling markdown code blocks.
 
         Args:
             text: Response text that may contain JSON
+            required_keys: Top-level keys an object found embedded in other
+                text must have; nested objects such as a single criterion's
+                scores are skipped when the object around them is malformed
 
         Returns:
             Parsed JSON data
@@ -144,29 +665,59 @@ class LLMManager:
         Raises:
             ValueError: If JSON cannot be parsed
         """
+        # The prompt asks for plain JSON, so try parsing that directly first
+        stripped = text.strip()
+        if stripped.startswith("{"):
+            try:
+                return _json_loads(stripped)
+            except ValueError:
+                pass
+
         # Try to extract JSON from markdown code blocks
-        json_matches = re.findall(r"```(?:json)?\s*([\s\S]*?)```", text)
-        if json_matches:
-            for json_text in json_matches:
-                try:
-                    return json.loads(json_text.strip())
-                except:
-                    continue
+        start = text.find("```")
+        while start != -1:
+            end = text.find("```", start + 3)
+            if end == -1:
+                break
+
+            block = text[start + 3 : end]
+            if block.startswith("json"):
+                block = block[4:]
+            try:
+                return _json_loads(block.strip())
+            except ValueError:
+                pass
+
+            start = text.find("```", end + 3)
 
         # If no JSON found in code blocks, try parsing the entire text
-        try:
-            return json.loads(text.strip())
-        except:
-            pass
-
-        # Look for parts that might be JSON (between curly braces)
-        json_matches = re.findall(r"{[\s\S]*}", text)
-        if json_matches:
-            for json_text in json_matches:
-                try:
-                    return json.loads(json_text.strip())
-                except:
-                    continue
+        # (already tried above if it starts with an object)
+        if not stripped.startswith("{"):
+            try:
+                return _json_loads(stripped)
+            except ValueError:
+                pass
+
+        # Try the outermost braces, the whole object if the text surrounds
+        # it with prose (already tried above if nothing surrounds it)
+        start = text.find("{")
+        end = text.rfind("}") + 1
+        if start != -1 and end > start and text[start:end] != stripped:
+            try:
+                return _json_loads(text[start:end])
+            except ValueError:
+                pass
+
+        # Look for a JSON object embedded in the text; raw_decode stops at the
+        # brace closing the object, so trailing text does not break parsing
+        while start != -1:
+            try:
+                data = _JSON_DECODER.raw_decode(text, start)[0]
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and all(key in data for key in required_keys):
+                return data
+            start = text.find("{", start + 1)
 
         raise ValueError("Could not extract valid JSON from response")
 
@@ -186,16 +737,17 @@ class LLMManager:
         Raises:
             ValueError: If JSON data is invalid
         """
-        # Validate required fields
-        required_fields = [
-            "criteria_scores",
-            "contender1_score",
-            "contender2_score",
-            "rationale",
-        ]
-        for field in required_fields:
-            if field not in json_data:
-                raise ValueError(f"Missing required field in LLM response: {field}")
+        # Validate required fields, reporting all missing ones at once
+        if not isinstance(json_data, dict):
+            raise ValueError("LLM response is not a JSON object")
+        missing = _REQUIRED_RESULT_FIELDS.difference(json_data)
+        if missing:
+            raise ValueError(
+                f"Missing required fields in LLM response: {', '.join(sorted(missing))}"
+            )
+
+        contender1_total = float(json_data["contender1_score"])
+        contender2_total = float(json_data["contender2_score"])
 
         # Parse criteria scores
         criteria_scores = {}
@@ -211,76 +763,238 @@ class LLMManager:
                 contender1_score = float(scores.get("contender1", 5.0))
                 contender2_score = float(scores.get("contender2", 5.0))
 
-                criteria_scores[criterion_name] = CriteriaScoreModel(
-                    contender1=contender1_score, contender2=contender2_score
-                )
+                criteria_scores[criterion_name] = {
+                    "contender1": contender1_score,
+                    "contender2": contender2_score,
+                }
             except Exception as e:
                 print(
                     f"WARNING: Error parsing scores for criterion {criterion_name}: {e}"
                 )
                 # Provide default scores rather than failing
-                criteria_scores[criterion_name] = CriteriaScoreModel(
-                    contender1=5.0, contender2=5.0
-                )
+                criteria_scores[criterion_name] = {
+                    "contender1": 5.0,
+                    "contender2": 5.0,
+                }
 
         # If we couldn't parse any criteria scores, create a default one
         if not criteria_scores:
             default_criterion = "Overall"
-            criteria_scores[default_criterion] = CriteriaScoreModel(
-                contender1=float(json_data["contender1_score"]),
-                contender2=float(json_data["contender2_score"]),
-            )
+            criteria_scores[default_criterion] = {
+                "contender1": contender1_total,
+                "contender2": contender2_total,
+            }
 
         # Determine winner if not provided
         winner = json_data.get("winner")
         if winner is None:
             # In case of a tie
-            if json_data["contender1_score"] == json_data["contender2_score"]:
+            if contender1_total == contender2_total:
                 winner = None
-            elif json_data["contender1_score"] > json_data["contender2_score"]:
+            elif contender1_total > contender2_total:
                 winner = match.contender1.id
             else:
                 winner = match.contender2.id
+        elif winner == match.contender1.id:
+            # Use the contender's own ID object, so comparisons against it
+            # succeed on identity alone
+            winner = match.contender1.id
+        elif winner == match.contender2.id:
+            winner = match.contender2.id
 
-        # Create MatchResultModel
-        return MatchResultModel(
-            winner=winner,
-            contender1_score=float(json_data["contender1_score"]),
-            contender2_score=float(json_data["contender2_score"]),
-            rationale=json_data["rationale"],
-            criteria_scores=criteria_scores,
+        # Create MatchResultModel, validating the criteria scores with it in
+        # a single pass
+        return MatchResultModel.model_validate(
+            {
+                "winner": winner,
+                "contender1_score": contender1_total,
+                "contender2_score": contender2_total,
+                "rationale": json_data["rationale"],
+                "criteria_scores": criteria_scores,
+            }
         )
 
+    def _build_retry_request(
+        self, match: Match
+    ) -> Optional[Tuple[Any, str, Tuple[str, str]]]:
+        """
+        Build the request every attempt to evaluate a match sends.
+
+        A missing prompt or model fails the same way on every attempt, so
+        the request is built once and the match is not retried if it cannot
+        be.
+
+        Args:
+            match: Match to evaluate
+
+        Returns:
+            Request built by _build_match_request, or None if it cannot be built
+        """
+        try:
+            return self._build_match_request(match)
+        except ValueError as e:
+            print(f"Cannot evaluate match {match.id}: {e}")
+            return None
+
+    def _next_retry_delay(
+        self, match: Match, attempts: int, error: Exception
+    ) -> Optional[float]:
+        """
+        Report a failed attempt to evaluate a match and get the delay before
+        the next one, with exponential backoff.
+
+        Args:
+            match: Match being evaluated
+            attempts: Number of attempts made so far
+            error: Error the last attempt failed with
+
+        Returns:
+            Delay in seconds, or None once max_retries attempts have been made
+        """
+        max_retries = self.max_retries
+        if attempts >= max_retries:
+            print(f"Failed to evaluate match {match.id} after {max_retries} retries")
+            return None
+
+        delay = _backoff_delay(self.retry_delay, attempts)
+        print(
+            f"Retry {attempts}/{max_retries} for match {match.id} in {delay:.1f} seconds. Error: {error}"
+        )
+        return delay
+
     def retry_evaluation(self, match: Match) -> Optional[MatchResultModel]:
         """
         Retry evaluation with exponential backoff.
 
+        Each attempt is counted in the match's retries.
+
         Args:
             match: Match to evaluate
 
         Returns:
             MatchResultModel if successful, None otherwise
         """
-        retries = 0
-        max_retries = self.max_retries
+        match.retries += 1
+        request = self._build_retry_request(match)
+        if request is None:
+            return None
 
-        while retries < max_retries:
+        attempts = 1
+        while True:
             try:
-                return self.evaluate_match(match)
+                return self._invoke_match_request(match, *request)
             except Exception as e:
-                retries += 1
-                if retries >= max_retries:
-                    print(
-                        f"Failed to evaluate match {match.id} after {max_retries} retries"
-                    )
+                delay = self._next_retry_delay(match, attempts, e)
+                if delay is None:
                     return None
+                time.sleep(delay)
+                attempts += 1
+                match.retries += 1
 
-                # Exponential backoff
-                delay = self.retry_delay * (2 ** (retries - 1))
-                print(
-                    f"Retry {retries}/{max_retries} for match {match.id} in {delay} seconds. Error: {e}"
+    async def aretry_evaluation(
+        self, match: Match, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Optional[MatchResultModel]:
+        """
+        Retry evaluation with exponential backoff without blocking the event loop.
+
+        Each attempt is counted in the match's retries.
+
+        Args:
+            match: Match to evaluate
+            semaphore: Optional semaphore limiting how many requests are in
+                flight; it is only held while a request is being made
+
+        Returns:
+            MatchResultModel if successful, None otherwise
+        """
+        match.retries += 1
+        request = self._build_retry_request(match)
+        if request is None:
+            return None
+
+        attempts = 1
+        while True:
+            try:
+                async with semaphore or nullcontext():
+                    return await self._ainvoke_match_request(match, *request)
+            except Exception as e:
+                delay = self._next_retry_delay(match, attempts, e)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+                attempts += 1
+                match.retries += 1
+
+    async def run_batch(
+        self,
+        matches: List[Match],
+        concurrency: Optional[int] = None,
+        groups: Optional[List[List[int]]] = None,
+        on_result: Optional[Callable[[int], None]] = None,
+    ) -> List[Optional[MatchResultModel]]:
+        """
+        Evaluate matches concurrently, with retries.
+
+        Args:
+            matches: Matches to evaluate
+            concurrency: Maximum number of requests in flight at once
+                (defaults to the llm.max_concurrency setting)
+            groups: Optional indices into matches of the matches to evaluate
+                together in a single request; each group must share its first
+                contender and framework. Matches a group's request yields no
+                result for are evaluated on their own afterwards
+            on_result: Optional callback given the index of each match as
+                its result arrives, for reporting progress
+
+        Returns:
+            Result for each match in order, None for matches that failed
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.max_concurrency))
+
+        # Each match builds its prompt before waiting for a slot, so prompts
+        # are rendered while earlier requests are in flight, and matches
+        # backing off between retries do not hold a slot
+        if not groups:
+            groups = [[i] for i in range(len(matches))]
+
+        results = [None] * len(matches)
+
+        def record(i: int, result: Optional[MatchResultModel]) -> None:
+            results[i] = result
+            if result is not None and on_result is not None:
+                on_result(i)
+
+        async def evaluate_single(i: int) -> None:
+            record(i, await self.aretry_evaluation(matches[i], semaphore))
+
+        async def evaluate_group(group: List[int]) -> None:
+            if len(group) == 1:
+                await evaluate_single(group[0])
+                return
+
+            # The shared request is one attempt at each of its matches
+            for i in group:
+                matches[i].retries += 1
+            try:
+                group_results = await self.aevaluate_match_batch(
+                    [matches[i] for i in group], semaphore
                 )
-                time.sleep(delay)
+            except Exception as e:
+                print(f"Batch evaluation of {len(group)} matches failed: {e}")
+                return
+            for i, result in zip(group, group_results):
+                record(i, result)
+
+        await asyncio.gather(*(evaluate_group(group) for group in groups))
+
+        # Fall back to evaluating the matches the batched requests missed
+        # one at a time
+        missed = [
+            i for group in groups if len(group) > 1 for i in group if results[i] is None
+        ]
+        await asyncio.gather(*(evaluate_single(i) for i in missed))
+
+        return results
 
     def validate_response(self, response: str, expected_format: str) -> Dict[str, Any]:
         """
@@ -307,14 +1021,10 @@ class LLMManager:
         if not llm:
             raise ValueError(f"LLM model not configured: {model_name}")
 
-        # Create the prompt chain
-        prompt = PromptTemplate.from_template(prompt_content)
-        chain = prompt | llm | StrOutputParser()
-
-        # Execute the chain
+        # Send the prompt
         try:
-            validation_response = chain.invoke({})
-            json_data = self._extract_json(validation_response)
+            validation_response = llm.invoke(_render_prompt(prompt_content))
+            json_data = self._extract_json(validation_response, ("is_valid",))
 
             # Check if validation was successful
             if json_data.get("is_valid", False):
@@ -2,9 +2,11 @@
 Logging manager for the LLM Tournament application.
 """
 
+import atexit
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, Any, Optional
 
 from models.tournament import Tournament
@@ -16,16 +18,39 @@ class LogManager:
     Manages logging throughout the application.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        name: str = "llm_tournament",
+        console: Optional[bool] = None,
+        inherit_handlers: bool = False,
+    ):
         """
         Initialize the logging manager with configuration.
 
         Args:
             config: Configuration settings
+            name: Name of the logger to set up; tournaments running side by
+                side in one process each need a logger of their own
+            console: Whether to also log to the console, overriding the
+                logging.console setting
+            inherit_handlers: Whether to pass records on to the handlers of
+                the parent logger instead of adding handlers, so loggers
+                sharing a log file share the handler writing to it
         """
         self.config = config
+        self.name = name
+        self.console = console
+        self.inherit_handlers = inherit_handlers
         self.logger = None
 
+        # Background thread writing queued records to the log file
+        self._listener = None
+
+        # Handlers this manager added to the logger; those added by anyone
+        # else are left alone
+        self._handlers = []
+
         # Configure logging
         self.configure(config)
 
@@ -49,12 +74,22 @@ class LogManager:
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
         # Create logger
-        self.logger = logging.getLogger("llm_tournament")
+        self.logger = logging.getLogger(self.name)
         self.logger.setLevel(level)
 
-        # Clear existing handlers
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
+        if self.inherit_handlers:
+            self.close()
+            self.logger.propagate = True
+            return
+
+        # The handlers below are the logger's only output; records are not
+        # also passed on to handlers the host program set up (for example
+        # when run_multiple_tournaments runs tournaments in its own process)
+        self.logger.propagate = False
+
+        # Remove the handlers of an earlier configuration, flushing records
+        # queued for them
+        self.close()
 
         # Create file handler
         file_handler = RotatingFileHandler(
@@ -66,14 +101,53 @@ class LogManager:
             )
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+
+        # Queue file records so logging calls do not wait on disk writes; a
+        # listener thread writes them out
+        log_queue = queue.SimpleQueue()
+        self._add_handler(QueueHandler(log_queue))
+        self._listener = QueueListener(log_queue, file_handler)
+        self._listener.start()
+
+        # Make sure queued records reach the file however the program exits
+        atexit.register(self.close)
 
         # Create console handler if enabled
-        if logging_config.get("console", True):
+        console = self.console
+        if console is None:
+            console = logging_config.get("console", True)
+        if console:
             console_handler = logging.StreamHandler()
             console_formatter = logging.Formatter("%(levelname)s: %(message)s")
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+            self._add_handler(console_handler)
+
+    def _add_handler(self, handler: logging.Handler) -> None:
+        """
+        Add a handler to the logger, to be removed again by close.
+
+        Args:
+            handler: Handler to add
+        """
+        self.logger.addHandler(handler)
+        self._handlers.append(handler)
+
+    def close(self) -> None:
+        """
+        Write out queued log records, stop the listener thread and remove
+        the handlers this manager added.
+        """
+        if self._listener:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            atexit.unregister(self.close)
+
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self._handlers = []
 
     def log_info(self, message: str) -> None:
         """
@@ -160,8 +234,8 @@ class LogManager:
         self.logger.info(f"Tournament {tournament.id} completed")
 
         # Log top contenders
-        standings = tournament.get_standings()
-        for i, contender in enumerate(standings[:3], 1):
+        standings = tournament.get_standings(top_k=3)
+        for i, contender in enumerate(standings, 1):
             self.logger.info(
                 f"Rank {i}: {contender['id']} - "
                 f"Wins: {contender['stats']['wins']}, "
@@ -4,6 +4,7 @@ Output handler for the LLM Tournament application.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -11,6 +12,38 @@ from models.tournament import Tournament
 from models.match import Match
 from models.data_models import TournamentResultsModel
 
+# For faster JSON serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Keep Windows from translating line endings in files written with os.write
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Number of threads writing match result files at once
+_MATCH_EXPORT_WORKERS = 8
+
+
+def _write_file_bytes(file_path: str, data: bytes) -> None:
+    """
+    Write a whole file with unbuffered OS calls, replacing any existing file.
+
+    Args:
+        file_path: Path to the file
+        data: File contents
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        # A single write can come up short, so keep going until it is all out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
 
 class OutputHandler:
     """
@@ -54,12 +87,18 @@ class OutputHandler:
         # Create the results model
         results_model = tournament.export_results()
 
-        # Convert to JSON
-        results_json = results_model.model_dump_json(indent=2)
+        # Convert to JSON; orjson writes the same output as Pydantic, faster
+        if ORJSON_AVAILABLE:
+            results_json = orjson.dumps(
+                results_model.model_dump(),
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            results_json = results_model.model_dump_json(indent=2).encode("utf-8")
 
         # Save to file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(results_json)
+        _write_file_bytes(output_path, results_json)
 
         return output_path
 
@@ -82,14 +121,36 @@ class OutputHandler:
 
         if result:
             # Convert to JSON
-            result_json = json.dumps(result, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                result_json = orjson.dumps(
+                    result, default=str, option=orjson.OPT_INDENT_2
+                )
+            else:
+                result_json = json.dumps(result, indent=2, default=str).encode("utf-8")
 
             # Save to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(result_json)
+            _write_file_bytes(file_path, result_json)
 
         return file_path
 
+    def export_match_results(self, matches: List[Match]) -> List[str]:
+        """
+        Export the results of several matches, one JSON file per match.
+
+        The files are written on a thread pool so their disk writes overlap.
+
+        Args:
+            matches: Matches to export
+
+        Returns:
+            Paths to the exported files, in match order
+        """
+        if len(matches) <= 1:
+            return [self.export_match_result(match) for match in matches]
+
+        with ThreadPoolExecutor(max_workers=_MATCH_EXPORT_WORKERS) as executor:
+            return list(executor.map(self.export_match_result, matches))
+
     def format_standings(self, standings: List[Dict[str, Any]]) -> str:
         """
         Format standings for display/export.
@@ -100,59 +161,57 @@ class OutputHandler:
         Returns:
             Formatted standings string
         """
+        # Truncate long contender names once, measuring widths from the result
+        display_names = [
+            (
+                contender["content"]
+                if len(contender["content"]) <= 20
+                else contender["content"][:17] + "..."
+            )
+            for contender in standings
+        ]
+
         # Determine column widths
         rank_width = max(4, len(str(len(standings))))
-        name_width = max(
-            10,
-            max(
-                (
-                    len(c["content"])
-                    if len(c["content"]) <= 20
-                    else len(c["content"][:17] + "...")
-                )
-                for c in standings
-            ),
-        )
+        name_width = max(10, max(len(name) for name in display_names))
         stat_width = 8
 
+        # The same separator line opens and closes the header and the table
+        separator = (
+            f"+{'-' * (rank_width + 2)}+{'-' * (name_width + 2)}+"
+            + f"{'-' * (stat_width + 2)}+" * 4
+        )
+
         # Format header
-        header = f"+{'-' * (rank_width + 2)}+{'-' * (name_width + 2)}+{'-' * (stat_width + 2)}+"
-        header += f"{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+\n"
-        header += f"| {'Rank'.ljust(rank_width)} | {'Contender'.ljust(name_width)} | "
-        header += f"{'Wins'.ljust(stat_width)} | {'Losses'.ljust(stat_width)} | "
-        header += f"{'Points'.ljust(stat_width)} | {'Win Rate'.ljust(stat_width)} |\n"
-        header += f"+{'-' * (rank_width + 2)}+{'-' * (name_width + 2)}+{'-' * (stat_width + 2)}+"
-        header += f"{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+\n"
+        lines = [
+            separator,
+            f"| {'Rank'.ljust(rank_width)} | {'Contender'.ljust(name_width)} | "
+            f"{'Wins'.ljust(stat_width)} | {'Losses'.ljust(stat_width)} | "
+            f"{'Points'.ljust(stat_width)} | {'Win Rate'.ljust(stat_width)} |",
+            separator,
+        ]
 
         # Format rows
-        rows = ""
-        for contender in standings:
-            # Truncate long contender names
-            display_name = contender["content"]
-            if len(display_name) > 20:
-                display_name = display_name[:17] + "..."
+        for contender, display_name in zip(standings, display_names):
+            stats = contender["stats"]
 
             # Calculate win rate
             win_rate = 0
-            if contender["stats"]["matches_played"] > 0:
-                win_rate = (
-                    contender["stats"]["wins"]
-                    / contender["stats"]["matches_played"]
-                    * 100
-                )
+            if stats["matches_played"] > 0:
+                win_rate = stats["wins"] / stats["matches_played"] * 100
 
             # Format row
-            row = f"| {str(contender['rank']).ljust(rank_width)} | {display_name.ljust(name_width)} | "
-            row += f"{str(contender['stats']['wins']).ljust(stat_width)} | "
-            row += f"{str(contender['stats']['losses']).ljust(stat_width)} | "
-            row += f"{str(contender['stats']['points']).ljust(stat_width)} | "
-            row += f"{f'{win_rate:.1f}%'.ljust(stat_width)} |\n"
-            rows += row
+            lines.append(
+                f"| {str(contender['rank']).ljust(rank_width)} | {display_name.ljust(name_width)} | "
+                f"{str(stats['wins']).ljust(stat_width)} | "
+                f"{str(stats['losses']).ljust(stat_width)} | "
+                f"{str(stats['points']).ljust(stat_width)} | "
+                f"{f'{win_rate:.1f}%'.ljust(stat_width)} |"
+            )
 
-        footer = f"+{'-' * (rank_width + 2)}+{'-' * (name_width + 2)}+{'-' * (stat_width + 2)}+"
-        footer += f"{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+{'-' * (stat_width + 2)}+"
+        lines.append(separator)
 
-        return header + rows + footer
+        return "\n".join(lines)
 
     def format_match_result(self, match: Match) -> str:
         """
@@ -175,19 +234,19 @@ class OutputHandler:
             winner_str = f"Draw: ({score1:.1f} vs {score2:.1f})"
 
         # Format criteria scores
-        criteria_scores = []
-        for name, scores in match.result.criteria_scores.items():
-            criteria_scores.append(
-                f"{name}: {scores.contender1:.1f} vs {scores.contender2:.1f}"
-            )
+        criteria_str = ", ".join(
+            f"{name}: {scores.contender1:.1f} vs {scores.contender2:.1f}"
+            for name, scores in match.result.criteria_scores.items()
+        )
 
-        criteria_str = ", ".join(criteria_scores)
+        # Shorten long rationales
+        rationale = match.result.rationale
+        if len(rationale) > 100:
+            rationale = rationale[:100] + "..."
 
         return (
             f"Match {match.id}: {match.contender1.id} vs {match.contender2.id}\n"
-            + f"{winner_str}\n"
-            + f"Scores by criteria: {criteria_str}\n"
-            + f"Rationale: {match.result.rationale[:100]}..."
-            if len(match.result.rationale) > 100
-            else match.result.rationale
+            f"{winner_str}\n"
+            f"Scores by criteria: {criteria_str}\n"
+            f"Rationale: {rationale}"
         )
@@ -4,9 +4,68 @@ Prompt manager for the LLM Tournament application.
 
 import os
 import re
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from string import Template
 
+# A template compiled into a %-format string and its variables in order, each
+# with the placeholder text to restore if no value is given for it
+CompiledTemplate = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Number of rendered prompts kept by each PromptManager
+_RENDER_CACHE_SIZE = 512
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Compile a $variable template for repeated rendering.
+
+    The template is parsed once into a %-format string, so rendering it is a
+    single C-level format operation instead of a regex scan of the template.
+
+    Args:
+        template: Template text using string.Template syntax
+
+    Returns:
+        Compiled template for render_template
+    """
+    parts = []
+    variables = []
+    position = 0
+    for match in Template.pattern.finditer(template):
+        parts.append(template[position : match.start()].replace("%", "%%"))
+        name = match.group("named") or match.group("braced")
+        if name is not None:
+            parts.append("%s")
+            variables.append((name, match.group(0)))
+        else:
+            # Both a $$ escape and a stray $ render as a single $
+            parts.append("$")
+        position = match.end()
+    parts.append(template[position:].replace("%", "%%"))
+
+    return "".join(parts), tuple(variables)
+
+
+def render_template(compiled: CompiledTemplate, values: Dict[str, Any]) -> str:
+    """
+    Render a compiled template, leaving variables without a value in place.
+
+    Gives the same result as string.Template(template).safe_substitute(values).
+
+    Args:
+        compiled: Template compiled by compile_template
+        values: Variables to substitute
+
+    Returns:
+        Rendered text
+    """
+    format_string, variables = compiled
+    return format_string % tuple(
+        values[name] if name in values else placeholder
+        for name, placeholder in variables
+    )
+
 
 class PromptManager:
     """
@@ -25,31 +84,67 @@ class PromptManager:
         self.prompt_directory = prompt_directory
         self.config = config
         self.prompt_templates = {}
+        # Paths of the prompt files by prompt name; each file is only read
+        # the first time its prompt is requested
+        self._prompt_paths = {}
         self.model_mapping = config.get("llm", {}).get("model_mapping", {})
         self.default_model = config.get("llm", {}).get("default_model", "phi4")
 
-        # Load all prompt templates
+        # Compiled templates by prompt name, each stored with the template
+        # text it was compiled from
+        self._compiled_templates = {}
+
+        # Recently rendered prompts, so repeated requests for the same prompt
+        # (e.g. rematches or retries) skip rendering
+        self._render_cached = lru_cache(maxsize=_RENDER_CACHE_SIZE)(self._render)
+
+        # Find the prompt templates
         self._load_prompt_templates()
 
     def _load_prompt_templates(self) -> None:
-        """Load all prompt templates from the prompt directory."""
-        if not os.path.exists(self.prompt_directory):
+        """Find the prompt templates in the prompt directory."""
+        try:
+            entries = os.scandir(self.prompt_directory)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Prompt directory not found: {self.prompt_directory}"
-            )
+            ) from None
 
-        for filename in os.listdir(self.prompt_directory):
-            if filename.endswith(".md"):
-                prompt_name = os.path.splitext(filename)[0]
-                file_path = os.path.join(self.prompt_directory, filename)
+        # Directory entries carry their file type, so this takes a single
+        # directory listing rather than a stat call per file
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    prompt_name = os.path.splitext(entry.name)[0]
+                    self._prompt_paths[prompt_name] = entry.path
 
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        template_content = f.read()
+    def _get_template(self, prompt_name: str) -> Optional[str]:
+        """
+        Get the text of a prompt template, reading its file on first use.
 
-                    self.prompt_templates[prompt_name] = template_content
-                except Exception as e:
-                    print(f"Error loading prompt template {filename}: {e}")
+        Args:
+            prompt_name: Name of the prompt (without extension)
+
+        Returns:
+            Template text or None if not found
+        """
+        template = self.prompt_templates.get(prompt_name)
+        if template is not None:
+            return template
+
+        file_path = self._prompt_paths.get(prompt_name)
+        if file_path is None:
+            return None
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                template = f.read()
+        except Exception as e:
+            print(f"Error loading prompt template {os.path.basename(file_path)}: {e}")
+            return None
+
+        self.prompt_templates[prompt_name] = template
+        return template
 
     def get_prompt(self, prompt_name: str, **kwargs: Any) -> Optional[str]:
         """
@@ -62,21 +157,89 @@ class PromptManager:
         Returns:
             Formatted prompt string or None if not found
         """
-        if prompt_name not in self.prompt_templates:
+        template = self._get_template(prompt_name)
+        if template is None:
             print(f"Prompt template not found: {prompt_name}")
             return None
 
-        template = self.prompt_templates[prompt_name]
+        items = tuple(sorted(kwargs.items()))
 
-        # Replace $variable with value using Python's string Template
-        # This is more reliable than using prompt templating for complex templates with JSON
-        template_obj = Template(template)
         try:
-            return template_obj.safe_substitute(**kwargs)
+            try:
+                hash(items)
+            except TypeError:
+                # Unhashable values cannot be cached
+                return self._render(prompt_name, template, items)
+            return self._render_cached(prompt_name, template, items)
         except Exception as e:
             print(f"Error formatting prompt template {prompt_name}: {e}")
             return None
 
+    def _render(
+        self, prompt_name: str, template: str, items: Tuple[Tuple[str, Any], ...]
+    ) -> str:
+        """
+        Render a prompt template with the given variables.
+
+        Args:
+            prompt_name: Name of the prompt
+            template: Template text of the prompt
+            items: Sorted (name, value) pairs of the variables
+
+        Returns:
+            Formatted prompt string
+        """
+        # Replace $variable with value using Python's string Template syntax
+        # This is more reliable than using prompt templating for complex templates with JSON
+        return render_template(self._get_compiled(prompt_name, template), dict(items))
+
+    def _get_compiled(self, prompt_name: str, template: str) -> CompiledTemplate:
+        """
+        Get the compiled form of a prompt template, compiling it on first use.
+
+        Args:
+            prompt_name: Name of the prompt
+            template: Template text of the prompt
+
+        Returns:
+            Compiled template
+        """
+        cached = self._compiled_templates.get(prompt_name)
+        if cached is None or cached[0] is not template:
+            cached = (template, compile_template(template))
+            self._compiled_templates[prompt_name] = cached
+        return cached[1]
+
+    def get_partial_prompt(self, prompt_name: str, **kwargs: Any) -> Optional[str]:
+        """
+        Get a prompt with some of its variables filled in.
+
+        The result is itself a template: substituting the remaining variables
+        into it gives the same prompt as passing all of them to get_prompt, so
+        variables that are fixed across many prompts only need filling once.
+
+        Args:
+            prompt_name: Name of the prompt (without extension)
+            **kwargs: Variables to substitute in the template
+
+        Returns:
+            Partially formatted template string or None if not found
+        """
+        template = self._get_template(prompt_name)
+        if template is None:
+            print(f"Prompt template not found: {prompt_name}")
+            return None
+
+        def substitute(match) -> str:
+            name = match.group("named") or match.group("braced")
+            if name in kwargs:
+                # Escape the value so the second pass leaves it untouched
+                return str(kwargs[name]).replace("$", "$$")
+            # Keep escapes and the remaining variables for the second pass
+            return match.group(0)
+
+        return Template.pattern.sub(substitute, template)
+
     def get_model_for_prompt(self, prompt_name: str) -> str:
         """
         Get the model to use for a specific prompt.
@@ -91,8 +254,13 @@ class PromptManager:
 
     def create_default_prompts(self) -> None:
         """Create default prompt templates if they don't exist."""
-        if not os.path.exists(self.prompt_directory):
+        # Names already in the directory, from a single listing
+        try:
+            with os.scandir(self.prompt_directory) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
             os.makedirs(self.prompt_directory)
+            existing = set()
 
         default_prompts = {
             "match_evaluation.md": self._get_default_match_evaluation_prompt(),
@@ -102,12 +270,13 @@ class PromptManager:
         }
 
         for filename, content in default_prompts.items():
-            file_path = os.path.join(self.prompt_directory, filename)
-            if not os.path.exists(file_path):
+            if filename not in existing:
+                file_path = os.path.join(self.prompt_directory, filename)
                 try:
                     with open(file_path, "w", encoding="utf-8") as f:
                         f.write(content)
                     print(f"Created default prompt template: {filename}")
+                    self._prompt_paths[os.path.splitext(filename)[0]] = file_path
                 except Exception as e:
                     print(f"Error creating default prompt template {filename}: {e}")
 
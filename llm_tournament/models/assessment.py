@@ -2,7 +2,7 @@
 Assessment framework class for the LLM Tournament application.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, NamedTuple
 from models.data_models import (
     AssessmentFrameworkModel,
     CriterionModel,
@@ -10,6 +10,14 @@ from models.data_models import (
 )
 
 
+class Criterion(NamedTuple):
+    """An evaluation criterion of an assessment framework."""
+
+    name: str
+    description: str
+    weight: float
+
+
 class AssessmentFramework:
     """
     Represents the assessment framework for evaluating contenders.
@@ -38,15 +46,10 @@ class AssessmentFramework:
         self.description = description
 
         # Convert criteria to proper objects
-        self.evaluation_criteria = []
-        for criterion in evaluation_criteria:
-            self.evaluation_criteria.append(
-                {
-                    "name": criterion["name"],
-                    "description": criterion["description"],
-                    "weight": criterion["weight"],
-                }
-            )
+        self.evaluation_criteria = tuple(
+            Criterion(criterion["name"], criterion["description"], criterion["weight"])
+            for criterion in evaluation_criteria
+        )
 
         self.comparison_rules = comparison_rules
 
@@ -57,30 +60,40 @@ class AssessmentFramework:
             "categories": scoring_system.get("categories", []),
         }
 
+        # Prompt sections, formatted on first use; the framework does not
+        # change once built
+        self._formatted_criteria = None
+        self._formatted_rules = None
+        self._formatted_scoring = None
+
+        # Result of validate(), checked on first use
+        self._is_valid = None
+
     def validate(self) -> bool:
         """
         Validate that the framework is properly structured.
 
+        Returns:
+            True if valid, False otherwise
+        """
+        if self._is_valid is None:
+            self._is_valid = self._check_valid()
+        return self._is_valid
+
+    def _check_valid(self) -> bool:
+        """
+        Check the framework's structure, reporting the first problem found.
+
         Returns:
             True if valid, False otherwise
         """
         # Check that criteria weights sum to approximately 1.0
-        total_weight = sum(
-            criterion["weight"] for criterion in self.evaluation_criteria
-        )
+        total_weight = sum(criterion.weight for criterion in self.evaluation_criteria)
         if not (0.99 <= total_weight <= 1.01):  # Allow for small floating point errors
             print(f"Criteria weights must sum to 1.0, got {total_weight}")
             return False
 
-        # Check that all criteria have required fields
-        for i, criterion in enumerate(self.evaluation_criteria):
-            if (
-                "name" not in criterion
-                or "description" not in criterion
-                or "weight" not in criterion
-            ):
-                print(f"Criterion at index {i} is missing required fields")
-                return False
+        # Criteria always have all their fields; building them fails otherwise
 
         # Check scoring system
         if "type" not in self.scoring_system:
@@ -103,15 +116,14 @@ class AssessmentFramework:
         Returns:
             Formatted string representation of criteria
         """
-        criteria_text = "# Evaluation Criteria\n\n"
-
-        for criterion in self.evaluation_criteria:
-            criteria_text += (
-                f"## {criterion['name']} (Weight: {criterion['weight']:.2f})\n"
+        if self._formatted_criteria is None:
+            self._formatted_criteria = "# Evaluation Criteria\n\n" + "".join(
+                f"## {criterion.name} (Weight: {criterion.weight:.2f})\n"
+                f"{criterion.description}\n\n"
+                for criterion in self.evaluation_criteria
             )
-            criteria_text += f"{criterion['description']}\n\n"
 
-        return criteria_text
+        return self._formatted_criteria
 
     def get_formatted_rules(self) -> str:
         """
@@ -120,12 +132,12 @@ class AssessmentFramework:
         Returns:
             Formatted string representation of rules
         """
-        rules_text = "# Comparison Rules\n\n"
-
-        for i, rule in enumerate(self.comparison_rules, 1):
-            rules_text += f"{i}. {rule}\n"
+        if self._formatted_rules is None:
+            self._formatted_rules = "# Comparison Rules\n\n" + "".join(
+                f"{i}. {rule}\n" for i, rule in enumerate(self.comparison_rules, 1)
+            )
 
-        return rules_text
+        return self._formatted_rules
 
     def get_formatted_scoring(self) -> str:
         """
@@ -134,22 +146,24 @@ class AssessmentFramework:
         Returns:
             Formatted string representation of scoring system
         """
-        scoring_text = "# Scoring System\n\n"
+        if self._formatted_scoring is not None:
+            return self._formatted_scoring
 
-        scoring_text += f"Type: {self.scoring_system['type']}\n"
+        parts = ["# Scoring System\n\n", f"Type: {self.scoring_system['type']}\n"]
 
         if "scale" in self.scoring_system:
             min_val = self.scoring_system["scale"].get("min", 0)
             max_val = self.scoring_system["scale"].get("max", 10)
-            scoring_text += f"Scale: {min_val} to {max_val}\n\n"
+            parts.append(f"Scale: {min_val} to {max_val}\n\n")
 
         if "categories" in self.scoring_system and self.scoring_system["categories"]:
-            scoring_text += "Categories:\n"
+            parts.append("Categories:\n")
             for category in self.scoring_system["categories"]:
                 range_str = f"{category['range'][0]} to {category['range'][1]}"
-                scoring_text += f"- {category['name']}: {range_str}\n"
+                parts.append(f"- {category['name']}: {range_str}\n")
 
-        return scoring_text
+        self._formatted_scoring = "".join(parts)
+        return self._formatted_scoring
 
     def to_model(self) -> AssessmentFrameworkModel:
         """
@@ -160,9 +174,9 @@ class AssessmentFramework:
         """
         criteria_models = [
             CriterionModel(
-                name=criterion["name"],
-                description=criterion["description"],
-                weight=criterion["weight"],
+                name=criterion.name,
+                description=criterion.description,
+                weight=criterion.weight,
             )
             for criterion in self.evaluation_criteria
         ]
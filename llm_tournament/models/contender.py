@@ -2,9 +2,39 @@
 Contender class for the LLM Tournament application.
 """
 
-from typing import Dict, Any, Optional
+import logging
+import sys
+from typing import Dict, Any, Optional, Tuple, Union
 from models.data_models import ContenderModel
 
+_logger = logging.getLogger("llm_tournament")
+
+# Counters kept for each contender, in the order get_stats reports them
+_STAT_FIELDS = ("wins", "losses", "draws", "points", "total_score", "matches_played")
+
+# Points awarded for a (win, draw, loss)
+PointsTable = Tuple[int, int, int]
+
+
+def resolve_point_system(point_system: Dict[str, int]) -> PointsTable:
+    """
+    Resolve a point system into the points awarded for each outcome.
+
+    Resolving it once lets update_stats award points without looking them
+    up for every match.
+
+    Args:
+        point_system: Dictionary mapping outcome to points (win/draw/loss)
+
+    Returns:
+        Points for a win, a draw and a loss
+    """
+    return (
+        point_system.get("win", 3),
+        point_system.get("draw", 1),
+        point_system.get("loss", 0),
+    )
+
 
 class Contender:
     """
@@ -12,6 +42,22 @@ class Contender:
     Manages contender data and statistics.
     """
 
+    # Statistics are kept as plain attributes; slots make them cheap to
+    # update and keep each contender small
+    __slots__ = (
+        "id",
+        "content",
+        "metadata",
+        "wins",
+        "losses",
+        "draws",
+        "points",
+        "total_score",
+        "matches_played",
+        "_win_percentage",
+        "_average_score",
+    )
+
     def __init__(
         self, id: str, content: str, metadata: Optional[Dict[str, Any]] = None
     ):
@@ -23,31 +69,84 @@ class Contender:
             content: The actual text content of the contender
             metadata: Optional metadata about the contender
         """
-        self.id = id
+        # Interned so the many comparisons against match results usually
+        # succeed on identity alone
+        self.id = sys.intern(id) if type(id) is str else id
         self.content = content
         self.metadata = metadata or {}
 
         # Initialize statistics
-        self.stats = {
-            "wins": 0,
-            "losses": 0,
-            "draws": 0,
-            "points": 0,
-            "total_score": 0,
-            "matches_played": 0,
-        }
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.points = 0
+        self.total_score = 0
+        self.matches_played = 0
+
+        # Derived statistics, kept up to date by update_stats
+        self._win_percentage = 0.0
+        self._average_score = 0.0
 
     def update_stats(
-        self, result: Dict[str, Any], point_system: Dict[str, int]
+        self,
+        result: Dict[str, Any],
+        point_system: Union[Dict[str, int], PointsTable],
     ) -> None:
         """
         Update contender statistics based on a match result.
 
         Args:
             result: Match result containing winner and scores
-            point_system: Dictionary mapping outcome to points (win/draw/loss)
+            point_system: Dictionary mapping outcome to points (win/draw/loss),
+                or the points for each outcome from resolve_point_system
+        """
+        if isinstance(point_system, dict):
+            point_system = resolve_point_system(point_system)
+
+        self.matches_played += 1
+        self._apply_result(result, point_system)
+        self._refresh_derived_stats()
+
+    def add_results(
+        self,
+        wins: int,
+        draws: int,
+        losses: int,
+        total_score: float,
+        point_system: Union[Dict[str, int], PointsTable],
+    ) -> None:
         """
-        self.stats["matches_played"] += 1
+        Update contender statistics with the totals of several match results.
+
+        Args:
+            wins: Number of the matches won
+            draws: Number of the matches drawn
+            losses: Number of the matches lost
+            total_score: Sum of this contender's scores over the matches
+            point_system: Dictionary mapping outcome to points (win/draw/loss),
+                or the points for each outcome from resolve_point_system
+        """
+        if isinstance(point_system, dict):
+            point_system = resolve_point_system(point_system)
+        win_points, draw_points, loss_points = point_system
+
+        self.matches_played += wins + draws + losses
+        self.wins += wins
+        self.draws += draws
+        self.losses += losses
+        self.points += wins * win_points + draws * draw_points + losses * loss_points
+        self.total_score += total_score
+        self._refresh_derived_stats()
+
+    def _apply_result(self, result: Dict[str, Any], points: PointsTable) -> None:
+        """
+        Add a match result to the score and win/loss/draw record.
+
+        Args:
+            result: Match result containing winner and scores
+            points: Points for a win, a draw and a loss
+        """
+        win_points, draw_points, loss_points = points
 
         try:
             # Verify we have the necessary data
@@ -64,39 +163,61 @@ class Contender:
                 print(f"Warning: Empty result object in update_stats")
                 return
 
-            # Extract scores and winner based on which contender we are
+            # Extract our score and the winner based on which contender we are
             if result["contender1_id"] == self.id:
-                # We're contender1
                 my_score = float(result_obj.get("contender1_score", 5.0))
-                opponent_score = float(result_obj.get("contender2_score", 5.0))
             else:
-                # We're contender2
                 my_score = float(result_obj.get("contender2_score", 5.0))
-                opponent_score = float(result_obj.get("contender1_score", 5.0))
 
             winner_id = result_obj.get("winner")
+        except Exception as e:
+            print(f"Error updating stats for contender {self.id}: {e}")
+            # Don't increment stats in case of error to avoid inconsistencies
+            return
 
-            # Update total score
-            self.stats["total_score"] += my_score
+        # Update total score
+        self.total_score += my_score
 
-            # Update win/loss/draw record
-            if winner_id == self.id:
-                self.stats["wins"] += 1
-                self.stats["points"] += point_system.get("win", 3)
-            elif winner_id is None:
-                self.stats["draws"] += 1
-                self.stats["points"] += point_system.get("draw", 1)
-            else:
-                self.stats["losses"] += 1
-                self.stats["points"] += point_system.get("loss", 0)
+        # Update win/loss/draw record
+        if winner_id == self.id:
+            self.wins += 1
+            self.points += win_points
+        elif winner_id is None:
+            self.draws += 1
+            self.points += draw_points
+        else:
+            self.losses += 1
+            self.points += loss_points
 
-            print(
-                f"Updated stats for {self.id}: W-{self.stats['wins']} L-{self.stats['losses']} D-{self.stats.get('draws', 0)} Pts-{self.stats['points']}"
-            )
+        # Formatted only when debug logging is enabled
+        _logger.debug(
+            "Updated stats for %s: W-%s L-%s D-%s Pts-%s",
+            self.id,
+            self.wins,
+            self.losses,
+            self.draws,
+            self.points,
+        )
 
-        except Exception as e:
-            print(f"Error updating stats for contender {self.id}: {e}")
-            # Don't increment stats in case of error to avoid inconsistencies
+    def _refresh_derived_stats(self) -> None:
+        """Recompute the win percentage and average score from the counters."""
+        matches_played = self.matches_played
+        if matches_played > 0:
+            self._win_percentage = self.wins / matches_played
+            self._average_score = self.total_score / matches_played
+        else:
+            self._win_percentage = 0.0
+            self._average_score = 0.0
+
+    @property
+    def win_percentage(self) -> float:
+        """Fraction of played matches this contender has won."""
+        return self._win_percentage
+
+    @property
+    def average_score(self) -> float:
+        """Average score of this contender over its played matches."""
+        return self._average_score
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -105,18 +226,15 @@ class Contender:
         Returns:
             Dictionary of contender statistics
         """
-        # Calculate derived statistics
-        if self.stats["matches_played"] > 0:
-            win_percentage = self.stats["wins"] / self.stats["matches_played"]
-            avg_score = self.stats["total_score"] / self.stats["matches_played"]
-        else:
-            win_percentage = 0.0
-            avg_score = 0.0
-
         return {
-            **self.stats,
-            "win_percentage": win_percentage,
-            "average_score": avg_score,
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "points": self.points,
+            "total_score": self.total_score,
+            "matches_played": self.matches_played,
+            "win_percentage": self._win_percentage,
+            "average_score": self._average_score,
         }
 
     def to_model(self) -> ContenderModel:
@@ -146,8 +264,9 @@ class Contender:
         """
         contender = cls(id=model.id, content=model.content, metadata=model.metadata)
 
-        # Restore stats if present
-        if hasattr(model, "stats") and model.stats:
-            contender.stats.update(model.stats)
+        # Restore stats; derived values are recomputed from them
+        for name in _STAT_FIELDS:
+            setattr(contender, name, getattr(model.stats, name))
+        contender._refresh_derived_stats()
 
         return contender
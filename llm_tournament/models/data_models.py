@@ -7,15 +7,26 @@ from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel, Field
 
 
+class ContenderStatsModel(BaseModel):
+    """Model representing a contender's statistics."""
+
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    points: Union[int, float] = 0  # point systems may award fractional points
+    total_score: float = 0.0
+    matches_played: int = 0
+    win_percentage: float = 0.0
+    average_score: float = 0.0
+
+
 class ContenderModel(BaseModel):
     """Model representing a tournament contender."""
 
     id: str
     content: str
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    stats: Dict[str, Any] = Field(
-        default_factory=lambda: {"wins": 0, "losses": 0, "draws": 0, "points": 0}
-    )
+    stats: ContenderStatsModel = Field(default_factory=ContenderStatsModel)
 
 
 class CriterionModel(BaseModel):
@@ -2,14 +2,17 @@
 Match class for the LLM Tournament application.
 """
 
+import logging
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
-from models.data_models import MatchModel, MatchResultModel, CriteriaScoreModel
+from models.data_models import MatchModel, MatchResultModel
 from models.contender import Contender
 from models.assessment import AssessmentFramework
 
+_logger = logging.getLogger("llm_tournament")
+
 
 class Match:
     """
@@ -17,6 +20,20 @@ class Match:
     Manages match evaluation and results.
     """
 
+    # A tournament holds a match for every ordered pair of contenders, so
+    # slots keep each one small
+    __slots__ = (
+        "contender1",
+        "contender2",
+        "assessment_framework",
+        "id",
+        "result",
+        "timestamp",
+        "retries",
+        "_result_cache",
+        "_model_cache",
+    )
+
     def __init__(
         self,
         contender1: Contender,
@@ -41,6 +58,28 @@ class Match:
         self.timestamp = None
         self.retries = 0
 
+        # get_result and to_model output, each stored with the values it was
+        # built from so it is rebuilt once any of them change
+        self._result_cache = None
+        self._model_cache = None
+
+    def mirror(self) -> "Match":
+        """
+        Create the reverse match, with the contenders swapped.
+
+        The reverse match shares this match's framework, and its ID is this
+        match's ID with an "_r" suffix rather than a newly generated one.
+
+        Returns:
+            New, unevaluated Match
+        """
+        return Match(
+            contender1=self.contender2,
+            contender2=self.contender1,
+            assessment_framework=self.assessment_framework,
+            match_id=f"{self.id}_r",
+        )
+
     def evaluate(self, llm_manager) -> bool:
         """
         Evaluate the match using the LLM manager.
@@ -66,31 +105,29 @@ class Match:
 
             return True
         except Exception as e:
-            # Log the error (when we have logging)
-            print(f"Error evaluating match {self.id}: {e}")
+            # Formatted only if the message is emitted
+            _logger.warning("Error evaluating match %s: %s", self.id, e)
             return False
 
-    def retry_evaluation(self, llm_manager, max_retries: int) -> bool:
+    def record_result(self, result: Optional[MatchResultModel]) -> bool:
         """
-        Retry evaluation up to max_retries times.
+        Record the outcome of an evaluation made outside of evaluate.
+
+        The evaluation counts its own attempts in retries, so they are left
+        as they are.
 
         Args:
-            llm_manager: LLM manager for making evaluation requests
-            max_retries: Maximum number of retry attempts
+            result: Evaluation result, or None if the evaluation failed
 
         Returns:
-            True if evaluation was eventually successful, False otherwise
+            True if a result was recorded, False otherwise
         """
-        # If already at or beyond max retries, fail immediately
-        if self.retries >= max_retries:
+        if result is None:
             return False
 
-        # Try evaluating until success or max retries
-        while self.retries < max_retries:
-            if self.evaluate(llm_manager):
-                return True
-
-        return False
+        self.timestamp = datetime.now()
+        self.result = result
+        return True
 
     def get_result(self) -> Optional[Dict[str, Any]]:
         """
@@ -102,6 +139,14 @@ class Match:
         if not self.result:
             return None
 
+        cached = self._result_cache
+        if (
+            cached is not None
+            and cached[0] is self.result
+            and cached[1] is self.timestamp
+        ):
+            return cached[2]
+
         # Convert MatchResultModel to a dictionary for easier handling
         result_dict = {}
         if hasattr(self.result, "model_dump"):
@@ -124,13 +169,15 @@ class Match:
                 }
 
         # Create a result dictionary that is easy to work with
-        return {
+        result = {
             "id": self.id,
             "contender1_id": self.contender1.id,
             "contender2_id": self.contender2.id,
             "result": result_dict,  # Now this is a regular dictionary
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
         }
+        self._result_cache = (self.result, self.timestamp, result)
+        return result
 
     def get_winner(
         self,
@@ -167,7 +214,16 @@ class Match:
         Returns:
             MatchModel instance
         """
-        return MatchModel(
+        cached = self._model_cache
+        if (
+            cached is not None
+            and cached[0] is self.result
+            and cached[1] is self.timestamp
+            and cached[2] == self.retries
+        ):
+            return cached[3]
+
+        model = MatchModel(
             id=self.id,
             contender1_id=self.contender1.id,
             contender2_id=self.contender2.id,
@@ -175,6 +231,8 @@ class Match:
             timestamp=self.timestamp,
             retries=self.retries,
         )
+        self._model_cache = (self.result, self.timestamp, self.retries, model)
+        return model
 
     @classmethod
     def from_model(
@@ -211,21 +269,9 @@ class Match:
             match_id=model.id,
         )
 
-        # Restore result if present
-        if model.result:
-            criteria_scores = {}
-            for name, scores in model.result.criteria_scores.items():
-                criteria_scores[name] = CriteriaScoreModel(
-                    contender1=scores.contender1, contender2=scores.contender2
-                )
-
-            match.result = MatchResultModel(
-                winner=model.result.winner,
-                contender1_score=model.result.contender1_score,
-                contender2_score=model.result.contender2_score,
-                rationale=model.result.rationale,
-                criteria_scores=criteria_scores,
-            )
+        # Restore result if present; it was validated when the model was
+        # built and results are never modified, so it is shared as is
+        match.result = model.result
 
         match.timestamp = model.timestamp
         match.retries = model.retries
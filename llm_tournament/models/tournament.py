@@ -2,21 +2,32 @@
 Tournament class for the LLM Tournament application.
 """
 
+import asyncio
+import heapq
+import operator
 import uuid
-import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 import itertools
 
+import numpy as np
+
 from models.data_models import (
+    MatchResultModel,
     TournamentResultsModel,
     TournamentStatsModel,
     ContenderRankingModel,
 )
-from models.contender import Contender
+from models.contender import Contender, resolve_point_system
 from models.match import Match
 from models.assessment import AssessmentFramework
 
+# Ranking key for standings: points, then wins, then average score
+_standings_key = operator.attrgetter("points", "wins", "average_score")
+
+# Outcome columns of the per-contender tallies built by apply_results
+_WIN, _DRAW, _LOSS = range(3)
+
 
 class Tournament:
     """
@@ -24,6 +35,23 @@ class Tournament:
     executing the tournament, and calculating results.
     """
 
+    __slots__ = (
+        "contenders",
+        "assessment_framework",
+        "config",
+        "id",
+        "start_time",
+        "end_time",
+        "status",
+        "matches",
+        "current_match_index",
+        "_completed_matches",
+        "_standings",
+        "rounds_per_matchup",
+        "reverse_matchups",
+        "point_system",
+    )
+
     def __init__(
         self,
         contenders: List[Contender],
@@ -52,6 +80,15 @@ class Tournament:
         self.matches = []
         self.current_match_index = 0
 
+        # Number of matches with a result, kept up to date while the
+        # tournament is in progress; matches evaluated concurrently are
+        # counted as their results arrive, before they are recorded
+        self._completed_matches = 0
+
+        # Standings as of the last contender stats update, computed on first
+        # use; reset whenever a match result changes the stats
+        self._standings = None
+
         # Tournament settings
         self.rounds_per_matchup = config.get("tournament", {}).get(
             "rounds_per_matchup", 1
@@ -63,10 +100,6 @@ class Tournament:
             "point_system", {"win": 3, "draw": 1, "loss": 0}
         )
 
-        # Timeouts and retries
-        self.max_retries = config.get("llm", {}).get("max_retries", 3)
-        self.retry_delay = config.get("llm", {}).get("retry_delay", 5)
-
     def plan_matches(self) -> List[Match]:
         """
         Create round-robin tournament schedule.
@@ -74,36 +107,25 @@ class Tournament:
         Returns:
             List of Match objects for the tournament
         """
-        # Clear existing matches
-        self.matches = []
-
-        # Get all unique pairs of contenders
-        contender_ids = list(self.contenders.keys())
-        pairs = list(itertools.combinations(contender_ids, 2))
-
-        # Create matches for each pair
-        for round_num in range(self.rounds_per_matchup):
-            for contender1_id, contender2_id in pairs:
-                contender1 = self.contenders[contender1_id]
-                contender2 = self.contenders[contender2_id]
+        framework = self.assessment_framework
+        contenders = list(self.contenders.values())
 
+        matches = []
+        for _ in range(self.rounds_per_matchup):
+            for contender1, contender2 in itertools.combinations(contenders, 2):
                 # Create match with contender1 vs contender2
                 match = Match(
                     contender1=contender1,
                     contender2=contender2,
-                    assessment_framework=self.assessment_framework,
+                    assessment_framework=framework,
                 )
-                self.matches.append(match)
+                matches.append(match)
 
                 # If needed, create reverse match with contender2 vs contender1
                 if self.reverse_matchups:
-                    reverse_match = Match(
-                        contender1=contender2,
-                        contender2=contender1,
-                        assessment_framework=self.assessment_framework,
-                    )
-                    self.matches.append(reverse_match)
+                    matches.append(match.mirror())
 
+        self.matches = matches
         return self.matches
 
     def run_tournament(
@@ -120,30 +142,156 @@ class Tournament:
         Returns:
             True if tournament completed successfully, False otherwise
         """
+        # With concurrent or batched evaluation enabled, send every match to
+        # the LLM up front; the match loop then only records the outcomes
+        if (
+            getattr(llm_manager, "max_concurrency", 1) > 1
+            or getattr(llm_manager, "marshal_batch_size", 1) > 1
+        ):
+            return asyncio.run(self.arun_tournament(llm_manager, ui_manager, headless))
+
+        self._start()
+        return self._play_matches(llm_manager, ui_manager, headless, None)
+
+    async def arun_tournament(
+        self, llm_manager, ui_manager=None, headless: bool = False
+    ) -> bool:
+        """
+        Execute all matches in the tournament, evaluating them concurrently.
+
+        Up to llm.max_concurrency requests are in flight at once, and with
+        llm.marshal_batch_size above 1, matches against the same contender
+        share a request. Results
+        are recorded in match order once every evaluation has finished, so
+        standings do not depend on which requests complete first.
+
+        Args:
+            llm_manager: LLM manager for evaluating matches
+            ui_manager: Optional UI manager for displaying progress
+            headless: Whether to run without UI updates
+
+        Returns:
+            True if tournament completed successfully, False otherwise
+        """
+        self._start()
+
+        groups = None
+        batch_size = getattr(llm_manager, "marshal_batch_size", 1)
+        if batch_size > 1:
+            groups = self._group_matches_for_batch(batch_size)
+
+        def count_result(i: int) -> None:
+            if self.matches[i].result is None:
+                self._completed_matches += 1
+
+        # Results are only recorded once every evaluation has finished, so
+        # progress is shown from the results as they arrive
+        refresh = None
+        if ui_manager and not headless:
+            refresh = asyncio.create_task(self._refresh_display(ui_manager))
+        try:
+            batch_results = await llm_manager.run_batch(
+                self.matches, groups=groups, on_result=count_result
+            )
+        finally:
+            if refresh:
+                refresh.cancel()
+
+        return self._play_matches(llm_manager, ui_manager, headless, batch_results)
+
+    async def _refresh_display(self, ui_manager) -> None:
+        """
+        Refresh the UI at the configured update frequency until cancelled.
+
+        Args:
+            ui_manager: UI manager displaying progress
+        """
+        interval = self.config.get("ui", {}).get("update_frequency", 1)
+        while True:
+            ui_manager.update_display(self)
+            await asyncio.sleep(interval)
+
+    def _group_matches_for_batch(self, batch_size: int) -> List[List[int]]:
+        """
+        Group matches that can be evaluated together in one request.
+
+        Matches with the same first contender and framework are grouped, in
+        schedule order, into groups of at most batch_size.
+
+        Args:
+            batch_size: Maximum number of matches in a group
+
+        Returns:
+            Groups of indices into self.matches
+        """
+        groups = {}
+        for i, match in enumerate(self.matches):
+            key = (match.contender1.id, id(match.assessment_framework))
+            groups.setdefault(key, []).append(i)
+
+        return [
+            indices[start : start + batch_size]
+            for indices in groups.values()
+            for start in range(0, len(indices), batch_size)
+        ]
+
+    def _start(self) -> None:
+        """Plan the matches if needed and mark the tournament as started."""
         if not self.matches:
             self.plan_matches()
 
         self.start_time = datetime.now()
         self.status = "in_progress"
+        self._completed_matches = self._count_completed_matches()
+
+    def _play_matches(
+        self,
+        llm_manager,
+        ui_manager,
+        headless: bool,
+        batch_results: Optional[List[Optional[MatchResultModel]]],
+    ) -> bool:
+        """
+        Play or record every match in order and complete the tournament.
+
+        Args:
+            llm_manager: LLM manager for evaluating matches
+            ui_manager: Optional UI manager for displaying progress
+            headless: Whether to run without UI updates
+            batch_results: Results already evaluated for each match (None
+                for failed matches), or None to evaluate the matches here
+
+        Returns:
+            True if tournament completed successfully, False otherwise
+        """
+        # Points for each outcome, resolved once for the whole tournament
+        points_table = resolve_point_system(self.point_system)
+
+        # Results of already evaluated matches, applied together at the end
+        pending_results = []
 
         # Run matches
         for i, match in enumerate(self.matches):
             self.current_match_index = i
 
-            # Update UI if available
-            if ui_manager and not headless:
+            # Update UI if available; recording an evaluated result takes no
+            # time, so the display is then only refreshed after the match
+            if ui_manager and not headless and batch_results is None:
                 ui_manager.update_display(self)
 
-            # Run the match
-            success = match.evaluate(llm_manager)
+            had_result = match.result is not None
 
-            # If failed, retry
-            if not success:
-                for _ in range(self.max_retries - 1):  # Already tried once
-                    time.sleep(self.retry_delay)
-                    success = match.evaluate(llm_manager)
-                    if success:
-                        break
+            # Run the match, retrying with backoff if it fails
+            if batch_results is not None:
+                # Retries already happened in the batch
+                result = batch_results[i]
+            else:
+                result = llm_manager.retry_evaluation(match)
+            success = match.record_result(result)
+
+            # Evaluated results were already counted as they arrived
+            if batch_results is None and not had_result and match.result is not None:
+                self._completed_matches += 1
 
             # Update contender stats if successful
             if success and match.result:
@@ -161,17 +309,23 @@ class Tournament:
                 #         print(f"  result content: {result['result']}")
                 # print()
 
-                # Update contender statistics
-                contender1 = self.contenders[result["contender1_id"]]
-                contender2 = self.contenders[result["contender2_id"]]
+                if batch_results is not None:
+                    # Every result is already known, so the stats are updated
+                    # once all matches are recorded
+                    pending_results.append(result)
+                else:
+                    # Update contender statistics
+                    contender1 = match.contender1
+                    contender2 = match.contender2
 
-                contender1.update_stats(result, self.point_system)
-                contender2.update_stats(result, self.point_system)
+                    contender1.update_stats(result, points_table)
+                    contender2.update_stats(result, points_table)
+                    self._standings = None
 
                 # Debug the contender stats after update
                 # print(f"DEBUG - Contender stats after update:")
-                # print(f"  {contender1.id}: {contender1.stats}")
-                # print(f"  {contender2.id}: {contender2.stats}")
+                # print(f"  {contender1.id}: {contender1.get_stats()}")
+                # print(f"  {contender2.id}: {contender2.get_stats()}")
                 # print()
 
             # Update UI after match
@@ -179,6 +333,8 @@ class Tournament:
                 ui_manager.display_match_result(match)
                 ui_manager.update_display(self)
 
+        self.apply_results(pending_results)
+
         self.end_time = datetime.now()
         self.status = "completed"
 
@@ -188,6 +344,64 @@ class Tournament:
 
         return True
 
+    def apply_results(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Update contender statistics for several match results at once.
+
+        Gives the same statistics as calling update_stats for both contenders
+        of each result in turn, but tallies every contender's results with
+        array operations and updates each contender once.
+
+        Args:
+            results: Match results, as returned by Match.get_result
+        """
+        if not results:
+            return
+
+        rows = {contender_id: row for row, contender_id in enumerate(self.contenders)}
+
+        # Two entries per result, one for each contender
+        entries = 2 * len(results)
+        contender_rows = np.empty(entries, dtype=np.intp)
+        outcomes = np.empty(entries, dtype=np.intp)
+        scores = np.empty(entries, dtype=np.float64)
+
+        for i, result in enumerate(results):
+            contender1_id = result["contender1_id"]
+            contender2_id = result["contender2_id"]
+            result_obj = result["result"]
+            winner_id = result_obj.get("winner")
+
+            j = 2 * i
+            contender_rows[j] = rows[contender1_id]
+            contender_rows[j + 1] = rows[contender2_id]
+            scores[j] = float(result_obj.get("contender1_score", 5.0))
+            scores[j + 1] = float(result_obj.get("contender2_score", 5.0))
+
+            if winner_id == contender1_id:
+                outcomes[j], outcomes[j + 1] = _WIN, _LOSS
+            elif winner_id == contender2_id:
+                outcomes[j], outcomes[j + 1] = _LOSS, _WIN
+            elif winner_id is None:
+                outcomes[j] = outcomes[j + 1] = _DRAW
+            else:
+                outcomes[j] = outcomes[j + 1] = _LOSS
+
+        # Wins, draws and losses, and the total score, of every contender
+        tallies = np.bincount(
+            contender_rows * 3 + outcomes, minlength=3 * len(rows)
+        ).reshape(-1, 3)
+        total_scores = np.bincount(contender_rows, weights=scores, minlength=len(rows))
+
+        points_table = resolve_point_system(self.point_system)
+        for contender, (wins, draws, losses), total_score in zip(
+            self.contenders.values(), tallies.tolist(), total_scores.tolist()
+        ):
+            if wins or draws or losses:
+                contender.add_results(wins, draws, losses, total_score, points_table)
+
+        self._standings = None
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current tournament status.
@@ -196,7 +410,11 @@ class Tournament:
             Dictionary with tournament status information
         """
         total_matches = len(self.matches)
-        completed_matches = sum(1 for match in self.matches if match.result is not None)
+        if self.status == "in_progress":
+            # Counted as matches complete, since the UI asks after every match
+            completed_matches = self._completed_matches
+        else:
+            completed_matches = self._count_completed_matches()
 
         progress = 0.0
         if total_matches > 0:
@@ -213,37 +431,94 @@ class Tournament:
             "current_match_index": self.current_match_index,
         }
 
-    def get_standings(self) -> List[Dict[str, Any]]:
+    def _count_completed_matches(self) -> int:
+        """Count the matches that have a result."""
+        return sum(1 for match in self.matches if match.result is not None)
+
+    def get_standings(self, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Calculate current contender rankings.
 
+        Args:
+            top_k: Optional number of leading contenders to return; all
+                contenders are ranked if not provided
+
         Returns:
-            List of contenders sorted by points and other metrics
+            List of contenders sorted by points and other metrics; the rows
+            are the caller's own, so changing them does not affect later
+            standings
         """
-        # Get all contenders with their stats
-        contender_stats = []
-        for contender in self.contenders.values():
-            stats = contender.get_stats()
-            contender_stats.append(
-                {"id": contender.id, "content": contender.content, "stats": stats}
+        if self._standings is not None:
+            standings = self._standings
+        elif top_k is not None:
+            # Only the leaders are needed, so skip sorting the whole field
+            leaders = heapq.nlargest(
+                top_k, self.contenders.values(), key=_standings_key
             )
+            return [
+                self._standing_entry(contender, rank)
+                for rank, contender in enumerate(leaders, 1)
+            ]
+        else:
+            standings = self._standings = self._rank_contenders()
 
-        # Sort by points (primary), wins (secondary), and average score (tertiary)
-        sorted_contenders = sorted(
-            contender_stats,
-            key=lambda x: (
-                x["stats"]["points"],
-                x["stats"]["wins"],
-                x["stats"].get("average_score", 0),
-            ),
-            reverse=True,
-        )
+        if top_k is not None:
+            standings = standings[:top_k]
+
+        # Copies of the cached rows, down to their stats
+        return [{**entry, "stats": dict(entry["stats"])} for entry in standings]
+
+    def _rank_contenders(self) -> List[Dict[str, Any]]:
+        """
+        Rank every contender.
+
+        Returns:
+            List of contenders sorted by points and other metrics
+        """
+        contenders = list(self.contenders.values())
+        if not contenders:
+            return []
+
+        # Gather the ranking keys into columns so the ranking is computed
+        # with a single array operation
+        keys = np.array([_standings_key(c) for c in contenders], dtype=np.float64)
+
+        # Sort by points (primary), wins (secondary), and average score
+        # (tertiary), highest first; the sort is stable so ties keep their order
+        order = np.lexsort((-keys[:, 2], -keys[:, 1], -keys[:, 0]))
 
-        # Add rank
-        for i, contender in enumerate(sorted_contenders, 1):
-            contender["rank"] = i
+        return [
+            self._standing_entry(contenders[i], rank)
+            for rank, i in enumerate(order.tolist(), 1)
+        ]
 
-        return sorted_contenders
+    @staticmethod
+    def _standing_entry(contender: Contender, rank: int) -> Dict[str, Any]:
+        """
+        Build the standings entry for a contender.
+
+        Args:
+            contender: Contender to describe
+            rank: Rank of the contender
+
+        Returns:
+            Dictionary with the contender's id, content, stats and rank
+        """
+        return {
+            "id": contender.id,
+            "content": contender.content,
+            "stats": {
+                "wins": contender.wins,
+                "losses": contender.losses,
+                "draws": contender.draws,
+                "points": contender.points,
+                "total_score": contender.total_score,
+                "matches_played": contender.matches_played,
+                "win_percentage": contender.win_percentage,
+                "average_score": contender.average_score,
+            },
+            "rank": rank,
+        }
 
     def export_results(self) -> TournamentResultsModel:
         """
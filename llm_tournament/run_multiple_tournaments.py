@@ -11,10 +11,23 @@ import sys
 import argparse
 import subprocess
 import json
-import time
 import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 
+# For reading summary statistics without loading whole result files
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Progress of the individual runs, which may be executing concurrently; the
+# tournaments themselves log to the log file
+_logger = logging.getLogger("run_multiple_tournaments")
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -47,7 +60,12 @@ def parse_arguments():
     )
 
     parser.add_argument(
-        "--headless", action="store_true", help="Run tournaments in headless mode"
+        "--headless",
+        action="store_true",
+        help=(
+            "Run tournaments in headless mode with --isolate; tournaments run "
+            "in this process are always headless"
+        ),
     )
 
     parser.add_argument(
@@ -57,6 +75,32 @@ def parse_arguments():
         help="Directory for tournament results",
     )
 
+    parser.add_argument(
+        "--parallel-runs",
+        type=int,
+        default=1,
+        help=(
+            "Number of tournaments to run at once. The LLM server must be able "
+            "to serve them concurrently; for Ollama, raise OLLAMA_NUM_PARALLEL "
+            "and, when testing several models, OLLAMA_MAX_LOADED_MODELS"
+        ),
+    )
+
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help=(
+            "Run each tournament in its own Python process, so a crash does "
+            "not stop the other runs"
+        ),
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Also print the command used for each tournament run with --isolate",
+    )
+
     parser.add_argument(
         "--run-analysis",
         action="store_true",
@@ -73,10 +117,64 @@ def run_tournament(
     output_file: str,
     run_id: str,
     headless: bool = False,
+    isolate: bool = False,
 ) -> bool:
     """
     Run a single tournament with the specified parameters.
 
+    Args:
+        contenders_file: Path to contenders JSON file
+        framework_file: Path to assessment framework JSON file
+        model: LLM model to use
+        output_file: Path to output results file
+        run_id: Unique ID for this run
+        headless: Whether to run without UI; only used with isolate, as
+            tournaments run in this process are always headless
+        isolate: Whether to run the tournament in a separate process
+
+    Returns:
+        True if successful, False otherwise
+    """
+    _logger.info("Running tournament %s with model %s", run_id, model)
+
+    if isolate:
+        return _run_tournament_process(
+            contenders_file, framework_file, model, output_file, run_id, headless
+        )
+
+    # Imported here so check_environment can report missing packages first
+    from main import run_one_tournament
+
+    try:
+        completed = run_one_tournament(
+            contenders_file=contenders_file,
+            framework_file=framework_file,
+            model=model,
+            output_file=output_file,
+            run_id=run_id,
+        )
+    except Exception as e:
+        _logger.error("Unexpected error running tournament %s: %s", run_id, e)
+        return False
+
+    if not completed:
+        _logger.error("Tournament %s failed", run_id)
+        return False
+
+    return _check_output_created(output_file, run_id)
+
+
+def _run_tournament_process(
+    contenders_file: str,
+    framework_file: str,
+    model: str,
+    output_file: str,
+    run_id: str,
+    headless: bool,
+) -> bool:
+    """
+    Run a single tournament by running main.py in a separate process.
+
     Args:
         contenders_file: Path to contenders JSON file
         framework_file: Path to assessment framework JSON file
@@ -104,8 +202,8 @@ def run_tournament(
     if headless:
         command.append("--headless")
 
-    print(f"\nRunning tournament {run_id} with model {model}")
-    print(f"Command: {' '.join(command)}")
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Command: %s", " ".join(command))
 
     try:
         process = subprocess.run(
@@ -116,23 +214,40 @@ def run_tournament(
             text=True,
         )
 
-        # Check if the output file was created
-        if os.path.exists(output_file):
-            print(f"Tournament {run_id} completed successfully")
-            return True
-        else:
-            print(f"Tournament {run_id} failed: output file not created")
-            return False
+        return _check_output_created(output_file, run_id)
 
     except subprocess.CalledProcessError as e:
-        print(f"Tournament {run_id} failed with code {e.returncode}")
-        print(f"Error output: {e.stderr.strip()}")
+        _logger.error(
+            "Tournament %s failed with code %s\nError output: %s",
+            run_id,
+            e.returncode,
+            e.stderr.strip(),
+        )
         return False
     except Exception as e:
-        print(f"Unexpected error running tournament {run_id}: {str(e)}")
+        _logger.error("Unexpected error running tournament %s: %s", run_id, e)
         return False
 
 
+def _check_output_created(output_file: str, run_id: str) -> bool:
+    """
+    Check that a tournament run exported its results.
+
+    Args:
+        output_file: Path to the run's output results file
+        run_id: Unique ID of the run
+
+    Returns:
+        True if the output file was created, False otherwise
+    """
+    if os.path.exists(output_file):
+        _logger.info("Tournament %s completed successfully", run_id)
+        return True
+
+    _logger.error("Tournament %s failed: output file not created", run_id)
+    return False
+
+
 def run_multiple_tournaments(args: argparse.Namespace) -> Dict[str, List[str]]:
     """
     Run multiple tournaments with different models.
@@ -149,40 +264,59 @@ def run_multiple_tournaments(args: argparse.Namespace) -> Dict[str, List[str]]:
     # Generate timestamp for this batch
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Dictionary to track result files by model
-    results_by_model = {}
-
-    # Run tournaments for each model
+    # Plan every run up front; runs are independent, so they can be executed
+    # in any order
+    runs = []
     for model in args.models:
-        print(f"\n{'=' * 70}")
-        print(f"RUNNING {args.runs} TOURNAMENTS WITH MODEL: {model}")
-        print(f"{'=' * 70}")
-
-        model_results = []
-
         for run in range(1, args.runs + 1):
             # Generate unique output filename
             run_id = f"{model.replace(":", "_")}_{timestamp}_run{run}"
             output_file = os.path.join(args.output_dir, f"tournament_{run_id}.json")
+            runs.append((model, output_file, run_id))
 
-            # Run the tournament
-            success = run_tournament(
-                contenders_file=args.contenders,
-                framework_file=args.framework,
-                model=model,
-                output_file=output_file,
-                run_id=run_id,
-                headless=args.headless,
-            )
+    parallel_runs = max(1, min(args.parallel_runs, len(runs)))
+    print(f"\n{'=' * 70}")
+    print(
+        f"RUNNING {args.runs} TOURNAMENTS WITH EACH MODEL: {', '.join(args.models)}"
+        f" ({parallel_runs} at a time)"
+    )
+    print(f"{'=' * 70}")
 
-            if success:
-                model_results.append(output_file)
+    def run_planned(planned_run) -> bool:
+        model, output_file, run_id = planned_run
+        return run_tournament(
+            contenders_file=args.contenders,
+            framework_file=args.framework,
+            model=model,
+            output_file=output_file,
+            run_id=run_id,
+            headless=args.headless,
+            isolate=args.isolate,
+        )
 
-            # Short delay between runs
-            time.sleep(1)
+    # Tournaments run in this process share one log file handler
+    shared_logging = None
+    if not args.isolate:
+        from main import setup_shared_logging
 
-        results_by_model[model] = model_results
+        shared_logging = setup_shared_logging()
 
+    # Tournaments spend their time waiting on the LLM server, so threads are
+    # enough to overlap them, whether or not each runs in its own process
+    try:
+        with ThreadPoolExecutor(max_workers=parallel_runs) as executor:
+            successes = list(executor.map(run_planned, runs))
+    finally:
+        if shared_logging:
+            shared_logging.close()
+
+    # Dictionary to track result files by model, in run order
+    results_by_model = {model: [] for model in args.models}
+    for (model, output_file, _), success in zip(runs, successes):
+        if success:
+            results_by_model[model].append(output_file)
+
+    for model, model_results in results_by_model.items():
         print(
             f"\nCompleted {len(model_results)}/{args.runs} tournaments with model {model}"
         )
@@ -267,10 +401,39 @@ def check_environment():
     print(f"{'=' * 70}\n")
 
 
+def read_statistics(results_file: str) -> Dict[str, Any]:
+    """
+    Read the statistics section of a tournament results file.
+
+    With ijson installed, only the file up to the statistics object is
+    parsed, rather than every match in it.
+
+    Args:
+        results_file: Path to the tournament results file
+
+    Returns:
+        Tournament statistics, or an empty dictionary if there are none
+    """
+    with open(results_file, "rb") as f:
+        if IJSON_AVAILABLE:
+            for statistics in ijson.items(f, "statistics", use_float=True):
+                return statistics
+            return {}
+
+        return json.load(f).get("statistics", {})
+
+
 def main():
     """Run multiple tournaments and optional analysis."""
     args = parse_arguments()
 
+    # Print run progress as plain lines, like the rest of the output
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+    )
+
     print(f"\n{'=' * 70}")
     print("MULTIPLE LLM TOURNAMENT RUNNER")
     print(f"{'=' * 70}")
@@ -278,6 +441,7 @@ def main():
     print(f"Framework: {args.framework}")
     print(f"Models: {args.models}")
     print(f"Runs per model: {args.runs}")
+    print(f"Parallel runs: {args.parallel_runs}")
     print(f"Output directory: {args.output_dir}")
 
     # Check environment before running
@@ -297,15 +461,11 @@ def main():
 
         if files:
             try:
-                first_file = files[0]
-                with open(first_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Safely access nested properties with get()
-                    statistics = data.get("statistics", {})
-                    total_contenders = statistics.get("total_contenders", "unknown")
-                    total_matches = statistics.get("total_matches", "unknown")
-                    print(f"  Contenders: {total_contenders}")
-                    print(f"  Matches per tournament: {total_matches}")
+                statistics = read_statistics(files[0])
+                total_contenders = statistics.get("total_contenders", "unknown")
+                total_matches = statistics.get("total_matches", "unknown")
+                print(f"  Contenders: {total_contenders}")
+                print(f"  Matches per tournament: {total_matches}")
             except Exception as e:
                 print(f"  Error reading result file: {e}")
 
@@ -0,0 +1,10 @@
+"""
+Shared test setup for the LLM Tournament application.
+"""
+
+import os
+import sys
+
+# The application imports its packages relative to its own directory, as it
+# does when run from there
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,144 @@
+"""
+Tests for the LLM manager's match evaluation retries.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+pytest.importorskip("langchain_community")
+
+from managers import llm_manager as llm_manager_module
+from managers.llm_manager import LLMManager
+from managers.prompt_manager import PromptManager
+from models.assessment import AssessmentFramework
+from models.contender import Contender
+from models.match import Match
+from models.tournament import Tournament
+
+PROMPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "prompts")
+
+# No provider, so no model is configured and every request fails to build
+CONFIG = {
+    "llm": {"provider": "none", "max_retries": 3, "retry_delay": 60},
+    "tournament": {"reverse_matchups": False},
+}
+
+
+def make_framework() -> AssessmentFramework:
+    """Create a minimal assessment framework."""
+    return AssessmentFramework(
+        id="framework",
+        description="Test framework",
+        evaluation_criteria=[
+            {"name": "Clarity", "description": "How clear it is", "weight": 1.0}
+        ],
+        comparison_rules=["Compare clarity"],
+        scoring_system={"type": "scale", "min": 0, "max": 10},
+    )
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """LLM manager counting match requests, which must never back off."""
+    manager = LLMManager(CONFIG, PromptManager(PROMPTS_DIR, CONFIG))
+
+    calls = {"build": 0}
+    build = manager._build_match_request
+
+    def counting_build(match):
+        calls["build"] += 1
+        return build(match)
+
+    def no_sleep(delay):
+        raise AssertionError(f"Retried a permanent error after {delay} seconds")
+
+    async def no_async_sleep(delay):
+        no_sleep(delay)
+
+    monkeypatch.setattr(manager, "_build_match_request", counting_build)
+    monkeypatch.setattr(llm_manager_module.time, "sleep", no_sleep)
+    monkeypatch.setattr(llm_manager_module.asyncio, "sleep", no_async_sleep)
+    manager.calls = calls
+    return manager
+
+
+def make_match() -> Match:
+    """Create a match between two contenders."""
+    return Match(
+        Contender("a", "First text"), Contender("b", "Second text"), make_framework()
+    )
+
+
+def test_permanent_error_is_attempted_once(manager):
+    assert manager.retry_evaluation(make_match()) is None
+    assert manager.calls["build"] == 1
+
+
+def test_permanent_error_is_attempted_once_async(manager):
+    assert asyncio.run(manager.aretry_evaluation(make_match())) is None
+    assert manager.calls["build"] == 1
+
+
+def test_tournament_attempts_permanent_error_once_per_match(manager):
+    contenders = [Contender(c, f"Text {c}") for c in "abc"]
+    tournament = Tournament(contenders, make_framework(), CONFIG)
+
+    tournament.run_tournament(manager, headless=True)
+
+    assert manager.calls["build"] == len(tournament.matches) == 3
+    assert all(match.result is None for match in tournament.matches)
+
+
+class FlakyLLM:
+    """LLM client failing a number of times before answering."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+
+    def invoke(self, prompt: str) -> str:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Connection reset")
+        return json.dumps(
+            {
+                "criteria_scores": {"Clarity": {"contender1": 7, "contender2": 5}},
+                "contender1_score": 7,
+                "contender2_score": 5,
+                "rationale": "Clearer",
+            }
+        )
+
+    async def ainvoke(self, prompt: str) -> str:
+        return self.invoke(prompt)
+
+
+@pytest.fixture
+def flaky_manager(monkeypatch):
+    """LLM manager whose model fails twice, retrying without waiting."""
+    manager = LLMManager(CONFIG, PromptManager(PROMPTS_DIR, CONFIG))
+    model_name = manager.prompt_manager.get_model_for_prompt("match_evaluation")
+    manager.llm_clients[model_name] = FlakyLLM(failures=2)
+
+    async def no_async_sleep(delay):
+        pass
+
+    monkeypatch.setattr(llm_manager_module.time, "sleep", lambda delay: None)
+    monkeypatch.setattr(llm_manager_module.asyncio, "sleep", no_async_sleep)
+    return manager
+
+
+def test_retries_count_every_attempt(flaky_manager):
+    match = make_match()
+
+    assert match.record_result(flaky_manager.retry_evaluation(match))
+    assert match.to_model().retries == 3
+
+
+def test_retries_count_every_attempt_async(flaky_manager):
+    match = make_match()
+
+    assert match.record_result(asyncio.run(flaky_manager.aretry_evaluation(match)))
+    assert match.to_model().retries == 3
@@ -5,11 +5,47 @@ Console UI for the LLM Tournament application.
 import os
 import time
 import sys
-import datetime
 from typing import Dict, Any, List, Optional
 
 from models.tournament import Tournament
 from models.match import Match
+from utils.helpers import create_progress_bar, format_time_delta, truncate_text
+
+# Rules drawn between sections of the output
+_SEP_DOUBLE = "=" * 70
+_SEP_SINGLE = "-" * 70
+
+# ANSI sequence clearing the screen and moving the cursor to the top left
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Windows console API values for turning on ANSI escape sequence handling
+_STD_OUTPUT_HANDLE = -11
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Title of the standings, written as a single line of the output
+_STANDINGS_TITLE = f"\n{_SEP_DOUBLE}\nTOURNAMENT STANDINGS\n{_SEP_SINGLE}"
+
+# Header of the standings table; rows pad their cells to the same widths
+_STANDINGS_HEADER = f"{'Rank':<5} {'Contender':<20} {'Wins':<5} {'Losses':<7} {'Draws':<7} {'Points':<7} {'Win Rate':<8}"
+
+
+def _enable_ansi_escapes() -> None:
+    """
+    Turn on ANSI escape sequence handling in the Windows console.
+
+    Nothing changes if stdout is not a console, for example when it is
+    redirected to a file.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+    mode = wintypes.DWORD()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(
+            handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        )
 
 
 class ConsoleUI:
@@ -35,6 +71,25 @@ class ConsoleUI:
         self.last_update_time = 0
         self.start_time = None
 
+        # Progress line last written; cleared when anything else is
+        # displayed, so the line is then drawn again
+        self._last_progress_line = None
+
+        # Older Windows consoles leave ANSI escape sequence handling off
+        if self.enabled and os.name == "nt":
+            _enable_ansi_escapes()
+
+    @staticmethod
+    def _emit(lines: List[str]) -> None:
+        """
+        Write lines to stdout with a single write and flush them.
+
+        Args:
+            lines: Lines to write, without trailing newlines
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def display_welcome(self, tournament: Tournament) -> None:
         """
         Display welcome message.
@@ -46,23 +101,23 @@ class ConsoleUI:
             return
 
         self.start_time = time.time()
-
-        # Clear screen
-        os.system("cls" if os.name == "nt" else "clear")
-
-        print("=" * 70)
-        print(f"LLM TOURNAMENT: {tournament.id}")
-        print("=" * 70)
-        print(f"Assessment Framework: {tournament.assessment_framework.id}")
-        print(f"Contenders: {len(tournament.contenders)}")
-        print(f"Total Matches: {len(tournament.matches)}")
-        print("-" * 70)
-        print("Starting tournament...")
-        print("=" * 70)
-        print()
-
-        # Ensure output is displayed
-        sys.stdout.flush()
+        self._last_progress_line = None
+
+        # Clear screen, in the same write as the message
+        self._emit(
+            [
+                _CLEAR_SCREEN + _SEP_DOUBLE,
+                f"LLM TOURNAMENT: {tournament.id}",
+                _SEP_DOUBLE,
+                f"Assessment Framework: {tournament.assessment_framework.id}",
+                f"Contenders: {len(tournament.contenders)}",
+                f"Total Matches: {len(tournament.matches)}",
+                _SEP_SINGLE,
+                "Starting tournament...",
+                _SEP_DOUBLE,
+                "",
+            ]
+        )
 
     def display_match_result(self, match: Match) -> None:
         """
@@ -77,34 +132,32 @@ class ConsoleUI:
         if not match.result:
             return
 
+        self._last_progress_line = None
         winner, score1, score2 = match.get_winner()
 
-        print("\n" + "-" * 70)
-        print(f"MATCH RESULT: {match.id}")
-        print(f"Contender 1: {match.contender1.id}")
-        print(f"Contender 2: {match.contender2.id}")
-
-        if winner:
-            print(f"Winner: {winner.id}")
-        else:
-            print("Result: Draw")
-
-        print(f"Scores: {score1:.1f} vs {score2:.1f}")
+        lines = [
+            "",
+            _SEP_SINGLE,
+            f"MATCH RESULT: {match.id}",
+            f"Contender 1: {match.contender1.id}",
+            f"Contender 2: {match.contender2.id}",
+            f"Winner: {winner.id}" if winner else "Result: Draw",
+            f"Scores: {score1:.1f} vs {score2:.1f}",
+            "",
+            "Scores by criteria:",
+        ]
 
         # Display criteria scores
-        print("\nScores by criteria:")
         for name, scores in match.result.criteria_scores.items():
-            print(f"  {name}: {scores.contender1:.1f} vs {scores.contender2:.1f}")
+            lines.append(
+                f"  {name}: {scores.contender1:.1f} vs {scores.contender2:.1f}"
+            )
 
         # Display rationale (truncated if long)
-        rationale = match.result.rationale
-        if len(rationale) > 100:
-            rationale = rationale[:100] + "..."
-        print(f"\nRationale: {rationale}")
-        print("-" * 70)
+        rationale = truncate_text(match.result.rationale, 100)
+        lines += ["", f"Rationale: {rationale}", _SEP_SINGLE]
 
-        # Ensure output is displayed
-        sys.stdout.flush()
+        self._emit(lines)
 
     def display_standings(self, standings: List[Dict[str, Any]]) -> None:
         """
@@ -116,23 +169,22 @@ class ConsoleUI:
         if not self.enabled:
             return
 
-        print("\n" + "=" * 70)
-        print("TOURNAMENT STANDINGS")
-        print("-" * 70)
+        self._last_progress_line = None
+        lines = [_STANDINGS_TITLE]
 
         if not standings:
-            print("No standings available yet.")
-            print("=" * 70)
+            lines += ["No standings available yet.", _SEP_DOUBLE]
+            self._emit(lines)
             return
 
-        # Display table header
-        print(
-            f"{'Rank':<5} {'Contender':<20} {'Wins':<5} {'Losses':<7} {'Draws':<7} {'Points':<7} {'Win Rate':<8}"
-        )
-        print("-" * 70)
+        # Table header
+        lines.append(_STANDINGS_HEADER)
+        lines.append(_SEP_SINGLE)
 
-        # Display each contender
+        # A row for each contender
         for contender in standings:
+            stats = contender["stats"]
+
             # Truncate long contender names
             display_name = contender["content"]
             if len(display_name) > 17:
@@ -140,27 +192,27 @@ class ConsoleUI:
 
             # Calculate win rate
             win_rate = 0
-            if contender["stats"]["matches_played"] > 0:
-                win_rate = (
-                    contender["stats"]["wins"]
-                    / contender["stats"]["matches_played"]
-                    * 100
+            if stats["matches_played"] > 0:
+                win_rate = stats["wins"] / stats["matches_played"] * 100
+
+            # Padded with ljust, which is cheaper than format specs per cell
+            lines.append(
+                " ".join(
+                    (
+                        str(contender["rank"]).ljust(5),
+                        display_name.ljust(20),
+                        str(stats.get("wins", 0)).ljust(5),
+                        str(stats.get("losses", 0)).ljust(7),
+                        str(stats.get("draws", 0)).ljust(7),
+                        str(stats.get("points", 0)).ljust(7),
+                        "%.1f%%" % win_rate,
+                    )
                 )
-
-            print(
-                f"{contender['rank']:<5} "
-                f"{display_name:<20} "
-                f"{contender['stats'].get('wins', 0):<5} "
-                f"{contender['stats'].get('losses', 0):<7} "
-                f"{contender['stats'].get('draws', 0):<7} "
-                f"{contender['stats'].get('points', 0):<7} "
-                f"{win_rate:.1f}%"
             )
 
-        print("=" * 70)
+        lines.append(_SEP_DOUBLE)
 
-        # Ensure output is displayed
-        sys.stdout.flush()
+        self._emit(lines)
 
     def display_progress(self, tournament: Tournament) -> None:
         """
@@ -181,25 +233,26 @@ class ConsoleUI:
 
         # Calculate elapsed time and estimated remaining time
         elapsed_seconds = time.time() - self.start_time if self.start_time else 0
-        elapsed = str(datetime.timedelta(seconds=int(elapsed_seconds)))
+        elapsed = format_time_delta(elapsed_seconds)
 
         est_remaining_seconds = 0
         if completed > 0 and remaining > 0:
             seconds_per_match = elapsed_seconds / completed
             est_remaining_seconds = seconds_per_match * remaining
-        est_remaining = str(datetime.timedelta(seconds=int(est_remaining_seconds)))
+        est_remaining = format_time_delta(est_remaining_seconds)
 
-        # Create progress bar
-        bar_length = 30
-        filled_length = int(bar_length * progress / 100)
-        bar = "#" * filled_length + "-" * (bar_length - filled_length)
-
-        print(
-            f"\rProgress: [{bar}] {progress:.1f}% ({completed}/{total_matches}) | "
-            f"Time: {elapsed} | Est. Remaining: {est_remaining}",
-            end="",
+        line = (
+            f"\rProgress: {create_progress_bar(progress)} ({completed}/{total_matches}) | "
+            f"Time: {elapsed} | Est. Remaining: {est_remaining}"
         )
 
+        # Nothing to redraw if the line already shows this
+        if line == self._last_progress_line:
+            return
+        self._last_progress_line = line
+
+        print(line, end="")
+
         # Ensure output is displayed
         sys.stdout.flush()
 
@@ -236,28 +289,24 @@ class ConsoleUI:
         if not self.enabled:
             return
 
-        print("\n\n" + "=" * 70)
-        print("TOURNAMENT COMPLETED")
-        print("-" * 70)
+        self._last_progress_line = None
+        lines = ["", "", _SEP_DOUBLE, "TOURNAMENT COMPLETED", _SEP_SINGLE]
 
         # Display time information
         elapsed_seconds = time.time() - self.start_time if self.start_time else 0
-        elapsed = str(datetime.timedelta(seconds=int(elapsed_seconds)))
-        print(f"Total time: {elapsed}")
+        lines.append(f"Total time: {format_time_delta(elapsed_seconds)}")
 
         # Display match statistics
         status = tournament.get_status()
-        print(f"Total matches: {status['total_matches']}")
-        print(f"Successful matches: {status['completed_matches']}")
+        lines.append(f"Total matches: {status['total_matches']}")
+        lines.append(f"Successful matches: {status['completed_matches']}")
 
         # Display results file location
         if results_file:
-            print(f"Results exported to: {results_file}")
+            lines.append(f"Results exported to: {results_file}")
 
-        print("=" * 70)
+        lines.append(_SEP_DOUBLE)
+        self._emit(lines)
 
         # Display final standings
         self.display_standings(tournament.get_standings())
-
-        # Ensure output is displayed
-        sys.stdout.flush()
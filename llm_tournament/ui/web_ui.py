@@ -1,11 +1,89 @@
 import streamlit as st
 import json
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
 from datetime import datetime
 
+# For faster parsing of large results files
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# For reading tournament results without their matches
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# Streamlit reruns this script on every widget interaction; parsed results
+# and the tables built from them are cached on the uploaded file's contents
+@st.cache_data
+def load_results(file_bytes: bytes) -> dict:
+    """Parse an uploaded results JSON file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(file_bytes)
+    return json.loads(file_bytes)
+
+
+@st.cache_data
+def load_tournament_results(file_bytes: bytes) -> dict:
+    """Parse an uploaded tournament results file, up to its matches."""
+    if not IJSON_AVAILABLE:
+        return load_results(file_bytes)
+
+    # The matches, by far the largest part of the file, are not displayed.
+    # They are exported last, so parsing stops once they are reached.
+    builder = ijson.ObjectBuilder()
+    for prefix, event, value in ijson.parse(file_bytes, use_float=True):
+        if prefix == "" and event == "map_key" and value == "matches":
+            break
+        builder.event(event, value)
+    return builder.value
+
+
+@st.cache_data
+def build_rankings_df(file_bytes: bytes) -> pd.DataFrame:
+    """Build the rankings table of an uploaded tournament results file."""
+    # Built a column at a time, so pandas takes each as one typed list
+    rankings = load_tournament_results(file_bytes)["rankings"]
+    stats = [r["stats"] for r in rankings]
+    return pd.DataFrame(
+        {
+            "Rank": [r["rank"] for r in rankings],
+            "Contender ID": [r["contender_id"] for r in rankings],
+            "Points": [s["points"] for s in stats],
+            "Wins": [s["wins"] for s in stats],
+            "Losses": [s["losses"] for s in stats],
+            "Draws": [s["draws"] for s in stats],
+            "Win %": [s["win_percentage"] * 100 for s in stats],
+            "Avg Score": [s["average_score"] for s in stats],
+        }
+    )
+
+
+@st.cache_data
+def build_models_df(file_bytes: bytes) -> pd.DataFrame:
+    """Build the model metrics table of an uploaded comparison file."""
+    models_data = []
+    for model, metrics in load_results(file_bytes)["groups"].items():
+        models_data.append(
+            {
+                "Model": model,
+                "Tournaments": metrics["tournaments"],
+                "Ranking Stability": metrics["ranking_stability"],
+                "Win Rate Consistency": metrics["win_rate_consistency"],
+                "Matchup Consistency": metrics["matchup_consistency"],
+                "Score Consistency": metrics["score_consistency"],
+            }
+        )
+    return pd.DataFrame(models_data)
+
+
 # Page configuration
 st.set_page_config(page_title="LLM Tournament Viewer", page_icon="🏆", layout="wide")
 
@@ -25,8 +103,13 @@ if view_type == "Single Tournament":
     uploaded_file = st.file_uploader("Upload tournament JSON file", type=["json"])
 
     if uploaded_file:
+        # The plotting libraries are slow to import, so they are only loaded
+        # once there are results to chart
+        import altair as alt
+
         # Load data
-        tournament_data = json.load(uploaded_file)
+        file_bytes = uploaded_file.getvalue()
+        tournament_data = load_tournament_results(file_bytes)
 
         # Create tabs
         overview_tab, rankings_tab, details_tab = st.tabs(
@@ -83,25 +166,17 @@ if view_type == "Single Tournament":
         with rankings_tab:
             st.subheader("Contender Rankings")
 
-            # Create DataFrame from rankings
-            rankings = []
-            for r in tournament_data["rankings"]:
-                rankings.append(
-                    {
-                        "Rank": r["rank"],
-                        "Contender ID": r["contender_id"],
-                        "Points": r["stats"]["points"],
-                        "Wins": r["stats"]["wins"],
-                        "Losses": r["stats"]["losses"],
-                        "Draws": r["stats"]["draws"],
-                        "Win %": f"{r['stats']['win_percentage'] * 100:.1f}%",
-                        "Avg Score": f"{r['stats']['average_score']:.2f}",
-                    }
-                )
-
-            # Display rankings table
-            rankings_df = pd.DataFrame(rankings)
-            st.dataframe(rankings_df, use_container_width=True)
+            # Display rankings table; the columns stay numeric and are only
+            # formatted for display
+            rankings_df = build_rankings_df(file_bytes)
+            st.dataframe(
+                rankings_df,
+                use_container_width=True,
+                column_config={
+                    "Win %": st.column_config.NumberColumn(format="%.1f%%"),
+                    "Avg Score": st.column_config.NumberColumn(format="%.2f"),
+                },
+            )
 
             # Visualization
             st.subheader("Top Performers Visualization")
@@ -115,33 +190,21 @@ if view_type == "Single Tournament":
             top_n = st.slider("Show top contenders:", 3, 20, 10)
 
             # Prepare data for visualization
-            if metric == "Win %":
-                # Convert percentage strings to float
-                vis_df = rankings_df.copy()
-                vis_df["Win %"] = vis_df["Win %"].str.rstrip("%").astype(float)
-                vis_df = vis_df.sort_values(metric, ascending=False).head(top_n)
-            elif metric == "Avg Score":
-                # Convert avg score strings to float
-                vis_df = rankings_df.copy()
-                vis_df["Avg Score"] = vis_df["Avg Score"].astype(float)
-                vis_df = vis_df.sort_values(metric, ascending=False).head(top_n)
-            else:
-                # Points is already numeric
-                vis_df = rankings_df.sort_values(metric, ascending=False).head(top_n)
-
-            # Create the visualization
-            fig, ax = plt.subplots(figsize=(10, 6))
-
-            # Create bar chart
-            sns.barplot(x="Contender ID", y=metric, data=vis_df, ax=ax)
-
-            # Formatting
-            plt.xticks(rotation=45, ha="right")
-            plt.title(f"Top {top_n} Contenders by {metric}")
-            plt.tight_layout()
+            vis_df = rankings_df.sort_values(metric, ascending=False).head(top_n)
+
+            # Create bar chart, keeping the contenders in ranking order; the
+            # browser draws it from the chart spec
+            chart = (
+                alt.Chart(vis_df, title=f"Top {top_n} Contenders by {metric}")
+                .mark_bar()
+                .encode(
+                    x=alt.X("Contender ID", sort=None, axis=alt.Axis(labelAngle=-45)),
+                    y=metric,
+                )
+            )
 
             # Display the chart
-            st.pyplot(fig)
+            st.altair_chart(chart, use_container_width=True)
 
         # Contender Details Tab
         with details_tab:
@@ -194,9 +257,6 @@ if view_type == "Single Tournament":
                 # Win/Loss visualization
                 st.subheader("Win/Loss Distribution")
 
-                # Create pie chart
-                fig, ax = plt.subplots(figsize=(6, 6))
-
                 # Data
                 labels = ["Wins", "Losses", "Draws"]
                 values = [
@@ -205,19 +265,23 @@ if view_type == "Single Tournament":
                     selected_data["stats"]["draws"],
                 ]
                 colors = ["#4CAF50", "#F44336", "#FFC107"]
+                outcomes_df = pd.DataFrame({"Outcome": labels, "Matches": values})
 
-                # Create chart
-                ax.pie(
-                    values,
-                    labels=labels,
-                    colors=colors,
-                    autopct="%1.1f%%",
-                    startangle=90,
+                # Create pie chart
+                chart = (
+                    alt.Chart(outcomes_df)
+                    .mark_arc()
+                    .encode(
+                        theta="Matches",
+                        color=alt.Color(
+                            "Outcome", scale=alt.Scale(domain=labels, range=colors)
+                        ),
+                        tooltip=["Outcome", "Matches"],
+                    )
                 )
-                ax.axis("equal")
 
                 # Display chart
-                st.pyplot(fig)
+                st.altair_chart(chart)
 
     else:
         st.info("Upload a tournament JSON file to view results")
@@ -232,29 +296,19 @@ else:
     )
 
     if uploaded_file:
+        import altair as alt
+        import numpy as np
+        from matplotlib.figure import Figure
+
         # Load data
-        comparison_data = json.load(uploaded_file)
+        file_bytes = uploaded_file.getvalue()
+        comparison_data = load_results(file_bytes)
 
         # Display basic info
         st.subheader(f"Comparison Analysis (Timestamp: {comparison_data['timestamp']})")
 
-        # Create DataFrame of model groups
-        models_data = []
-
-        for model, metrics in comparison_data["groups"].items():
-            models_data.append(
-                {
-                    "Model": model,
-                    "Tournaments": metrics["tournaments"],
-                    "Ranking Stability": metrics["ranking_stability"],
-                    "Win Rate Consistency": metrics["win_rate_consistency"],
-                    "Matchup Consistency": metrics["matchup_consistency"],
-                    "Score Consistency": metrics["score_consistency"],
-                }
-            )
-
         # Display model metrics table
-        models_df = pd.DataFrame(models_data)
+        models_df = build_models_df(file_bytes)
         st.dataframe(models_df.round(4), use_container_width=True)
 
         # Visualizations
@@ -278,17 +332,19 @@ else:
             )
 
             # Create grouped bar chart
-            fig, ax = plt.subplots(figsize=(10, 6))
-            sns.barplot(x="Metric", y="Value", hue="Model", data=plot_data, ax=ax)
-
-            # Format chart
-            plt.ylim(0, 1.05)
-            plt.title("LLM Model Consistency Metrics")
-            plt.xticks(rotation=15)
-            plt.tight_layout()
+            chart = (
+                alt.Chart(plot_data, title="LLM Model Consistency Metrics")
+                .mark_bar()
+                .encode(
+                    x=alt.X("Metric", sort=None, axis=alt.Axis(labelAngle=-15)),
+                    xOffset="Model",
+                    y=alt.Y("Value", scale=alt.Scale(domain=[0, 1.05])),
+                    color="Model",
+                )
+            )
 
             # Display the chart
-            st.pyplot(fig)
+            st.altair_chart(chart, use_container_width=True)
 
         with viz_tab2:
             st.subheader("Radar Chart Comparison")
@@ -301,9 +357,16 @@ else:
                 "Score Consistency",
             ]
 
-            # Set up the figure
-            fig = plt.figure(figsize=(8, 8))
-            ax = fig.add_subplot(111, polar=True)
+            # The figure is kept for the session and redrawn on each rerun.
+            # It is made without pyplot, which would hold on to every figure
+            # created, and is not shared between sessions, which run in
+            # threads of their own
+            if "radar_figure" not in st.session_state:
+                fig = Figure(figsize=(8, 8))
+                ax = fig.add_subplot(111, polar=True)
+                st.session_state["radar_figure"] = (fig, ax)
+            fig, ax = st.session_state["radar_figure"]
+            ax.clear()
 
             # Calculate angles for each metric
             N = len(categories)
@@ -316,23 +379,20 @@ else:
             ax.set_rlabel_position(0)
 
             # Add labels
-            plt.xticks(angles[:-1], categories)
+            ax.set_xticks(angles[:-1], categories)
             ax.set_rlim(0, 1)
 
-            # Plot each model's data
-            for i, model in enumerate(models_df["Model"]):
-                values = (
-                    models_df.loc[models_df["Model"] == model, categories]
-                    .values.flatten()
-                    .tolist()
-                )
+            # Plot each model's data, taking its row from the metric values
+            values_matrix = models_df[categories].to_numpy()
+            for model, row in zip(models_df["Model"].tolist(), values_matrix):
+                values = row.tolist()
                 values += values[:1]  # Close the loop
 
                 ax.plot(angles, values, linewidth=2, label=model)
                 ax.fill(angles, values, alpha=0.1)
 
             # Add legend
-            plt.legend(loc="upper right", bbox_to_anchor=(0.1, 0.1))
+            ax.legend(loc="upper right", bbox_to_anchor=(0.1, 0.1))
 
             # Display the chart
             st.pyplot(fig)
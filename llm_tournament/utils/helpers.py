@@ -5,9 +5,26 @@ Helper functions for the LLM Tournament application.
 import os
 import json
 import re
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Union
 from datetime import datetime
 
+# For faster JSON parsing and serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Patterns used on every call, compiled once
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
+# Decoder for JSON objects embedded in other text
+_JSON_DECODER = json.JSONDecoder()
+
 
 def ensure_directory_exists(path: str) -> None:
     """
@@ -30,7 +47,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace invalid characters with underscores
-    return re.sub(r'[\\/*?:"<>|]', "_", filename)
+    return _INVALID_FILENAME_CHARS_RE.sub("_", filename)
 
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -86,7 +103,7 @@ def json_serializer(obj: Any) -> Union[str, Dict[str, Any]]:
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
-def save_json(data: Any, file_path: str, indent: int = 2) -> None:
+def save_json(data: Any, file_path: str, indent: int = 2, compact: bool = False) -> None:
     """
     Save data to a JSON file.
     
@@ -94,11 +111,27 @@ def save_json(data: Any, file_path: str, indent: int = 2) -> None:
         data: Data to save
         file_path: File path
         indent: JSON indentation level
+        compact: Whether to write the JSON without any whitespace, for files
+            only read by programs (indent is then ignored)
     """
     ensure_directory_exists(os.path.dirname(file_path))
     
+    # orjson can write compact output or an indent of 2
+    if ORJSON_AVAILABLE and (compact or indent == 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=json_serializer, option=option))
+        return
+    
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=indent, default=json_serializer)
+        if compact:
+            # json.dumps uses the C encoder when not indenting; json.dump
+            # always encodes in Python, piece by piece
+            f.write(json.dumps(data, separators=(',', ':'), default=json_serializer))
+        else:
+            json.dump(data, f, indent=indent, default=json_serializer)
 
 
 def load_json(file_path: str) -> Any:
@@ -115,8 +148,8 @@ def load_json(file_path: str) -> Any:
         FileNotFoundError: If file not found
         json.JSONDecodeError: If JSON is invalid
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return _json_loads(f.read())
 
 
 def create_progress_bar(progress: float, width: int = 30, fill_char: str = '#', empty_char: str = '-') -> str:
@@ -133,40 +166,54 @@ def create_progress_bar(progress: float, width: int = 30, fill_char: str = '#',
         Progress bar string
     """
     filled_width = int(width * progress / 100)
-    bar = fill_char * filled_width + empty_char * (width - filled_width)
+    bar = (fill_char * filled_width).ljust(width, empty_char)
     return f"[{bar}] {progress:.1f}%"
 
 
-def extract_json_from_text(text: str) -> Optional[Dict[str, Any]]:
+def extract_json_from_text(text: str, required_keys: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
     """
     Extract JSON from text that may contain markdown, code blocks, etc.
     
     Args:
         text: Text that may contain JSON
+        required_keys: Top-level keys an object found embedded in the text
+            must have, so a nested object is not mistaken for the whole one
+            when the object around it is malformed
         
     Returns:
         Extracted JSON data or None if extraction fails
     """
     # Try to extract JSON from markdown code blocks
-    json_matches = re.findall(r'```(?:json)?\s*([\s\S]*?)```', text)
+    json_matches = _JSON_FENCE_RE.findall(text)
     if json_matches:
         for json_text in json_matches:
             try:
-                return json.loads(json_text.strip())
+                return _json_loads(json_text.strip())
             except:
                 continue
     
-    # Look for parts that might be JSON (between curly braces)
-    json_matches = re.findall(r'{[\s\S]*}', text)
-    if json_matches:
-        for json_text in json_matches:
-            try:
-                return json.loads(json_text.strip())
-            except:
-                continue
+    # Try the outermost braces first, the whole object if prose surrounds it
+    start = text.find("{")
+    end = text.rfind("}") + 1
+    if start != -1 and end > start:
+        try:
+            return _json_loads(text[start:end])
+        except ValueError:
+            pass
+    
+    # Look for a JSON object embedded in the text; raw_decode stops at the
+    # brace closing the object, so text around it does not break parsing
+    while start != -1:
+        try:
+            data = _JSON_DECODER.raw_decode(text, start)[0]
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and all(key in data for key in required_keys):
+            return data
+        start = text.find("{", start + 1)
     
     # Try the whole text
     try:
-        return json.loads(text.strip())
+        return _json_loads(text.strip())
     except:
         return None